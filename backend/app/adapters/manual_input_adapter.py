@@ -9,10 +9,65 @@ from app.domain.battle_state import (
     SideState,
     StatBoosts,
 )
+from app.inference.models import MetaPriorSnapshot
+from app.inference.set_inference import meta_query_for_format
+from app.providers.data_registry import get_registry
+from app.providers.meta_provider import MetaProvider
+from app.providers.move_provider import get_moves_index
+from app.providers.pokemon_provider import get_pokemon_index
 from app.schemas.battle_state import BattleStateRequest
+from app.services.fuzzy_names import FuzzyNameResolver
+from app.services.name_normalize import normalize_key
 
 
-def _to_domain_pokemon(pokemon) -> PokemonState:
+def _meta_name_index(names) -> dict[str, str]:
+    return {normalize_key(name): name for name in names}
+
+
+def _get_species_resolver(snapshot: MetaPriorSnapshot) -> FuzzyNameResolver:
+    """
+    Canonical species plus the snapshot's species keys; meta spellings win since inference keys on them.
+
+    Only the key list is read, so lazy snapshots decode no priors. Snapshots without
+    priors share the canonical-only resolver, so unknown formats are never retained.
+    """
+    registry = get_registry()
+    if not snapshot.species_priors:
+        return registry.derived("input_species_resolver", lambda: FuzzyNameResolver(get_pokemon_index()))
+
+    key = (
+        "input_species_resolver",
+        snapshot.format_id,
+        snapshot.generation,
+        snapshot.rating_bucket,
+        tuple(snapshot.month_window),
+    )
+    return registry.derived(
+        key,
+        lambda: FuzzyNameResolver({**get_pokemon_index(), **_meta_name_index(snapshot.species_priors)}),
+    )
+
+
+def _get_move_resolver() -> FuzzyNameResolver:
+    return get_registry().derived("input_move_resolver", lambda: FuzzyNameResolver(get_moves_index()))
+
+
+def _correct_name(name: str | None, resolver: FuzzyNameResolver) -> str | None:
+    """
+    Keep names that already match a known name; replace misspellings with the closest one.
+
+    Exactly matching input is passed through untouched so downstream lookups see
+    the same spelling as before; only names that would otherwise miss are corrected.
+    """
+    if not name:
+        return name
+    matches = resolver.matches(name, limit=1)
+    if not matches or matches[0][1] == 0:
+        return name
+    return matches[0][0]
+
+
+def _to_domain_pokemon(pokemon, species_resolver: FuzzyNameResolver) -> PokemonState:
     status = getattr(pokemon, "status", None)
     burned = bool(getattr(pokemon, "burned", False) or status == "brn")
 
@@ -23,7 +78,7 @@ def _to_domain_pokemon(pokemon) -> PokemonState:
     )
 
     return PokemonState(
-        species=getattr(pokemon, "species", None),
+        species=_correct_name(getattr(pokemon, "species", None), species_resolver),
         types=list(pokemon.types),
         atk=float(getattr(pokemon, "atk", 100) or 100),
         def_=float(getattr(pokemon, "def_", 100) or 100),
@@ -43,14 +98,17 @@ def _to_domain_pokemon(pokemon) -> PokemonState:
             spd=getattr(getattr(pokemon, "boosts", None), "spd", 0),
             spe=getattr(getattr(pokemon, "boosts", None), "spe", 0),
         ),
-        revealed_moves=list(getattr(pokemon, "revealedMoves", []) or []),
+        revealed_moves=[
+            _correct_name(move_name, _get_move_resolver())
+            for move_name in getattr(pokemon, "revealedMoves", []) or []
+        ],
     )
 
 
-def _to_domain_side(side) -> SideState:
+def _to_domain_side(side, species_resolver: FuzzyNameResolver) -> SideState:
     return SideState(
-        active=_to_domain_pokemon(side.active),
-        bench=[_to_domain_pokemon(pokemon) for pokemon in side.bench],
+        active=_to_domain_pokemon(side.active, species_resolver),
+        bench=[_to_domain_pokemon(pokemon, species_resolver) for pokemon in side.bench],
         side_conditions=SideConditions(
             stealth_rock=side.side_conditions.stealth_rock,
             spikes_layers=side.side_conditions.spikes_layers,
@@ -61,17 +119,22 @@ def _to_domain_side(side) -> SideState:
 
 
 def to_domain_battle_state(payload: BattleStateRequest) -> BattleState:
+    format_context = FormatContext(
+        generation=payload.format_context.generation,
+        format_name=payload.format_context.formatName or "manual",
+        ruleset=list(payload.format_context.ruleset),
+        rating_bucket=payload.format_context.ratingBucket,
+        month_window=payload.format_context.monthWindow,
+    )
+    species_resolver = _get_species_resolver(MetaProvider().get_snapshot(meta_query_for_format(format_context)))
+
     return BattleState(
-        my_side=_to_domain_side(payload.my_side),
-        opponent_side=_to_domain_side(payload.opponent_side),
+        my_side=_to_domain_side(payload.my_side, species_resolver),
+        opponent_side=_to_domain_side(payload.opponent_side, species_resolver),
         moves=list(payload.moves),
         field=FieldState(
             weather=payload.field.weather,
             terrain=payload.field.terrain,
         ),
-        format_context=FormatContext(
-            generation=payload.format_context.generation,
-            format_name=payload.format_context.formatName or "manual",
-            ruleset=list(payload.format_context.ruleset),
-        ),
+        format_context=format_context,
     )
\ No newline at end of file
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Literal, Optional, Union
 
 
@@ -27,6 +28,36 @@ class SwitchAction:
 Action = Union[MoveAction, SwitchAction]
 
 
+@dataclass(frozen=True, slots=True)
+class MoveSpec:
+    """
+    Immutable move description in the attribute shape the damage, field and speed
+    engines read (name/type/category/power/priority/crit/level).
+    """
+
+    name: str
+    type: str
+    category: str
+    power: int
+    priority: int = 0
+    crit: bool = False
+    level: Optional[int] = None
+
+
+@lru_cache(maxsize=4096)
+def move_spec_for(move_action: MoveAction, level: Optional[int] = None) -> MoveSpec:
+    """Interned MoveSpec per (move, level); repeated projections share one instance."""
+    return MoveSpec(
+        name=move_action.move_name,
+        type=move_action.move_type,
+        category=move_action.move_category,
+        power=move_action.base_power,
+        priority=move_action.priority,
+        crit=False,
+        level=level,
+    )
+
+
 @dataclass
 class ScoreBreakdown:
     tactical: float = 0.0
@@ -58,6 +58,8 @@ class FormatContext:
     generation: int = 9
     format_name: str = "manual"
     ruleset: List[str] = dc_field(default_factory=list)
+    rating_bucket: Optional[str] = None
+    month_window: Optional[int] = None
 
 
 @dataclass
@@ -1,101 +1,122 @@
 from __future__ import annotations
 
+from app.domain.symbols import ITEMS, MOVES, SymbolTable, item_symbol, move_symbol
+
 
 def normalized_name(value: str | None) -> str:
     return (value or "").strip().lower()
 
 
-CHOICE_ITEMS = {
-    "choice scarf",
-    "choice band",
-    "choice specs",
-}
-
-SETUP_MOVES = {
-    "swords dance",
-    "nasty plot",
-    "calm mind",
-    "dragon dance",
-    "bulk up",
-    "agility",
-    "trailblaze",
-    "iron defense",
-    "curse",
-    "quiver dance",
-}
-
-RECOVERY_MOVES = {
-    "recover",
-    "roost",
-    "slack off",
-    "soft-boiled",
-    "moonlight",
-    "morning sun",
-    "synthesis",
-    "wish",
-    "pain split",
-}
-
-PIVOT_MOVES = {
-    "u-turn",
-    "volt switch",
-    "flip turn",
-    "parting shot",
-    "chilly reception",
-    "teleport",
-}
-
-HAZARD_MOVES = {
-    "stealth rock",
-    "spikes",
-    "toxic spikes",
-    "sticky web",
-}
-
-DISRUPTION_MOVES = {
-    "trick",
-    "encore",
-    "taunt",
-    "thunder wave",
-    "will-o-wisp",
-    "toxic",
-    "knock off",
-}
-
-HIGH_SIGNAL_PRIORITY_MOVES = {
-    "sucker punch",
-    "extreme speed",
-    "ice shard",
-    "mach punch",
-    "bullet punch",
-    "shadow sneak",
-    "vacuum wave",
-}
+def _ids(table: SymbolTable, *names: str) -> frozenset[int]:
+    return frozenset(table.intern_all(names))
+
+
+CHOICE_ITEMS = _ids(
+    ITEMS,
+    "Choice Scarf",
+    "Choice Band",
+    "Choice Specs",
+)
+
+SETUP_MOVES = _ids(
+    MOVES,
+    "Swords Dance",
+    "Nasty Plot",
+    "Calm Mind",
+    "Dragon Dance",
+    "Bulk Up",
+    "Agility",
+    "Trailblaze",
+    "Iron Defense",
+    "Curse",
+    "Quiver Dance",
+)
+
+RECOVERY_MOVES = _ids(
+    MOVES,
+    "Recover",
+    "Roost",
+    "Slack Off",
+    "Soft-Boiled",
+    "Moonlight",
+    "Morning Sun",
+    "Synthesis",
+    "Wish",
+    "Pain Split",
+)
+
+PIVOT_MOVES = _ids(
+    MOVES,
+    "U-turn",
+    "Volt Switch",
+    "Flip Turn",
+    "Parting Shot",
+    "Chilly Reception",
+    "Teleport",
+)
+
+HAZARD_MOVES = _ids(
+    MOVES,
+    "Stealth Rock",
+    "Spikes",
+    "Toxic Spikes",
+    "Sticky Web",
+)
+
+DISRUPTION_MOVES = _ids(
+    MOVES,
+    "Trick",
+    "Encore",
+    "Taunt",
+    "Thunder Wave",
+    "Will-O-Wisp",
+    "Toxic",
+    "Knock Off",
+)
+
+HIGH_SIGNAL_PRIORITY_MOVES = _ids(
+    MOVES,
+    "Sucker Punch",
+    "Extreme Speed",
+    "Ice Shard",
+    "Mach Punch",
+    "Bullet Punch",
+    "Shadow Sneak",
+    "Vacuum Wave",
+)
+
+TRICK = MOVES.intern("Trick")
+TERA_BLAST = MOVES.intern("Tera Blast")
+CHOICE_SCARF = ITEMS.intern("Choice Scarf")
+CHOICE_BAND = ITEMS.intern("Choice Band")
+CHOICE_SPECS = ITEMS.intern("Choice Specs")
+LEFTOVERS = ITEMS.intern("Leftovers")
+HEAVY_DUTY_BOOTS = ITEMS.intern("Heavy-Duty Boots")
 
 
 def is_choice_item(item_name: str | None) -> bool:
-    return normalized_name(item_name) in CHOICE_ITEMS
+    return item_symbol(item_name) in CHOICE_ITEMS
 
 
 def is_setup_move(move_name: str | None) -> bool:
-    return normalized_name(move_name) in SETUP_MOVES
+    return move_symbol(move_name) in SETUP_MOVES
 
 
 def is_recovery_move(move_name: str | None) -> bool:
-    return normalized_name(move_name) in RECOVERY_MOVES
+    return move_symbol(move_name) in RECOVERY_MOVES
 
 
 def is_pivot_move(move_name: str | None) -> bool:
-    return normalized_name(move_name) in PIVOT_MOVES
+    return move_symbol(move_name) in PIVOT_MOVES
 
 
 def is_hazard_move(move_name: str | None) -> bool:
-    return normalized_name(move_name) in HAZARD_MOVES
+    return move_symbol(move_name) in HAZARD_MOVES
 
 
 def is_disruption_move(move_name: str | None) -> bool:
-    return normalized_name(move_name) in DISRUPTION_MOVES
+    return move_symbol(move_name) in DISRUPTION_MOVES
 
 
 def is_priority_signal_move(move_name: str | None) -> bool:
-    return normalized_name(move_name) in HIGH_SIGNAL_PRIORITY_MOVES
\ No newline at end of file
+    return move_symbol(move_name) in HIGH_SIGNAL_PRIORITY_MOVES
\ No newline at end of file
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable
+
+from app.services.name_normalize import normalize_key
+
+
+_normalized_key = lru_cache(maxsize=8192)(normalize_key)
+
+
+class SymbolTable:
+    """
+    Dense integer IDs for one kind of name (species, move, item, ability, type).
+
+    Names are keyed by normalize_key, so spelling variants such as "U-turn",
+    "u turn" and "U_Turn" share one ID. IDs are assigned in intern order and are
+    stable for the life of the process; the first spelling interned is kept as the
+    display name. Display names are memoized as raw spellings, so lookups of the
+    usual spelling are a single dict hit; other variants go through the bounded
+    normalize cache and never grow the table.
+
+    The tables are process-wide, not per data version, and append-only: a data
+    reload never renumbers or removes a name. Requests pinned to an older version
+    therefore resolve the same IDs as the new one, and names first seen in a new
+    version get fresh IDs when its name indexes are built. Only interned code
+    constants and canonical data names are ever added.
+    """
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._raw_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.lookup(name) is not None
+
+    def intern(self, name: str | None) -> int | None:
+        """ID for `name`, assigning the next dense ID if it is new. Blank names have no ID."""
+        if not name:
+            return None
+        symbol = self._raw_ids.get(name)
+        if symbol is not None:
+            return symbol
+
+        key = _normalized_key(name)
+        if not key:
+            return None
+
+        symbol = self._ids.get(key)
+        if symbol is None:
+            symbol = len(self._names)
+            self._ids[key] = symbol
+            self._names.append(name)
+            self._raw_ids[name] = symbol
+        return symbol
+
+    def intern_all(self, names: Iterable[str]) -> list[int | None]:
+        return [self.intern(name) for name in names]
+
+    def lookup(self, name: str | None) -> int | None:
+        """ID for an already interned name, without growing the table."""
+        if not name:
+            return None
+        symbol = self._raw_ids.get(name)
+        if symbol is not None:
+            return symbol
+
+        return self._ids.get(_normalized_key(name))
+
+    def key(self, name: str | None) -> str:
+        """Normalized key of `name`; empty for blank names."""
+        return _normalized_key(name) if name else ""
+
+    def same(self, left: str | None, right: str | None) -> bool:
+        """Whether two names share a non-blank key, without interning either."""
+        left_id, right_id = self.lookup(left), self.lookup(right)
+        if left_id is not None and right_id is not None:
+            return left_id == right_id
+        key = self.key(left)
+        return bool(key) and key == self.key(right)
+
+    def name_of(self, symbol: int) -> str:
+        return self._names[symbol]
+
+
+SPECIES = SymbolTable("species")
+MOVES = SymbolTable("move")
+ITEMS = SymbolTable("item")
+ABILITIES = SymbolTable("ability")
+TYPES = SymbolTable("type")
+
+
+def move_symbol(name: str | None) -> int | None:
+    return MOVES.lookup(name)
+
+
+def item_symbol(name: str | None) -> int | None:
+    return ITEMS.lookup(name)
+
+
+def ability_symbol(name: str | None) -> int | None:
+    return ABILITIES.lookup(name)
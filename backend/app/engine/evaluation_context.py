@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Hashable
+
+from app.domain.actions import MoveAction, MoveSpec, move_spec_for
+from app.domain.battle_state import FieldState, PokemonState
+from app.engine.damage_engine import estimate_damage
+from app.engine.field_engine import apply_field_modifiers
+from app.engine.speed_tier_index import SpeedTierIndex
+from app.inference.models import OpponentWorld
+
+
+StatSignature = tuple
+DamageKey = tuple[StatSignature, StatSignature, MoveSpec, tuple[str | None, str | None]]
+
+
+def stat_signature(pokemon: PokemonState) -> StatSignature:
+    """
+    Hashable view of everything that can change a damage result for a combatant.
+
+    HP bookkeeping (current_hp, status text, revealed moves) is deliberately left out
+    so projected branches that only differ in remaining HP share table entries.
+    """
+    boosts = pokemon.boosts
+    return (
+        tuple(pokemon.types),
+        pokemon.atk,
+        pokemon.def_,
+        pokemon.spa,
+        pokemon.spd,
+        pokemon.spe,
+        pokemon.hp,
+        pokemon.level,
+        pokemon.burned,
+        pokemon.tera_active,
+        (boosts.atk, boosts.def_, boosts.spa, boosts.spd, boosts.spe),
+    )
+
+
+def field_signature(field_state: FieldState) -> tuple[str | None, str | None]:
+    return (field_state.weather, field_state.terrain)
+
+
+def _max_hp_value(pokemon: PokemonState) -> float:
+    return max(1.0, float(pokemon.hp or 100))
+
+
+def compute_move_damage(
+    attacker: PokemonState,
+    defender: PokemonState,
+    move_action: MoveAction,
+    field_state: FieldState,
+) -> tuple[dict, list[str]]:
+    move_spec = move_spec_for(move_action, attacker.level)
+
+    dmg = estimate_damage(attacker=attacker, defender=defender, move=move_spec)
+    return apply_field_modifiers(
+        dmg=dmg,
+        move=move_spec,
+        field=field_state,
+        defender_hp=_max_hp_value(defender),
+    )
+
+
+class DamageTable:
+    """
+    Per-evaluation (attacker, defender, move, field) damage table.
+
+    Entries are keyed on stat signatures rather than object identity, so a changed
+    stat, boost or field simply misses and is computed fresh. Returned damage dicts
+    are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[DamageKey, tuple[dict, tuple[str, ...]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(
+        self,
+        attacker: PokemonState,
+        defender: PokemonState,
+        move_action: MoveAction,
+        field_state: FieldState,
+    ) -> tuple[dict, list[str]]:
+        key = (
+            stat_signature(attacker),
+            stat_signature(defender),
+            move_spec_for(move_action, attacker.level),
+            field_signature(field_state),
+        )
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            dmg, field_notes = compute_move_damage(attacker, defender, move_action, field_state)
+            entry = (dmg, tuple(field_notes))
+            self._entries[key] = entry
+        else:
+            self.hits += 1
+
+        dmg, field_notes = entry
+        return dmg, list(field_notes)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class PreparedCombatantCache:
+    """
+    Per-evaluation cache of hook-adjusted combatants (Intimidate, choice items, Scarf).
+
+    The combatant is keyed by identity and held by the entry, so its id cannot be
+    recycled while cached; the world is keyed by the assumptions the hooks read.
+    Hook notes are stored with the prepared combatant and replayed into the caller's
+    notes on every use.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple, tuple[PokemonState, PokemonState, tuple[str, ...]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def resolve(
+        self,
+        role: Hashable,
+        pokemon: PokemonState,
+        world_key: Hashable,
+        prepare: Callable[[list[str]], PokemonState],
+        notes: list[str],
+    ) -> PokemonState:
+        key = (role, id(pokemon), world_key)
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] is not pokemon:
+            self.misses += 1
+            hook_notes: list[str] = []
+            prepared = prepare(hook_notes)
+            entry = (pokemon, prepared, tuple(hook_notes))
+            self._entries[key] = entry
+        else:
+            self.hits += 1
+
+        notes.extend(entry[2])
+        return entry[1]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+@dataclass
+class EvaluationContext:
+    """
+    Request-scoped caches shared by projection, lookahead and evaluation.
+
+    One context is created per evaluate_battle_state call and threaded through the
+    engines as an optional keyword, so engine functions stay usable without it.
+    """
+
+    damage_table: DamageTable = field(default_factory=DamageTable)
+    prepared_combatants: PreparedCombatantCache = field(default_factory=PreparedCombatantCache)
+    speed_tiers: SpeedTierIndex | None = None
+    # Inferred opponent worlds keyed by species (active and revealed bench), used
+    # once an opposing switch puts a bench Pokémon into the active slot.
+    team_worlds: dict[str, list[OpponentWorld]] = field(default_factory=dict)
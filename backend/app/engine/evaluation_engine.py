@@ -5,9 +5,16 @@ from typing import Dict, List, Tuple
 
 from app.domain.actions import EvaluatedAction, MoveAction, ScoreBreakdown, SwitchAction
 from app.domain.battle_state import BattleState
+from app.engine.evaluation_context import EvaluationContext
 from app.engine.lookahead_engine import estimate_lookahead_bonus
-from app.engine.projection_engine import project_action_against_response
+from app.engine.projection_engine import (
+    estimate_outspeed_against_candidates,
+    estimate_outspeed_in_context,
+    precompute_damage_table,
+    project_action_against_response,
+)
 from app.engine.response_engine import generate_opponent_responses
+from app.engine.speed_tier_index import get_speed_tier_index
 from app.engine.switch_engine import score_switch
 from app.explain.explanation_engine import (
     build_assumptions,
@@ -22,7 +29,7 @@ from app.inference.models import (
     InferenceResult,
     OpponentWorld,
 )
-from app.inference.set_inference import infer_opposing_active_set
+from app.inference.set_inference import infer_opposing_active_set, infer_opposing_team, meta_query_for_format
 from app.providers.meta_provider import MetaProvider
 
 
@@ -104,6 +111,7 @@ def score_projection_summary(
     my_action,
     state: BattleState,
     continuation_bonus: float = 0.0,
+    context: EvaluationContext | None = None,
 ) -> Tuple[ScoreBreakdown, List[str]]:
     notes = list(projection.notes)
 
@@ -180,6 +188,7 @@ def score_projection_summary(
                 switch_target=switch_target,
                 opposing_active=state.opponent_side.active,
                 entry_side_conditions=state.my_side.side_conditions,
+                outspeed=estimate_outspeed_in_context(switch_target, state.opponent_side.active, context),
             )
             positional += base_switch_score
             notes.extend(switch_notes)
@@ -227,8 +236,9 @@ def evaluate_action_in_world(
     all_worlds: List[OpponentWorld],
     response_limit: int = 2,
     continuation_discount: float = 0.35,
+    context: EvaluationContext | None = None,
 ) -> ActionWorldEvaluation:
-    responses = generate_opponent_responses(state=state, world=world, my_action=my_action)
+    responses = generate_opponent_responses(state=state, world=world, my_action=my_action, context=context)
 
     response_scores: list[tuple[float, float, dict]] = []
     notes: list[str] = list(world.notes)
@@ -243,6 +253,7 @@ def evaluate_action_in_world(
         all_worlds=all_worlds,
         response_limit=response_limit,
         continuation_discount=continuation_discount,
+        context=context,
     )
     notes.extend(lookahead_notes[:3])
 
@@ -252,12 +263,14 @@ def evaluate_action_in_world(
             my_action=my_action,
             response=response,
             world=world,
+            context=context,
         )
         score_breakdown, projection_notes = score_projection_summary(
             projection=projection,
             my_action=my_action,
             state=state,
             continuation_bonus=lookahead_bonus,
+            context=context,
         )
         response_total = score_breakdown.total
 
@@ -323,17 +336,12 @@ def aggregate_world_evaluations(
     )
 
 
-def build_move_evaluated_action(
-    move,
-    aggregated: AggregatedActionValue,
-    top_world_label: str | None = None,
-    top_world_weight: float | None = None,
-) -> EvaluatedAction:
+def move_action_from_state_move(move) -> MoveAction:
     category = str(getattr(move, "category", "Physical") or "Physical").lower()
     if category not in {"physical", "special", "status"}:
         category = "physical"
 
-    action = MoveAction(
+    return MoveAction(
         move_name=(move.name or "Unknown move").strip(),
         move_type=move.type,
         move_category=category,
@@ -341,6 +349,15 @@ def build_move_evaluated_action(
         priority=int(getattr(move, "priority", 0) or 0),
     )
 
+
+def build_move_evaluated_action(
+    move,
+    aggregated: AggregatedActionValue,
+    top_world_label: str | None = None,
+    top_world_weight: float | None = None,
+) -> EvaluatedAction:
+    action = move_action_from_state_move(move)
+
     notes = list(aggregated.notes)
 
     return EvaluatedAction(
@@ -370,27 +387,19 @@ def build_move_evaluated_action(
 def evaluate_move_actions(
     state: BattleState,
     worlds: List[OpponentWorld],
+    context: EvaluationContext | None = None,
 ) -> List[EvaluatedAction]:
     results: List[EvaluatedAction] = []
 
     for move in state.moves:
-        category = str(getattr(move, "category", "Physical") or "Physical").lower()
-        if category not in {"physical", "special", "status"}:
-            category = "physical"
-
-        my_action = MoveAction(
-            move_name=(move.name or "Unknown move").strip(),
-            move_type=move.type,
-            move_category=category,
-            base_power=move.power or 0,
-            priority=int(getattr(move, "priority", 0) or 0),
-        )
+        my_action = move_action_from_state_move(move)
         world_evaluations = [
             evaluate_action_in_world(
                 state=state,
                 my_action=my_action,
                 world=world,
                 all_worlds=worlds,
+                context=context,
             )
             for world in worlds
         ]
@@ -412,6 +421,7 @@ def evaluate_move_actions(
 def evaluate_switch_actions(
     state: BattleState,
     worlds: List[OpponentWorld],
+    context: EvaluationContext | None = None,
 ) -> List[EvaluatedAction]:
     results: List[EvaluatedAction] = []
 
@@ -425,6 +435,7 @@ def evaluate_switch_actions(
                 my_action=action,
                 world=world,
                 all_worlds=worlds,
+                context=context,
             )
             for world in worlds
         ]
@@ -480,21 +491,58 @@ def evaluate_battle_state(
     raw_scores: Dict[str, float] = {}
 
     meta_provider = MetaProvider()
+    meta_query = meta_query_for_format(state.format_context)
     candidate_builder = CandidateBuilder()
 
-    inference_result = infer_opposing_active_set(
+    team_inference = infer_opposing_team(
         state,
         meta_provider=meta_provider,
         candidate_builder=candidate_builder,
     )
+    inference_result = team_inference.get(state.opponent_side.active.species or "")
+    if inference_result is None:
+        inference_result = infer_opposing_active_set(
+            state,
+            meta_provider=meta_provider,
+            candidate_builder=candidate_builder,
+        )
     assumptions_used = build_assumptions(state, inference=inference_result)
 
     worlds = build_opponent_worlds(state=state, inference_result=inference_result)
     if not worlds:
         assumptions_used.append("No opponent worlds were built; evaluator is falling back to empty aggregation.")
 
-    evaluated_actions.extend(evaluate_move_actions(state=state, worlds=worlds))
-    evaluated_actions.extend(evaluate_switch_actions(state=state, worlds=worlds))
+    context = EvaluationContext(
+        speed_tiers=get_speed_tier_index(meta_provider.get_snapshot(meta_query)),
+        team_worlds={
+            species: (
+                worlds
+                if result is inference_result
+                else build_opponent_worlds(state=state, inference_result=result)
+            )
+            for species, result in team_inference.items()
+        },
+    )
+    outspeed = estimate_outspeed_against_candidates(
+        my_active=state.my_side.active,
+        opponent_active=state.opponent_side.active,
+        speed_tiers=context.speed_tiers,
+    )
+    if outspeed is not None:
+        assumptions_used.append(
+            f"Speed tiers: {state.my_side.active.species} outspeeds {outspeed.faster:.0%} of "
+            f"{state.opponent_side.active.species} meta spreads (ties {outspeed.tie:.0%})."
+        )
+
+    precompute_damage_table(
+        state=state,
+        worlds=worlds,
+        my_actions=[move_action_from_state_move(move) for move in state.moves],
+        context=context,
+    )
+
+    evaluated_actions.extend(evaluate_move_actions(state=state, worlds=worlds, context=context))
+    evaluated_actions.extend(evaluate_switch_actions(state=state, worlds=worlds, context=context))
 
     if not evaluated_actions:
         return (
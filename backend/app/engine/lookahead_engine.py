@@ -8,17 +8,15 @@ from app.domain.move_tags import (
 )
 from app.domain.actions import MoveAction, SwitchAction
 from app.domain.battle_state import BattleState
-from app.engine.projection_engine import project_action_against_response
+from app.engine.evaluation_context import EvaluationContext
+from app.engine.projection_engine import estimate_outspeed_in_context, project_action_against_response
 from app.engine.response_engine import generate_opponent_responses
 from app.engine.switch_engine import score_switch
 from app.engine.type_engine import combined_multiplier
-from app.inference.belief_updater import (
-    apply_branch_evidence,
-    inference_to_worlds,
-    worlds_to_inference,
-)
+from app.inference.belief_state import BeliefState, BranchEvidence
+from app.inference.belief_updater import inference_to_worlds, worlds_to_inference
 from app.inference.models import OpponentResponse, OpponentWorld, ProjectionSummary
-from app.providers.move_provider import build_move_action_from_name
+from app.providers.move_provider import get_move_action_table
 
 
 def _top_responses(
@@ -238,43 +236,58 @@ def _extract_ability_evidence_from_projection(
     return None
 
 
-def reweight_world_distribution_from_branch_evidence(
-    worlds: list[OpponentWorld],
-    projection: ProjectionSummary,
-    source_world: OpponentWorld,
-) -> Tuple[list[OpponentWorld], List[str]]:
-    notes: List[str] = []
+def _branch_evidence(projection: ProjectionSummary, source_world: OpponentWorld) -> BranchEvidence:
+    return BranchEvidence(
+        revealed_move=projection.revealed_response_move,
+        item=_extract_item_evidence_from_projection(projection, source_world),
+        ability=_extract_ability_evidence_from_projection(projection, source_world),
+    )
 
-    inference = worlds_to_inference(worlds)
 
-    revealed_move = projection.revealed_response_move
-    item_evidence = _extract_item_evidence_from_projection(projection, source_world)
-    ability_evidence = _extract_ability_evidence_from_projection(projection, source_world)
+def reweight_world_distributions_for_branches(
+    worlds: list[OpponentWorld],
+    projections: list[ProjectionSummary],
+    source_world: OpponentWorld,
+) -> list[Tuple[list[OpponentWorld], List[str]]]:
+    """
+    Updated world distribution and notes for every branch of one position.
 
-    updated_inference = apply_branch_evidence(
-        inference,
-        revealed_move=revealed_move,
-        item_evidence=item_evidence,
-        ability_evidence=ability_evidence,
-    )
+    All branches reweight the same baseline belief, so their evidence is
+    applied together as one branches x candidates weight matrix.
+    """
+    evidence = [_branch_evidence(projection, source_world) for projection in projections]
+    beliefs = BeliefState.from_worlds(worlds).branches(evidence)
+
+    results: list[Tuple[list[OpponentWorld], List[str]]] = []
+    for branch, belief in zip(evidence, beliefs):
+        notes: List[str] = []
+        updated_worlds = inference_to_worlds(belief.to_inference(), worlds)
+
+        if branch.revealed_move:
+            notes.append(f"Cross-world branch reweighting applied revealed move evidence: {branch.revealed_move}.")
+        if branch.item:
+            notes.append(f"Cross-world branch reweighting applied item evidence: {branch.item}.")
+        if branch.ability:
+            notes.append(f"Cross-world branch reweighting applied ability evidence: {branch.ability}.")
+
+        if updated_worlds:
+            ranked = sorted(updated_worlds, key=lambda world: world.weight, reverse=True)
+            top_world = ranked[0]
+            notes.append(
+                f"Updated branch distribution now favors '{top_world.candidate.label}' at weight {top_world.weight:.2f}."
+            )
 
-    updated_worlds = inference_to_worlds(updated_inference, worlds)
+        results.append((updated_worlds, notes + belief.notes[-3:]))
 
-    if revealed_move:
-        notes.append(f"Cross-world branch reweighting applied revealed move evidence: {revealed_move}.")
-    if item_evidence:
-        notes.append(f"Cross-world branch reweighting applied item evidence: {item_evidence}.")
-    if ability_evidence:
-        notes.append(f"Cross-world branch reweighting applied ability evidence: {ability_evidence}.")
+    return results
 
-    if updated_worlds:
-        ranked = sorted(updated_worlds, key=lambda world: world.weight, reverse=True)
-        top_world = ranked[0]
-        notes.append(
-            f"Updated branch distribution now favors '{top_world.candidate.label}' at weight {top_world.weight:.2f}."
-        )
 
-    return updated_worlds, notes + updated_inference.notes[-3:]
+def reweight_world_distribution_from_branch_evidence(
+    worlds: list[OpponentWorld],
+    projection: ProjectionSummary,
+    source_world: OpponentWorld,
+) -> Tuple[list[OpponentWorld], List[str]]:
+    return reweight_world_distributions_for_branches(worlds, [projection], source_world)[0]
 
 
 def _estimate_distribution_threat_adjustment(
@@ -287,6 +300,7 @@ def _estimate_distribution_threat_adjustment(
         return 0.0, ["No updated worlds available for continuation threat adjustment."]
 
     my_active = followup_state.my_side.active
+    move_actions = get_move_action_table()
     total_pressure = 0.0
 
     for world in updated_worlds:
@@ -302,7 +316,7 @@ def _estimate_distribution_threat_adjustment(
         worst_label = None
 
         for move_name in candidate_move_names[:4]:
-            move_action = build_move_action_from_name(move_name)
+            move_action = move_actions.get(move_name)
             if move_action is None:
                 continue
 
@@ -347,6 +361,8 @@ def _estimate_distribution_threat_adjustment(
 
 def _candidate_next_actions(
     followup_state: BattleState,
+    *,
+    context: EvaluationContext | None = None,
 ) -> List[tuple[object, float, str]]:
     """
     Return candidate next actions with cheap heuristic pre-scores.
@@ -379,6 +395,7 @@ def _candidate_next_actions(
             switch_target=switch_target,
             opposing_active=followup_state.opponent_side.active,
             entry_side_conditions=followup_state.my_side.side_conditions,
+            outspeed=estimate_outspeed_in_context(switch_target, followup_state.opponent_side.active, context),
         )
 
         # If a strong setup continuation exists, do not let switches dominate too easily.
@@ -429,6 +446,8 @@ def _evaluate_second_ply_against_updated_worlds(
     my_next_action,
     updated_worlds: list[OpponentWorld],
     response_limit: int = 2,
+    *,
+    context: EvaluationContext | None = None,
 ) -> Tuple[float, List[str]]:
     notes: List[str] = []
 
@@ -442,6 +461,7 @@ def _evaluate_second_ply_against_updated_worlds(
             state=followup_state,
             world=world,
             my_action=my_next_action,
+            context=context,
         )
         selected = _top_responses(responses, limit=response_limit)
 
@@ -457,6 +477,7 @@ def _evaluate_second_ply_against_updated_worlds(
                 my_action=my_next_action,
                 response=response,
                 world=world,
+                context=context,
             )
             branch_score = _score_second_ply_projection(projection, my_next_action)
             normalized_weight = response.weight / total_selected_weight
@@ -473,6 +494,8 @@ def _evaluate_second_ply_against_updated_worlds(
 def estimate_best_next_action_value(
     followup_state: BattleState,
     updated_worlds: list[OpponentWorld] | None = None,
+    *,
+    context: EvaluationContext | None = None,
 ) -> Tuple[float, List[str]]:
     notes: List[str] = []
 
@@ -495,7 +518,7 @@ def estimate_best_next_action_value(
         notes.append("Strong continuation value: opponent active is already projected to faint.")
         return 20.0, notes
 
-    candidates = _candidate_next_actions(followup_state)
+    candidates = _candidate_next_actions(followup_state, context=context)
     if not candidates:
         return 0.0, ["No next-turn actions were available in followup state."]
 
@@ -510,6 +533,7 @@ def estimate_best_next_action_value(
             my_next_action=best_action,
             updated_worlds=updated_worlds,
             response_limit=2,
+            context=context,
         )
         total_value += second_ply_value
         notes.extend(second_ply_notes)
@@ -527,6 +551,30 @@ def estimate_best_next_action_value(
     return total_value, notes
 
 
+def _followup_worlds(
+    state: BattleState,
+    followup_state: BattleState,
+    updated_worlds: list[OpponentWorld],
+    context: EvaluationContext | None,
+) -> Tuple[list[OpponentWorld], List[str]]:
+    """
+    Worlds describing the opposing active of a follow-up state.
+
+    Branch reweighting only updates the Pokémon that was active this turn; after an
+    opposing switch (voluntary or forced) the continuation is played against the
+    incoming Pokémon's own inferred sets instead.
+    """
+    species = followup_state.opponent_side.active.species
+    if context is None or not species or species == state.opponent_side.active.species:
+        return updated_worlds, []
+
+    team_worlds = context.team_worlds.get(species)
+    if not team_worlds:
+        return updated_worlds, []
+
+    return team_worlds, [f"Continuation uses {species}'s own inferred sets after the opposing switch."]
+
+
 def estimate_lookahead_bonus(
     state: BattleState,
     my_action,
@@ -535,10 +583,11 @@ def estimate_lookahead_bonus(
     all_worlds: list[OpponentWorld] | None = None,
     response_limit: int = 2,
     continuation_discount: float = 0.35,
+    context: EvaluationContext | None = None,
 ) -> Tuple[float, List[str]]:
     notes: List[str] = []
 
-    responses = generate_opponent_responses(state=state, world=world, my_action=my_action)
+    responses = generate_opponent_responses(state=state, world=world, my_action=my_action, context=context)
     selected = _top_responses(responses, limit=response_limit)
 
     if not selected:
@@ -550,24 +599,27 @@ def estimate_lookahead_bonus(
     total_selected_weight = sum(response.weight for response in selected) or 1.0
     weighted_bonus = 0.0
 
-    for response in selected:
-        projection = project_action_against_response(
+    projections = [
+        project_action_against_response(
             state=state,
             my_action=my_action,
             response=response,
             world=world,
+            context=context,
         )
-        followup_state = build_followup_state_from_projection(state=state, projection=projection)
+        for response in selected
+    ]
+    branch_updates = reweight_world_distributions_for_branches(baseline_worlds, projections, world)
 
-        updated_worlds, update_notes = reweight_world_distribution_from_branch_evidence(
-            worlds=baseline_worlds,
-            projection=projection,
-            source_world=world,
-        )
+    for response, projection, (updated_worlds, update_notes) in zip(selected, projections, branch_updates):
+        followup_state = build_followup_state_from_projection(state=state, projection=projection)
+        updated_worlds, switch_notes = _followup_worlds(state, followup_state, updated_worlds, context)
+        update_notes = switch_notes + update_notes
 
         continuation_value, continuation_notes = estimate_best_next_action_value(
             followup_state,
             updated_worlds=updated_worlds,
+            context=context,
         )
         normalized_weight = response.weight / total_selected_weight
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import replace
 
-from app.domain.actions import MoveAction, SwitchAction
+from app.domain.actions import MoveAction, SwitchAction, move_spec_for
 from app.domain.battle_state import BattleState, PokemonState, SideState
 from app.domain.move_tags import (
     is_choice_item,
@@ -10,12 +10,20 @@ from app.domain.move_tags import (
     is_setup_move,
     normalized_name,
 )
-from app.engine.damage_engine import estimate_damage
-from app.engine.field_engine import apply_field_modifiers, hazard_on_entry_context
+from app.engine.evaluation_context import EvaluationContext, compute_move_damage
+from app.engine.field_engine import hazard_on_entry_context
 from app.engine.response_engine import response_to_move_action
-from app.engine.speed_engine import turn_order_context
+from app.engine.speed_engine import OutspeedEstimate, effective_speed, turn_order_context
+from app.engine.speed_tier_index import SpeedTierIndex
+from app.engine.stat_engine import (
+    DEFAULT_IV,
+    DEFAULT_LEVEL,
+    derive_stats,
+    spread_tuple,
+)
 from app.engine.type_engine import combined_multiplier
 from app.inference.models import OpponentResponse, OpponentWorld, ProjectionSummary
+from app.providers.move_provider import get_move_action_table
 
 
 def _current_hp_value(pokemon: PokemonState) -> float:
@@ -90,12 +98,93 @@ def _is_immune_by_ability(
     return False
 
 
+def _world_hook_key(world: OpponentWorld) -> tuple[str | None, str | None]:
+    return (world.assumed_item, world.assumed_ability)
+
+
+def _world_spread_key(world: OpponentWorld) -> tuple:
+    candidate = world.candidate
+    return (
+        candidate.species,
+        candidate.spread_label,
+        candidate.nature,
+        tuple(sorted(candidate.evs.items())),
+        tuple(sorted(candidate.ivs.items())),
+    )
+
+
+def _prepare_opponent_stats_from_world(
+    pokemon: PokemonState,
+    world: OpponentWorld,
+    notes: list[str],
+    context: EvaluationContext | None = None,
+) -> PokemonState:
+    """
+    Scale the opposing active's request stats by the world's inferred spread.
+
+    Stats are derived for the candidate spread and for an uninvested neutral spread
+    of the same species; their ratio is applied to the request values so worlds
+    differ by investment while keeping the scale the request was sent in.
+    """
+    if context is not None:
+        return context.prepared_combatants.resolve(
+            ("opponent_spread", None),
+            pokemon,
+            _world_spread_key(world),
+            lambda hook_notes: _prepare_opponent_stats_from_world(pokemon, world, hook_notes),
+            notes,
+        )
+
+    candidate = world.candidate
+    if not pokemon.species or candidate.species != pokemon.species:
+        return pokemon
+    if not candidate.nature and not candidate.evs:
+        return pokemon
+
+    level = pokemon.level or DEFAULT_LEVEL
+    derived = derive_stats(
+        pokemon.species,
+        candidate.nature,
+        spread_tuple(candidate.evs, 0),
+        level,
+        ivs=spread_tuple(candidate.ivs, DEFAULT_IV),
+    )
+    reference = derive_stats(pokemon.species, None, level=level)
+    if derived is None or reference is None:
+        return pokemon
+
+    adjusted = replace(
+        pokemon,
+        atk=float(pokemon.atk or 100) * derived.atk / reference.atk,
+        def_=float(pokemon.def_ or 100) * derived.def_ / reference.def_,
+        spa=float(pokemon.spa or 100) * derived.spa / reference.spa,
+        spd=float(pokemon.spd or 100) * derived.spd / reference.spd,
+        spe=float(pokemon.spe or 100) * derived.spe / reference.spe,
+    )
+    notes.append(
+        f"Opponent stats scaled to inferred spread {candidate.spread_label or 'unknown-spread'} "
+        f"({candidate.nature or 'neutral'} nature)."
+    )
+    return adjusted
+
+
 def _prepare_my_attacker_against_world(
     attacker: PokemonState,
     my_action,
     world: OpponentWorld,
     notes: list[str],
+    context: EvaluationContext | None = None,
 ) -> PokemonState:
+    if context is not None:
+        category = my_action.move_category if isinstance(my_action, MoveAction) else None
+        return context.prepared_combatants.resolve(
+            ("my_attacker", category),
+            attacker,
+            _world_hook_key(world),
+            lambda hook_notes: _prepare_my_attacker_against_world(attacker, my_action, world, hook_notes),
+            notes,
+        )
+
     if not isinstance(my_action, MoveAction):
         return attacker
 
@@ -117,7 +206,17 @@ def _prepare_opponent_attacker_from_world(
     move_action: MoveAction,
     world: OpponentWorld,
     notes: list[str],
+    context: EvaluationContext | None = None,
 ) -> PokemonState:
+    if context is not None:
+        return context.prepared_combatants.resolve(
+            ("opponent_attacker", move_action.move_category),
+            attacker,
+            _world_hook_key(world),
+            lambda hook_notes: _prepare_opponent_attacker_from_world(attacker, move_action, world, hook_notes),
+            notes,
+        )
+
     power_mult = _power_multiplier_from_item(world.assumed_item, move_action.move_category)
 
     if power_mult == 1.0:
@@ -141,7 +240,17 @@ def _prepare_opponent_speed_from_world(
     pokemon: PokemonState,
     world: OpponentWorld,
     notes: list[str],
+    context: EvaluationContext | None = None,
 ) -> PokemonState:
+    if context is not None:
+        return context.prepared_combatants.resolve(
+            ("opponent_speed", None),
+            pokemon,
+            _world_hook_key(world),
+            lambda hook_notes: _prepare_opponent_speed_from_world(pokemon, world, hook_notes),
+            notes,
+        )
+
     speed_mult = _speed_multiplier_from_item(world.assumed_item)
     if speed_mult == 1.0:
         return pokemon
@@ -160,6 +269,7 @@ def _apply_move_damage(
     attacker_world: OpponentWorld | None = None,
     defender_world: OpponentWorld | None = None,
     notes: list[str] | None = None,
+    context: EvaluationContext | None = None,
 ) -> tuple[PokemonState, dict, list[str]]:
     field_notes: list[str] = []
     hook_notes = notes if notes is not None else []
@@ -185,29 +295,23 @@ def _apply_move_damage(
             move_action=move_action,
             world=attacker_world,
             notes=hook_notes,
+            context=context,
         )
 
-    move_ns = type(
-        "EvalMove",
-        (),
-        {
-            "name": move_action.move_name,
-            "type": move_action.move_type,
-            "category": move_action.move_category,
-            "power": move_action.base_power,
-            "priority": move_action.priority,
-            "crit": False,
-            "level": prepared_attacker.level,
-        },
-    )()
-
-    dmg = estimate_damage(attacker=prepared_attacker, defender=defender, move=move_ns)
-    dmg, extra_field_notes = apply_field_modifiers(
-        dmg=dmg,
-        move=move_ns,
-        field=state.field,
-        defender_hp=_max_hp_value(defender),
-    )
+    if context is not None:
+        dmg, extra_field_notes = context.damage_table.lookup(
+            prepared_attacker,
+            defender,
+            move_action,
+            state.field,
+        )
+    else:
+        dmg, extra_field_notes = compute_move_damage(
+            prepared_attacker,
+            defender,
+            move_action,
+            state.field,
+        )
     field_notes.extend(extra_field_notes)
 
     defender_after = _apply_damage_to_pokemon(defender, float(dmg["maxDamage"]))
@@ -394,11 +498,22 @@ def project_action_against_response(
     my_action,
     response: OpponentResponse,
     world: OpponentWorld,
+    *,
+    context: EvaluationContext | None = None,
 ) -> ProjectionSummary:
     my_before = _current_hp_value(state.my_side.active)
     opp_before = _current_hp_value(state.opponent_side.active)
     notes: list[str] = []
 
+    world_opp_active = _prepare_opponent_stats_from_world(
+        pokemon=state.opponent_side.active,
+        world=world,
+        notes=notes,
+        context=context,
+    )
+    if world_opp_active is not state.opponent_side.active:
+        state = replace(state, opponent_side=replace(state.opponent_side, active=world_opp_active))
+
     my_active = state.my_side.active
     opp_active = state.opponent_side.active
 
@@ -471,6 +586,7 @@ def project_action_against_response(
             attacker_world=world,
             defender_world=None,
             notes=notes,
+            context=context,
         )
         notes.extend(response.notes)
         notes.extend(field_notes)
@@ -507,6 +623,7 @@ def project_action_against_response(
             my_action=my_action,
             world=world,
             notes=notes,
+            context=context,
         )
 
         opp_after, my_dmg, my_field_notes = _apply_move_damage(
@@ -517,6 +634,7 @@ def project_action_against_response(
             attacker_world=None,
             defender_world=world,
             notes=notes,
+            context=context,
         )
         notes.extend(my_field_notes)
         notes.extend(response.notes)
@@ -561,23 +679,20 @@ def project_action_against_response(
         my_action=my_action,
         world=world,
         notes=notes,
+        context=context,
     )
     prepared_opp_active_for_order = _prepare_opponent_speed_from_world(
         pokemon=opp_active,
         world=world,
         notes=notes,
+        context=context,
     )
 
     order_context, order_notes = turn_order_context(
         attacking_pokemon=prepared_my_active,
         defending_pokemon=prepared_opp_active_for_order,
-        move=type(
-            "EvalMoveOrder",
-            (),
-            {
-                "priority": my_action.priority,
-            },
-        )(),
+        move=move_spec_for(my_action, prepared_my_active.level),
+        outspeed=estimate_outspeed_in_context(prepared_my_active, opp_active, context, world),
     )
     notes.extend(order_notes)
     notes.extend(response.notes)
@@ -594,6 +709,7 @@ def project_action_against_response(
             attacker_world=None,
             defender_world=world,
             notes=notes,
+            context=context,
         )
         notes.extend(my_field_notes)
         notes.append(
@@ -609,6 +725,7 @@ def project_action_against_response(
                 attacker_world=world,
                 defender_world=None,
                 notes=notes,
+                context=context,
             )
             notes.extend(opp_field_notes)
             notes.append(
@@ -626,6 +743,7 @@ def project_action_against_response(
             attacker_world=world,
             defender_world=None,
             notes=notes,
+            context=context,
         )
         notes.extend(opp_field_notes)
         notes.append(
@@ -641,6 +759,7 @@ def project_action_against_response(
                 attacker_world=None,
                 defender_world=world,
                 notes=notes,
+                context=context,
             )
             notes.extend(my_field_notes)
             notes.append(
@@ -658,6 +777,7 @@ def project_action_against_response(
             attacker_world=None,
             defender_world=world,
             notes=notes,
+            context=context,
         )
         my_after, opp_dmg, opp_field_notes = _apply_move_damage(
             attacker=opp_active,
@@ -667,6 +787,7 @@ def project_action_against_response(
             attacker_world=world,
             defender_world=None,
             notes=notes,
+            context=context,
         )
         notes.extend(my_field_notes)
         notes.extend(opp_field_notes)
@@ -714,4 +835,139 @@ def project_action_against_response(
         opp_forced_switch=opp_forced_switch,
         opponent_switched=opponent_switched,
         revealed_response_move=revealed_response_move,
-    )
\ No newline at end of file
+    )
+
+
+def _world_move_actions(world: OpponentWorld) -> list[MoveAction]:
+    move_actions: list[MoveAction] = []
+    seen: set[str] = set()
+    action_table = get_move_action_table()
+
+    for move_name in list(world.known_moves) + list(world.assumed_moves):
+        key = normalized_name(move_name)
+        if not key or key in seen:
+            continue
+        seen.add(key)
+
+        move_action = action_table.get(move_name)
+        if move_action is not None:
+            move_actions.append(move_action)
+
+    return move_actions
+
+
+def precompute_damage_table(
+    state: BattleState,
+    worlds: list[OpponentWorld],
+    my_actions: list[MoveAction],
+    context: EvaluationContext,
+) -> None:
+    """
+    Fill the context damage table for every matchup the evaluation can reach.
+
+    Covers my active's moves into the opposing active and bench, and each world's
+    move pool (with its item hooks) into my active and bench. Later projections and
+    lookahead branches then resolve damage with a single table hit.
+    """
+    my_defenders = [state.my_side.active, *state.my_side.bench]
+
+    for world in worlds:
+        world_opp_active = _prepare_opponent_stats_from_world(
+            pokemon=state.opponent_side.active,
+            world=world,
+            notes=[],
+            context=context,
+        )
+        world_opp_defenders = [world_opp_active, *state.opponent_side.bench]
+
+        for my_action in my_actions:
+            if my_action.move_category == "status" or my_action.base_power <= 0:
+                continue
+
+            prepared_my_active = _prepare_my_attacker_against_world(
+                attacker=state.my_side.active,
+                my_action=my_action,
+                world=world,
+                notes=[],
+                context=context,
+            )
+            for defender in world_opp_defenders:
+                if defender is world_opp_active and _is_immune_by_ability(my_action, world):
+                    continue
+                context.damage_table.lookup(prepared_my_active, defender, my_action, state.field)
+
+        for move_action in _world_move_actions(world):
+            if move_action.move_category == "status" or move_action.base_power <= 0:
+                continue
+
+            prepared_opp_active = _prepare_opponent_attacker_from_world(
+                attacker=world_opp_active,
+                move_action=move_action,
+                world=world,
+                notes=[],
+                context=context,
+            )
+            for defender in my_defenders:
+                context.damage_table.lookup(prepared_opp_active, defender, move_action, state.field)
+
+
+def estimate_outspeed_against_candidates(
+    my_active: PokemonState,
+    opponent_active: PokemonState,
+    speed_tiers: SpeedTierIndex,
+    *,
+    scarf: bool | None = None,
+) -> OutspeedEstimate | None:
+    """
+    Chance my active outspeeds the opposing active across its meta spread tiers.
+
+    Request stats are in the uninvested scale the spread scaling hook uses, so my
+    effective speed is mapped onto actual stats with the same neutral reference
+    before bisecting the opponent's Scarf-mixed tiers at its current boost stage.
+    """
+    species = opponent_active.species
+    if not species or species not in speed_tiers:
+        return None
+
+    reference = derive_stats(species, None, level=opponent_active.level or DEFAULT_LEVEL)
+    if reference is None:
+        return None
+
+    scale = reference.spe / max(1.0, float(opponent_active.spe or 100))
+    return speed_tiers.outspeed_probability(
+        species,
+        effective_speed(my_active) * scale,
+        stage=opponent_active.boosts.spe,
+        scarf=scarf,
+    )
+
+
+def estimate_outspeed_in_context(
+    my_pokemon: PokemonState,
+    opponent_active: PokemonState,
+    context: EvaluationContext | None,
+    world: OpponentWorld | None = None,
+) -> OutspeedEstimate | None:
+    """
+    Speed-tier outspeed estimate for turn-order decisions, when the context has tiers.
+
+    A world whose candidate carries a spread already pins the opponent's Speed, so
+    tiers are only consulted for spread-less worlds; the world's assumed item then
+    pins Choice Scarf instead of mixing it by usage share.
+    """
+    if context is None or context.speed_tiers is None:
+        return None
+
+    scarf = None
+    if world is not None:
+        if world.candidate.nature or world.candidate.evs:
+            return None
+        if world.assumed_item:
+            scarf = normalized_name(world.assumed_item) == "choice scarf"
+
+    return estimate_outspeed_against_candidates(
+        my_active=my_pokemon,
+        opponent_active=opponent_active,
+        speed_tiers=context.speed_tiers,
+        scarf=scarf,
+    )
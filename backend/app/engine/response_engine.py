@@ -5,19 +5,28 @@ from typing import List, Tuple
 from app.domain.actions import MoveAction, SwitchAction
 from app.domain.battle_state import BattleState, PokemonState
 from app.domain.move_tags import (
-    is_choice_item,
-    is_disruption_move,
-    is_hazard_move,
-    is_pivot_move,
-    is_priority_signal_move,
-    is_recovery_move,
-    is_setup_move,
+    CHOICE_BAND,
+    CHOICE_ITEMS,
+    CHOICE_SCARF,
+    CHOICE_SPECS,
+    DISRUPTION_MOVES,
+    HAZARD_MOVES,
+    HEAVY_DUTY_BOOTS,
+    HIGH_SIGNAL_PRIORITY_MOVES,
+    LEFTOVERS,
+    PIVOT_MOVES,
+    RECOVERY_MOVES,
+    SETUP_MOVES,
+    TERA_BLAST,
+    TRICK,
     normalized_name,
 )
+from app.domain.symbols import item_symbol, move_symbol
+from app.engine.evaluation_context import EvaluationContext
 from app.engine.field_engine import hazard_on_entry_context
 from app.engine.type_engine import combined_multiplier
 from app.inference.models import OpponentResponse, OpponentWorld
-from app.providers.move_provider import build_move_action_from_name
+from app.providers.move_provider import get_move_action_table
 
 
 def best_stab_type_into_target(
@@ -95,9 +104,9 @@ def _estimate_response_weight(
     my_action,
     is_revealed: bool,
 ) -> float:
-    move_name = move_action.move_name
+    move_id = move_symbol(move_action.move_name)
     category = normalized_name(move_action.move_category)
-    item_name = normalized_name(world.assumed_item)
+    item_id = item_symbol(world.assumed_item)
     tera_type = world.assumed_tera_type
 
     weight = 1.0
@@ -127,16 +136,19 @@ def _estimate_response_weight(
     elif move_action.base_power == 0 and category == "status":
         weight -= 0.10
 
-    if move_action.priority > 0 or is_priority_signal_move(move_name):
+    is_setup = move_id in SETUP_MOVES
+    is_recovery = move_id in RECOVERY_MOVES
+
+    if move_action.priority > 0 or move_id in HIGH_SIGNAL_PRIORITY_MOVES:
         weight += 0.35
 
-    if is_setup_move(move_name):
+    if is_setup:
         if isinstance(my_action, SwitchAction):
             weight += 0.55
         else:
             weight += 0.20
 
-    if is_recovery_move(move_name):
+    if is_recovery:
         opp_hp = float(
             opposing_active.current_hp if opposing_active.current_hp is not None else opposing_active.hp or 100
         )
@@ -150,42 +162,42 @@ def _estimate_response_weight(
         else:
             weight -= 0.10
 
-    if is_pivot_move(move_name):
+    if move_id in PIVOT_MOVES:
         weight += 0.25
 
-    if is_hazard_move(move_name):
+    if move_id in HAZARD_MOVES:
         if isinstance(my_action, SwitchAction):
             weight += 0.30
         else:
             weight -= 0.05
 
-    if is_disruption_move(move_name):
+    if move_id in DISRUPTION_MOVES:
         weight += 0.20
         if isinstance(my_action, SwitchAction):
             weight -= 0.10
 
-    if item_name == "choice scarf":
+    if item_id == CHOICE_SCARF:
         if move_action.base_power >= 80 or move_action.priority > 0:
             weight += 0.20
-        if is_setup_move(move_name) or is_recovery_move(move_name):
+        if is_setup or is_recovery:
             weight -= 0.25
 
-    if item_name == "choice band" and category == "physical":
+    if item_id == CHOICE_BAND and category == "physical":
         weight += 0.25
-    if item_name == "choice specs" and category == "special":
+    if item_id == CHOICE_SPECS and category == "special":
         weight += 0.25
 
-    if item_name == "leftovers":
-        if is_recovery_move(move_name) or is_setup_move(move_name):
+    if item_id == LEFTOVERS:
+        if is_recovery or is_setup:
             weight += 0.12
 
-    if normalized_name(move_name) == "trick":
-        if is_choice_item(item_name):
+    if move_id == TRICK:
+        if item_id in CHOICE_ITEMS:
             weight += 0.70
         else:
             weight -= 0.30
 
-    if normalized_name(move_name) == "tera blast":
+    if move_id == TERA_BLAST:
         if tera_type:
             weight += 0.45
             if tera_type == move_action.move_type:
@@ -218,7 +230,7 @@ def _build_hydrated_move_response(
 
     if world.assumed_item:
         notes.append(f"Response weighting considered assumed item: {world.assumed_item}.")
-    if world.assumed_tera_type and normalized_name(move_action.move_name) == "tera blast":
+    if world.assumed_tera_type and move_symbol(move_action.move_name) == TERA_BLAST:
         notes.append(f"Response weighting considered assumed tera type: {world.assumed_tera_type}.")
 
     return OpponentResponse(
@@ -278,6 +290,10 @@ def _switch_offensive_score(
     best_type, best_mult = best_stab_type_into_target(switch_target, my_active)
     if best_type is None:
         return 1.0
+    return _offensive_score_for_multiplier(best_mult)
+
+
+def _offensive_score_for_multiplier(best_mult: float) -> float:
     if best_mult >= 4.0:
         return 2.0
     if best_mult >= 2.0:
@@ -309,12 +325,55 @@ def _entry_hazard_penalty(
     return 0.90, notes
 
 
+def _world_offensive_score(
+    switch_target: PokemonState,
+    my_active: PokemonState,
+    world: OpponentWorld,
+) -> float:
+    """Offensive score of one inferred set: best of its STAB types and damaging moves into my active."""
+    _, best_mult = best_stab_type_into_target(switch_target, my_active)
+    move_actions = get_move_action_table()
+    for move_name, _ in _dedupe_move_names(world):
+        move_action = move_actions.get(move_name)
+        if move_action is None or move_action.move_category == "status" or move_action.base_power <= 0:
+            continue
+        mult, _ = combined_multiplier(move_action.move_type, my_active.types)
+        best_mult = max(best_mult, mult)
+    return _offensive_score_for_multiplier(best_mult)
+
+
+def _inferred_switch_scores(
+    switch_target: PokemonState,
+    my_active: PokemonState,
+    worlds: list[OpponentWorld],
+    hazard_penalty: float,
+) -> tuple[float, float, list[str]]:
+    """
+    Offensive score and hazard penalty of a bench Pokémon under its inferred sets.
+
+    Coverage moves count toward the offensive matchup, and the share of sets
+    holding Heavy-Duty Boots ignores entry hazards; both are weighted by set weight.
+    """
+    total = sum(world.weight for world in worlds) or 1.0
+    offensive = sum(world.weight * _world_offensive_score(switch_target, my_active, world) for world in worlds) / total
+    boots_share = (
+        sum(world.weight for world in worlds if item_symbol(world.assumed_item) == HEAVY_DUTY_BOOTS) / total
+    )
+
+    notes = [f"Bench Pokémon scored from {len(worlds)} inferred set(s)."]
+    if boots_share > 0 and hazard_penalty < 1.0:
+        hazard_penalty = (1.0 - boots_share) * hazard_penalty + boots_share
+        notes.append(f"Inferred Heavy-Duty Boots ({boots_share:.0%} of sets) offsets entry hazards.")
+    return offensive, hazard_penalty, notes
+
+
 def _build_switch_responses(
     state: BattleState,
     world: OpponentWorld,
     my_action,
     *,
     max_switches: int = 2,
+    context: EvaluationContext | None = None,
 ) -> list[OpponentResponse]:
     if not state.opponent_side.bench:
         return []
@@ -333,6 +392,16 @@ def _build_switch_responses(
             state.opponent_side.side_conditions,
         )
 
+        inferred_notes: list[str] = []
+        bench_worlds = context.team_worlds.get(bench_target.species or "") if context is not None else None
+        if bench_worlds:
+            offensive_score, hazard_penalty, inferred_notes = _inferred_switch_scores(
+                bench_target,
+                state.my_side.active,
+                bench_worlds,
+                hazard_penalty,
+            )
+
         raw_weight = defensive_score * offensive_score * hazard_penalty
 
         notes = [
@@ -341,6 +410,7 @@ def _build_switch_responses(
             f"Offensive matchup score={offensive_score:.2f}.",
             f"Entry hazard penalty multiplier={hazard_penalty:.2f}.",
         ]
+        notes.extend(inferred_notes)
         notes.extend(hazard_notes[:2])
 
         responses.append(
@@ -372,9 +442,10 @@ def _raw_move_responses(
 
     hydrated_candidates: list[tuple[MoveAction, float, bool]] = []
     move_name_pairs = _dedupe_move_names(world)
+    move_actions = get_move_action_table()
 
     for move_name, is_revealed in move_name_pairs[:6]:
-        move_action = build_move_action_from_name(move_name)
+        move_action = move_actions.get(move_name)
         if move_action is None:
             continue
 
@@ -424,13 +495,16 @@ def generate_opponent_responses(
     state: BattleState,
     world: OpponentWorld,
     my_action,
+    *,
+    context: EvaluationContext | None = None,
 ) -> List[OpponentResponse]:
     """
     Generate plausible opponent replies under one inferred world.
 
     This version:
     - hydrates multiple move responses from known + assumed moves
-    - ranks multiple switch candidates instead of using bench order
+    - ranks multiple switch candidates instead of using bench order, scoring each
+      bench Pokémon from its own inferred sets when the context carries them
     - uses item / tera / revealed-move confidence to shape raw response weights
     - normalizes only after all candidates are generated
     """
@@ -440,6 +514,7 @@ def generate_opponent_responses(
         world=world,
         my_action=my_action,
         max_switches=2,
+        context=context,
     )
 
     responses = move_responses + switch_responses
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
-from typing import Any, List, Tuple
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
 
 from app.domain.battle_state import PokemonState
 
 
+@dataclass(frozen=True, slots=True)
+class OutspeedEstimate:
+    faster: float
+    tie: float
+    slower: float
+
+
+_STAGE_MULTIPLIERS: dict[int, float] = {
+    stage: (2 + stage) / 2 if stage >= 0 else 2 / (2 - stage)
+    for stage in range(-6, 7)
+}
+
+
 def stage_multiplier(stage: int) -> float:
-    stage = max(-6, min(6, int(stage)))
-    if stage >= 0:
-        return (2 + stage) / 2
-    return 2 / (2 - stage)
+    return _STAGE_MULTIPLIERS[max(-6, min(6, int(stage)))]
 
 
 def effective_speed(pokemon: PokemonState) -> float:
@@ -26,7 +37,15 @@ def turn_order_context(
     attacking_pokemon: PokemonState,
     defending_pokemon: PokemonState,
     move: Any,
+    outspeed: Optional[OutspeedEstimate] = None,
 ) -> Tuple[str, List[str]]:
+    """
+    Turn order of the attacker's move against the defender.
+
+    Without `outspeed` the two effective speeds are compared directly. With it,
+    the defender's speed is a distribution (meta spread tiers) and the order
+    follows whichever side holds the majority; anything else is uncertain.
+    """
     notes: List[str] = []
 
     move_priority = priority_of(move)
@@ -37,6 +56,20 @@ def turn_order_context(
         notes.append(f"Negative move priority applied: {move_priority}.")
         return "attacker_second", notes
 
+    if outspeed is not None:
+        notes.append(
+            f"Speed tiers: attacker outspeeds {outspeed.faster:.0%} of defender spreads "
+            f"(ties {outspeed.tie:.0%}, slower {outspeed.slower:.0%})."
+        )
+        if outspeed.faster >= 0.5:
+            notes.append("Attacking Pokémon is estimated to move first.")
+            return "attacker_first", notes
+        if outspeed.slower >= 0.5:
+            notes.append("Attacking Pokémon is estimated to move second.")
+            return "attacker_second", notes
+        notes.append("No speed outcome holds a majority; turn order treated as uncertain.")
+        return "speed_tie", notes
+
     attacker_speed = effective_speed(attacking_pokemon)
     defender_speed = effective_speed(defending_pokemon)
 
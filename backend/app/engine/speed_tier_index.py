@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional
+
+from app.domain.move_tags import normalized_name
+from app.engine.speed_engine import OutspeedEstimate, stage_multiplier
+from app.engine.stat_engine import (
+    DEFAULT_IV,
+    DEFAULT_LEVEL,
+    derive_stats_batch,
+    spread_tuple,
+)
+from app.inference.models import MetaPriorSnapshot, SpeciesPrior
+from app.providers.data_registry import get_registry
+from app.services.name_normalize import normalize_key
+
+
+SCARF_MULTIPLIER = 1.5
+MIN_STAGE = -6
+MAX_STAGE = 6
+
+
+@dataclass(frozen=True, slots=True)
+class SpeedTier:
+    speed: float
+    weight: float
+    label: str
+
+
+@dataclass(frozen=True)
+class SpeciesSpeedTiers:
+    """
+    Sorted speed tiers of one species under one Scarf/boost variant.
+
+    `speeds` is ascending and `cumulative` holds the running weight up to and
+    including each tier, so mass below/above a speed is two bisects.
+    """
+
+    species: str
+    scarf: bool
+    stage: int
+    tiers: tuple[SpeedTier, ...]
+    speeds: tuple[float, ...]
+    cumulative: tuple[float, ...]
+
+    @property
+    def total_weight(self) -> float:
+        return self.cumulative[-1] if self.cumulative else 0.0
+
+    def outspeed(self, speed: float) -> OutspeedEstimate:
+        """Probability that `speed` is faster than, ties or is slower than this distribution."""
+        total = self.total_weight
+        if total <= 0:
+            return OutspeedEstimate(faster=0.0, tie=0.0, slower=0.0)
+
+        lower = bisect_left(self.speeds, speed)
+        upper = bisect_right(self.speeds, speed)
+        below = self.cumulative[lower - 1] if lower > 0 else 0.0
+        through = self.cumulative[upper - 1] if upper > 0 else 0.0
+
+        return OutspeedEstimate(
+            faster=below / total,
+            tie=(through - below) / total,
+            slower=(total - through) / total,
+        )
+
+
+def _build_variant(
+    species: str,
+    base_tiers: List[SpeedTier],
+    scarf: bool,
+    stage: int,
+) -> SpeciesSpeedTiers:
+    multiplier = stage_multiplier(stage) * (SCARF_MULTIPLIER if scarf else 1.0)
+    tiers = tuple(
+        sorted(
+            (SpeedTier(speed=int(tier.speed * multiplier), weight=tier.weight, label=tier.label) for tier in base_tiers),
+            key=lambda tier: tier.speed,
+        )
+    )
+    return SpeciesSpeedTiers(
+        species=species,
+        scarf=scarf,
+        stage=stage,
+        tiers=tiers,
+        speeds=tuple(tier.speed for tier in tiers),
+        cumulative=tuple(accumulate(tier.weight for tier in tiers)),
+    )
+
+
+def _base_speed_tiers(prior: SpeciesPrior, level: int) -> List[SpeedTier]:
+    spreads = [spread for spread in prior.spreads if spread.weight > 0]
+    if not spreads:
+        return []
+
+    derived = derive_stats_batch(
+        prior.species,
+        [(spread.nature, spread_tuple(spread.evs, 0), spread_tuple(spread.ivs, DEFAULT_IV)) for spread in spreads],
+        level=level,
+    )
+    if derived is None:
+        return []
+
+    return [
+        SpeedTier(speed=stats.spe, weight=float(spread.weight), label=spread.label)
+        for spread, stats in zip(spreads, derived)
+    ]
+
+
+def _scarf_share(prior: SpeciesPrior) -> float:
+    total = sum(max(0.0, item.weight) for item in prior.items)
+    if total <= 0:
+        return 0.0
+    scarf = sum(max(0.0, item.weight) for item in prior.items if normalized_name(item.value) == "choice scarf")
+    return scarf / total
+
+
+@dataclass
+class _SpeciesEntry:
+    species: str
+    base_tiers: List[SpeedTier]
+    scarf_share: float
+    variants: Dict[tuple[bool, int], SpeciesSpeedTiers] = field(default_factory=dict)
+
+
+class SpeedTierIndex:
+    """
+    Speed tiers for the species of a meta snapshot, built on first use.
+
+    Speeds are actual level-100 stats derived from the snapshot spreads. A species'
+    prior is only read (and, on a binary snapshot, decoded) the first time it is
+    asked for; each Scarf/boost variant is then sorted once and memoized, so an
+    outspeed probability against a full spread distribution is a bisect.
+    """
+
+    def __init__(self, snapshot: MetaPriorSnapshot, level: int = DEFAULT_LEVEL) -> None:
+        self.level = level
+        self._priors = snapshot.species_priors
+        # Iterating the mapping yields keys only; lazy snapshots decode nothing here.
+        self._species_names: Dict[str, str] = {normalize_key(name): name for name in snapshot.species_priors}
+        self._entries: Dict[str, Optional[_SpeciesEntry]] = {}
+
+    def _entry(self, species: str) -> Optional[_SpeciesEntry]:
+        key = normalize_key(species)
+        if key in self._entries:
+            return self._entries[key]
+
+        entry = None
+        name = self._species_names.get(key)
+        prior = self._priors.get(name) if name is not None else None
+        if prior is not None:
+            base_tiers = _base_speed_tiers(prior, self.level)
+            if base_tiers:
+                entry = _SpeciesEntry(species=prior.species, base_tiers=base_tiers, scarf_share=_scarf_share(prior))
+
+        self._entries[key] = entry
+        return entry
+
+    def __contains__(self, species: object) -> bool:
+        return isinstance(species, str) and self._entry(species) is not None
+
+    def species(self) -> Iterable[str]:
+        return sorted(self._species_names.values())
+
+    def scarf_share(self, species: str) -> float:
+        entry = self._entry(species)
+        return entry.scarf_share if entry is not None else 0.0
+
+    def tiers(self, species: str, *, scarf: bool = False, stage: int = 0) -> Optional[SpeciesSpeedTiers]:
+        entry = self._entry(species)
+        if entry is None:
+            return None
+
+        stage = max(MIN_STAGE, min(MAX_STAGE, int(stage)))
+        variant = entry.variants.get((scarf, stage))
+        if variant is None:
+            variant = _build_variant(entry.species, entry.base_tiers, scarf, stage)
+            entry.variants[(scarf, stage)] = variant
+        return variant
+
+    def outspeed_probability(
+        self,
+        species: str,
+        speed: float,
+        *,
+        stage: int = 0,
+        scarf: bool | None = None,
+    ) -> Optional[OutspeedEstimate]:
+        """
+        Chance `speed` beats the species' spread distribution at a boost stage.
+
+        With `scarf=None` the Scarf and non-Scarf tiers are mixed by the species'
+        Choice Scarf item share; pass True/False to pin the item.
+        """
+        if scarf is not None:
+            tiers = self.tiers(species, scarf=scarf, stage=stage)
+            return tiers.outspeed(speed) if tiers is not None else None
+
+        plain = self.tiers(species, scarf=False, stage=stage)
+        if plain is None:
+            return None
+
+        share = self.scarf_share(species)
+        estimate = plain.outspeed(speed)
+        if share <= 0:
+            return estimate
+
+        scarfed = self.tiers(species, scarf=True, stage=stage).outspeed(speed)
+        return OutspeedEstimate(
+            faster=(1 - share) * estimate.faster + share * scarfed.faster,
+            tie=(1 - share) * estimate.tie + share * scarfed.tie,
+            slower=(1 - share) * estimate.slower + share * scarfed.slower,
+        )
+
+
+def get_speed_tier_index(snapshot: MetaPriorSnapshot) -> SpeedTierIndex:
+    """
+    Shared index per data version and snapshot identity (format, generation, bucket, window).
+
+    Only snapshots with species priors are shared; an empty "unavailable"
+    snapshot gets a throwaway index, so unknown queries are never retained.
+    """
+    if not snapshot.species_priors:
+        return SpeedTierIndex(snapshot)
+
+    key = (
+        "speed_tiers",
+        snapshot.format_id,
+        snapshot.generation,
+        snapshot.rating_bucket,
+        tuple(snapshot.month_window),
+    )
+    return get_registry().derived(key, lambda: SpeedTierIndex(snapshot))
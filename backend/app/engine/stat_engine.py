@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping, Optional, Sequence
+
+from app.engine.speed_engine import stage_multiplier
+from app.providers.data_registry import get_registry
+from app.providers.nature_provider import get_nature_data
+from app.providers.pokemon_provider import get_pokemon_data
+
+
+STAT_KEYS: tuple[str, ...] = ("hp", "atk", "def", "spa", "spd", "spe")
+BOOSTABLE_STAT_KEYS: tuple[str, ...] = ("atk", "def", "spa", "spd", "spe")
+
+DEFAULT_LEVEL = 100
+DEFAULT_IV = 31
+
+ZERO_EVS: tuple[int, ...] = (0, 0, 0, 0, 0, 0)
+MAX_IVS: tuple[int, ...] = (DEFAULT_IV,) * 6
+NO_BOOSTS: tuple[int, ...] = (0, 0, 0, 0, 0)
+
+SpreadKey = tuple[Optional[str], tuple[int, ...], tuple[int, ...]]
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedStats:
+    hp: int
+    atk: float
+    def_: float
+    spa: float
+    spd: float
+    spe: float
+
+
+def spread_tuple(values: Mapping[str, int] | None, default: int) -> tuple[int, ...]:
+    """Order an EV/IV mapping (Smogon `def` key, or `def_`) into STAT_KEYS order."""
+    values = values or {}
+    ordered: list[int] = []
+    for key in STAT_KEYS:
+        raw = values.get(key)
+        if raw is None and key == "def":
+            raw = values.get("def_")
+        ordered.append(default if raw is None else int(raw))
+    return tuple(ordered)
+
+
+def _base_stats(species: str) -> tuple[int, ...] | None:
+    cache = get_registry().memo("base_stats", maxsize=256)
+    stats = cache.get(species, _MISSING)
+    if stats is not _MISSING:
+        return stats
+
+    data = get_pokemon_data(species)
+    base = (data or {}).get("base_stats") or {}
+    if data is None or not all(key in base for key in STAT_KEYS):
+        cache[species] = None
+        return None
+
+    cache[species] = stats = tuple(int(base[key]) for key in STAT_KEYS)
+    return stats
+
+
+def nature_multipliers(nature: str | None) -> tuple[float, ...]:
+    cache = get_registry().memo("nature_multipliers", maxsize=64)
+    multipliers = cache.get(nature)
+    if multipliers is None:
+        multipliers = cache[nature] = _nature_multipliers(nature)
+    return multipliers
+
+
+def _nature_multipliers(nature: str | None) -> tuple[float, ...]:
+    multipliers = [1.0] * len(STAT_KEYS)
+    if not nature:
+        return tuple(multipliers)
+
+    data = get_nature_data(nature)
+    if data is None:
+        return tuple(multipliers)
+
+    plus = data.get("plus")
+    minus = data.get("minus")
+    if plus and plus != minus and plus in STAT_KEYS:
+        multipliers[STAT_KEYS.index(plus)] = 1.1
+    if minus and minus != plus and minus in STAT_KEYS:
+        multipliers[STAT_KEYS.index(minus)] = 0.9
+    return tuple(multipliers)
+
+
+def _calc_hp(base: int, ev: int, iv: int, level: int) -> int:
+    return ((2 * base + iv + ev // 4) * level) // 100 + level + 10
+
+
+def _calc_other(base: int, ev: int, iv: int, level: int, nature_mult: float) -> int:
+    return int((((2 * base + iv + ev // 4) * level) // 100 + 5) * nature_mult)
+
+
+def _stat_line(
+    base: tuple[int, ...],
+    natures: tuple[float, ...],
+    evs: tuple[int, ...],
+    ivs: tuple[int, ...],
+    level: int,
+    boosts: tuple[int, ...],
+) -> DerivedStats:
+    atk, def_, spa, spd, spe = (
+        _calc_other(base[i], evs[i], ivs[i], level, natures[i]) * stage_multiplier(boosts[i - 1])
+        for i in range(1, 6)
+    )
+    return DerivedStats(
+        hp=_calc_hp(base[0], evs[0], ivs[0], level),
+        atk=atk,
+        def_=def_,
+        spa=spa,
+        spd=spd,
+        spe=spe,
+    )
+
+
+def derive_stats(
+    species: str,
+    nature: str | None,
+    evs: tuple[int, ...] = ZERO_EVS,
+    level: int = DEFAULT_LEVEL,
+    boosts: tuple[int, ...] = NO_BOOSTS,
+    ivs: tuple[int, ...] = MAX_IVS,
+) -> DerivedStats | None:
+    """
+    Actual stats for one spread from species base stats and nature data.
+
+    EVs/IVs are tuples in STAT_KEYS order and boosts are stage tuples in
+    BOOSTABLE_STAT_KEYS order, so every argument is hashable and results are
+    memoized in a bounded LRU per data version. Returns None when the species
+    has no canonical base stats.
+    """
+    cache = get_registry().memo("derived_stats", maxsize=8192)
+    key = (species, nature, evs, level, boosts, ivs)
+    stats = cache.get(key, _MISSING)
+    if stats is not _MISSING:
+        return stats
+
+    base = _base_stats(species)
+    stats = None if base is None else _stat_line(base, nature_multipliers(nature), evs, ivs, level, boosts)
+    cache[key] = stats
+    return stats
+
+
+def derive_stats_batch(
+    species: str,
+    spreads: Sequence[SpreadKey],
+    level: int = DEFAULT_LEVEL,
+    boosts: tuple[int, ...] = NO_BOOSTS,
+) -> list[DerivedStats] | None:
+    """
+    derive_stats for each (nature, evs, ivs) spread of one species, in order.
+
+    A plain loop: repeats are served by derive_stats' memo. Returns None when
+    the species has no canonical base stats.
+    """
+    if _base_stats(species) is None:
+        return None
+    return [derive_stats(species, nature, evs, level, boosts, ivs) for nature, evs, ivs in spreads]
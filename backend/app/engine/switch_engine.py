@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from app.domain.battle_state import PokemonState, SideConditions
 from app.engine.field_engine import hazard_on_entry_context
-from app.engine.speed_engine import effective_speed
+from app.engine.speed_engine import OutspeedEstimate, effective_speed
 from app.engine.type_engine import combined_multiplier
 
 
@@ -12,6 +12,7 @@ def score_switch(
     switch_target: PokemonState,
     opposing_active: PokemonState,
     entry_side_conditions: SideConditions,
+    outspeed: Optional[OutspeedEstimate] = None,
 ) -> Tuple[float, List[str]]:
     notes: List[str] = []
 
@@ -83,7 +84,13 @@ def score_switch(
 
     switch_speed = effective_speed(switch_target)
     opposing_speed = effective_speed(opposing_active)
-    if switch_speed > opposing_speed:
+    if outspeed is not None:
+        score += 2.0 * (outspeed.faster - outspeed.slower)
+        notes.append(
+            f"Switch target outspeeds {outspeed.faster:.0%} of the opposing active's meta spreads "
+            f"(ties {outspeed.tie:.0%})."
+        )
+    elif switch_speed > opposing_speed:
         score += 2.0
         notes.append("Switch target is estimated to outspeed opposing active Pokémon.")
     elif switch_speed < opposing_speed:
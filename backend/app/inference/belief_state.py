@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import copy
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from app.domain.symbols import ABILITIES, ITEMS, TYPES
+from app.inference.log_weights import NEG_INF, log_normalize, to_log_weight
+from app.inference.models import CandidateSet, InferenceResult, OpponentWorld
+
+
+# Evidence multipliers, shared with the legacy per-candidate update rules.
+REVEALED_MOVE_PRESENT = 1.35
+REVEALED_MOVE_ABSENT = 0.90
+SLOT_MATCH = 1.60
+SLOT_CONFLICT = 0.35
+SLOT_FILLED = 0.80
+
+_LOG_REVEALED_MOVE_PRESENT = math.log(REVEALED_MOVE_PRESENT)
+_LOG_REVEALED_MOVE_ABSENT = math.log(REVEALED_MOVE_ABSENT)
+_LOG_SLOT_MATCH = math.log(SLOT_MATCH)
+_LOG_SLOT_CONFLICT = math.log(SLOT_CONFLICT)
+_LOG_SLOT_FILLED = math.log(SLOT_FILLED)
+
+_NO_ID = -1
+
+_EVIDENCE_NOTES = {
+    "move": "Belief updater recorded revealed move evidence: {name}.",
+    "item": "Belief updater recorded item evidence: {name}.",
+    "ability": "Belief updater recorded ability evidence: {name}.",
+    "tera": "Belief updater recorded tera type evidence: {name}.",
+}
+# Single-valued candidate fields that evidence can confirm, contradict or fill.
+_SLOT_TABLES = {"item": ITEMS, "ability": ABILITIES, "tera": TYPES}
+_SLOT_LABELS = {"item": "item", "ability": "ability", "tera": "tera type"}
+BRANCH_EVIDENCE_NOTE = "Branch evidence was applied to the followup opponent belief state."
+
+
+@dataclass(frozen=True)
+class BranchEvidence:
+    """Evidence one lookahead branch reveals, applied as move, then item, then ability."""
+
+    revealed_move: Optional[str] = None
+    item: Optional[str] = None
+    ability: Optional[str] = None
+
+    def steps(self) -> list[tuple[str, str]]:
+        return [
+            (kind, name)
+            for kind, name in (("move", self.revealed_move), ("item", self.item), ("ability", self.ability))
+            if name
+        ]
+
+
+def _normalize(log_weights: Iterable[float], eliminated: bytearray) -> array:
+    """Log-sum-exp renormalization over the viable rows; eliminated rows get -inf."""
+    return array(
+        "d",
+        log_normalize(NEG_INF if dead else weight for weight, dead in zip(log_weights, eliminated)),
+    )
+
+
+class BeliefState:
+    """
+    Column-oriented candidate distribution for applying evidence in place.
+
+    Each candidate is a row: its static fields stay on the source CandidateSet,
+    while the fields evidence touches live in columns -- interned item/ability
+    IDs, move tuples, and log-space evidence and normalized weights in typed
+    arrays. Applying evidence is a masked add over the log-evidence column and
+    one log-sum-exp renormalization; no candidate is copied. Applied evidence
+    is recorded so per-candidate notes and penalties are only rendered when
+    candidates are materialized for output.
+    """
+
+    def __init__(
+        self,
+        candidates: list[CandidateSet],
+        *,
+        species: Optional[str],
+        confidence_label: str,
+        notes: list[str],
+        moves: Optional[list[tuple[str, ...]]] = None,
+        items: Optional[list[Optional[str]]] = None,
+        abilities: Optional[list[Optional[str]]] = None,
+        tera_types: Optional[list[Optional[str]]] = None,
+    ) -> None:
+        self.species = species
+        self.confidence_label = confidence_label
+        self.notes = list(notes)
+
+        self._rows = list(candidates)
+        self.moves = moves if moves is not None else [tuple(candidate.moves) for candidate in candidates]
+        self.confirmed_moves = [list(candidate.confirmed_moves) for candidate in candidates]
+        self.items = items if items is not None else [candidate.item for candidate in candidates]
+        self.abilities = abilities if abilities is not None else [candidate.ability for candidate in candidates]
+        self.tera_types = tera_types if tera_types is not None else [candidate.tera_type for candidate in candidates]
+
+        # Names missing from the global symbol tables (e.g. from request input)
+        # get negative IDs local to this belief state rather than being interned.
+        self._local_ids: dict[tuple[str, str], int] = {}
+        self.item_ids = array("l", (self._slot_id("item", item) for item in self.items))
+        self.ability_ids = array("l", (self._slot_id("ability", ability) for ability in self.abilities))
+        self.tera_ids = array("l", (self._slot_id("tera", tera_type) for tera_type in self.tera_types))
+        self.eliminated = bytearray(candidate.is_eliminated for candidate in candidates)
+        # Evidence rescales the prior x compatibility part of each row; it is
+        # taken from the carried log weight so it never underflows.
+        self.evidence_log_weights = array("d", (to_log_weight(c.evidence_weight) for c in candidates))
+        self.base_log_weights = array(
+            "d",
+            (
+                candidate.log_final_weight - evidence if evidence != NEG_INF else NEG_INF
+                for candidate, evidence in zip(candidates, self.evidence_log_weights)
+            ),
+        )
+        self.log_weights = array("d", (candidate.log_final_weight for candidate in candidates))
+
+        # (kind, name) per applied evidence, replayed by candidates().
+        self._evidence: list[tuple[str, str]] = []
+        self._initial_slots = {
+            "item": list(self.items),
+            "ability": list(self.abilities),
+            "tera": list(self.tera_types),
+        }
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @classmethod
+    def from_inference(cls, inference: InferenceResult) -> "BeliefState":
+        return cls(
+            inference.candidates,
+            species=inference.species,
+            confidence_label=inference.confidence_label,
+            notes=inference.notes,
+        )
+
+    @classmethod
+    def from_worlds(cls, worlds: list[OpponentWorld]) -> "BeliefState":
+        """Belief over opponent worlds, with each world's assumptions applied to its candidate."""
+        if not worlds:
+            return cls(
+                [],
+                species=None,
+                confidence_label="empty",
+                notes=["No worlds were available for belief conversion."],
+            )
+
+        candidates = [world.candidate for world in worlds]
+        state = cls(
+            candidates,
+            species=worlds[0].species,
+            confidence_label="branch_distribution",
+            notes=["Converted opponent world distribution into inference distribution for branch reweighting."],
+            moves=[
+                tuple(world.assumed_moves) if world.assumed_moves else tuple(world.candidate.moves)
+                for world in worlds
+            ],
+            items=[world.assumed_item if world.assumed_item is not None else world.candidate.item for world in worlds],
+            abilities=[
+                world.assumed_ability if world.assumed_ability is not None else world.candidate.ability
+                for world in worlds
+            ],
+            tera_types=[
+                world.assumed_tera_type if world.assumed_tera_type is not None else world.candidate.tera_type
+                for world in worlds
+            ],
+        )
+        state.log_weights = _normalize((to_log_weight(world.weight) for world in worlds), state.eliminated)
+        state._confirm_within_moves()
+        return state
+
+    def _confirm_within_moves(self) -> None:
+        self.confirmed_moves = [
+            [move for move in confirmed if move in moves]
+            for confirmed, moves in zip(self.confirmed_moves, self.moves)
+        ]
+
+    @property
+    def weights(self) -> array:
+        """Normalized probabilities (or the given final weights before any evidence)."""
+        return array("d", map(math.exp, self.log_weights))
+
+    def _reweight(self, log_multipliers: Iterable[float]) -> None:
+        evidence = self.evidence_log_weights
+        for index, log_multiplier in enumerate(log_multipliers):
+            evidence[index] += log_multiplier
+        self.log_weights = self._normalized_log_weights(evidence)
+
+    def _normalized_log_weights(self, evidence: array) -> array:
+        return _normalize((base + weight for base, weight in zip(self.base_log_weights, evidence)), self.eliminated)
+
+    def _slot_columns(self, kind: str) -> tuple[array, list[Optional[str]]]:
+        if kind == "item":
+            return self.item_ids, self.items
+        if kind == "ability":
+            return self.ability_ids, self.abilities
+        return self.tera_ids, self.tera_types
+
+    def _slot_id(self, kind: str, name: Optional[str]) -> int:
+        """Global symbol ID of a slot value, a local negative ID if it is unknown, or _NO_ID if blank."""
+        table = _SLOT_TABLES[kind]
+        symbol = table.lookup(name)
+        if symbol is not None:
+            return symbol
+        key = table.key(name)
+        if not key:
+            return _NO_ID
+        return self._local_ids.setdefault((kind, key), _NO_ID - 1 - len(self._local_ids))
+
+    def _log_multipliers(self, kind: str, name: str) -> list[float]:
+        """Log evidence multiplier per row; the move and slot columns are independent."""
+        if kind == "move":
+            return [
+                _LOG_REVEALED_MOVE_PRESENT if name in moves else _LOG_REVEALED_MOVE_ABSENT
+                for moves in self.moves
+            ]
+
+        ids, _ = self._slot_columns(kind)
+        observed = self._slot_id(kind, name)
+        return [
+            _LOG_SLOT_MATCH if symbol == observed else _LOG_SLOT_CONFLICT if symbol != _NO_ID else _LOG_SLOT_FILLED
+            for symbol in ids
+        ]
+
+    def _update_columns(self, kind: str, name: str) -> None:
+        """Record evidence in the attribute columns: add a revealed move, or fill unknown slots."""
+        if kind == "move":
+            for index, moves in enumerate(self.moves):
+                if name not in moves:
+                    self.moves[index] = moves + (name,)
+                if name not in self.confirmed_moves[index]:
+                    self.confirmed_moves[index].append(name)
+        else:
+            ids, names = self._slot_columns(kind)
+            observed = self._slot_id(kind, name)
+            for index, symbol in enumerate(ids):
+                if symbol == _NO_ID and symbol != observed:
+                    ids[index] = observed
+                    names[index] = name
+
+        self._evidence.append((kind, name))
+        self.notes.append(_EVIDENCE_NOTES[kind].format(name=name))
+
+    def apply(self, kind: str, name: str) -> None:
+        """Apply one piece of evidence: kind is "move", "item", "ability" or "tera"."""
+        log_multipliers = self._log_multipliers(kind, name)
+        self._update_columns(kind, name)
+        self._confirm_within_moves()
+        self._reweight(log_multipliers)
+
+    def apply_revealed_move(self, revealed_move: str) -> None:
+        self.apply("move", revealed_move)
+
+    def apply_item_evidence(self, item_name: str) -> None:
+        self.apply("item", item_name)
+
+    def apply_ability_evidence(self, ability_name: str) -> None:
+        self.apply("ability", ability_name)
+
+    def apply_tera_evidence(self, tera_type: str) -> None:
+        self.apply("tera", tera_type)
+
+    def covers(self, kind: str, name: str) -> bool:
+        """Whether some viable candidate already has `name` (a move, or the item/ability/tera value)."""
+        if kind == "move":
+            return any(name in moves for moves, dead in zip(self.moves, self.eliminated) if not dead)
+        ids, _ = self._slot_columns(kind)
+        observed = self._slot_id(kind, name)
+        return any(symbol == observed for symbol, dead in zip(ids, self.eliminated) if not dead)
+
+    def _branch_rows(self, branches: list[BranchEvidence]) -> list[tuple[array, array]]:
+        log_multipliers: dict[tuple[str, str], list[float]] = {}
+        rows: list[tuple[array, array]] = []
+        for branch in branches:
+            evidence = array("d", self.evidence_log_weights)
+            steps = branch.steps()
+            if not steps:
+                # Without evidence the current weights stand as they are.
+                rows.append((evidence, array("d", self.log_weights)))
+                continue
+            for step in steps:
+                if step not in log_multipliers:
+                    log_multipliers[step] = self._log_multipliers(*step)
+                for index, log_multiplier in enumerate(log_multipliers[step]):
+                    evidence[index] += log_multiplier
+            rows.append((evidence, self._normalized_log_weights(evidence)))
+        return rows
+
+    def branch_weight_matrix(self, branches: list[BranchEvidence]) -> list[array]:
+        """
+        Normalized weights (branches x candidates) after applying each branch's evidence to this belief.
+
+        Multiplier vectors are computed once per distinct piece of evidence and
+        shared across branches; rows match applying the evidence one branch at a
+        time.
+        """
+        return [array("d", map(math.exp, log_weights)) for _, log_weights in self._branch_rows(branches)]
+
+    def branches(self, branches: list[BranchEvidence]) -> list["BeliefState"]:
+        """One updated belief per branch, all reweighted together; this belief is left unchanged."""
+        updated: list[BeliefState] = []
+        for branch, (evidence, log_weights) in zip(branches, self._branch_rows(branches)):
+            belief = self._copy()
+            steps = branch.steps()
+            for step in steps:
+                belief._update_columns(*step)
+            if steps:
+                belief._confirm_within_moves()
+            belief.evidence_log_weights = evidence
+            belief.log_weights = log_weights
+            belief.notes.append(BRANCH_EVIDENCE_NOTE)
+            updated.append(belief)
+        return updated
+
+    def _copy(self) -> "BeliefState":
+        belief = copy.copy(self)
+        belief.notes = list(self.notes)
+        belief.moves = list(self.moves)
+        belief.confirmed_moves = [list(confirmed) for confirmed in self.confirmed_moves]
+        belief.items = list(self.items)
+        belief.abilities = list(self.abilities)
+        belief.item_ids = array("l", self.item_ids)
+        belief.ability_ids = array("l", self.ability_ids)
+        belief.tera_types = list(self.tera_types)
+        belief.tera_ids = array("l", self.tera_ids)
+        belief.evidence_log_weights = array("d", self.evidence_log_weights)
+        belief.log_weights = array("d", self.log_weights)
+        belief._evidence = list(self._evidence)
+        belief._local_ids = dict(self._local_ids)
+        return belief
+
+    def _explain(self, index: int) -> tuple[list[str], list[str]]:
+        """Per-candidate notes and penalties for the applied evidence, in application order."""
+        notes: list[str] = []
+        penalties: list[str] = []
+        slots = {kind: values[index] for kind, values in self._initial_slots.items()}
+
+        for kind, name in self._evidence:
+            if kind == "move":
+                notes.append(f"Revealed move evidence applied: {name}.")
+                continue
+
+            label = _SLOT_LABELS[kind]
+            notes.append(f"{label.capitalize()} evidence applied: {name}.")
+            current = slots[kind]
+            table = _SLOT_TABLES[kind]
+            if table.same(current, name):
+                continue
+            if table.key(current):
+                penalties.append(f"Observed {label} {name} conflicts with assumed {label} {current}.")
+            else:
+                slots[kind] = name
+                penalties.append(f"Observed {label} {name} filled previously unknown {label} slot.")
+
+        return notes, penalties
+
+    def candidates(self) -> list[CandidateSet]:
+        """Materialize the current rows as CandidateSets (for output and explanation)."""
+        materialized: list[CandidateSet] = []
+        for index, row in enumerate(self._rows):
+            moves = list(self.moves[index])
+            confirmed_moves = list(self.confirmed_moves[index])
+            evidence_notes, evidence_penalties = self._explain(index)
+            materialized.append(
+                CandidateSet(
+                    species=row.species,
+                    label=row.label,
+                    moves=moves,
+                    item=self.items[index],
+                    ability=self.abilities[index],
+                    tera_type=self.tera_types[index],
+                    spread_label=row.spread_label,
+                    nature=row.nature,
+                    evs=dict(row.evs),
+                    ivs=dict(row.ivs),
+                    prior_weight=row.prior_weight,
+                    compatibility_weight=row.compatibility_weight,
+                    evidence_weight=math.exp(self.evidence_log_weights[index]),
+                    final_weight=math.exp(self.log_weights[index]),
+                    log_weight=self.log_weights[index],
+                    source=row.source,
+                    confirmed_moves=confirmed_moves,
+                    assumed_moves=[move for move in moves if move not in confirmed_moves],
+                    notes=list(row.notes) + evidence_notes,
+                    penalties=list(row.penalties) + evidence_penalties,
+                    elimination_reasons=list(row.elimination_reasons),
+                )
+            )
+        return materialized
+
+    def to_inference(self) -> InferenceResult:
+        return InferenceResult(
+            species=self.species,
+            candidates=self.candidates(),
+            confidence_label=self.confidence_label,
+            notes=list(self.notes),
+        )
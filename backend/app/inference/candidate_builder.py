@@ -1,23 +1,82 @@
 from __future__ import annotations
 
+import heapq
+import math
 from dataclasses import dataclass, field
-from itertools import combinations
-from typing import List, Optional
+from itertools import combinations, product
+from typing import Callable, Iterator, List, Optional
 
-from app.inference.consistency_checks import (
-    check_constraint,
-    check_revealed_moves,
-    combine_check_results,
-)
+from app.inference.consistency_checks import CandidateFields, CompiledChecks, move_bit, move_family_mask, move_mask
+from app.inference.log_weights import NEG_INF, to_log_weight
 from app.inference.models import (
     CandidateBuilderConfig,
     CandidateConstraint,
     CandidateSet,
+    PairAssociations,
     SpeciesPrior,
     WeightedSpread,
 )
 
 
+# Non-damaging setup, hazard, status and recovery moves that clash with
+# Assault Vest and choice items.
+UTILITY_MOVES = frozenset(
+    {
+        "Bulk Up",
+        "Swords Dance",
+        "Calm Mind",
+        "Nasty Plot",
+        "Dragon Dance",
+        "Agility",
+        "Iron Defense",
+        "Curse",
+        "Trailblaze",
+        "Work Up",
+        "Stealth Rock",
+        "Spikes",
+        "Toxic Spikes",
+        "Sticky Web",
+        "Defog",
+        "Taunt",
+        "Toxic",
+        "Thunder Wave",
+        "Will-O-Wisp",
+        "Protect",
+        "Substitute",
+        "Roost",
+        "Recover",
+        "Slack Off",
+        "Soft-Boiled",
+        "Moonlight",
+        "Morning Sun",
+        "Synthesis",
+        "Wish",
+        "Pain Split",
+        "Encore",
+        "Healing Wish",
+        "Court Change",
+        "Parting Shot",
+    }
+)
+CHOICE_ITEMS = frozenset({"Choice Band", "Choice Specs", "Choice Scarf"})
+
+# Range of the move-move association multiplier.
+_MOVE_MOVE_LOW = 0.88
+_MOVE_MOVE_HIGH = 1.08
+
+_UTILITY_MOVE_MASK = move_family_mask(UTILITY_MOVES)
+_CHOICE_LOCKED_UTILITY_MASK = _UTILITY_MOVE_MASK & ~move_family_mask(["Trick", "Healing Wish"])
+_SPECIAL_SETUP_MASK = move_family_mask(["Calm Mind", "Nasty Plot"])
+_PHYSICAL_SETUP_MASK = move_family_mask(["Bulk Up", "Swords Dance", "Dragon Dance", "Curse"])
+
+
+def _moves_in(moves: list[str], moves_mask: int, family_mask: int) -> list[str]:
+    """Sorted distinct moves of a moveset that belong to a move family mask."""
+    if not moves_mask & family_mask:
+        return []
+    return sorted({move for move in moves if move_bit(move) & family_mask})
+
+
 @dataclass
 class CandidateBuildInput:
     species: str
@@ -35,14 +94,79 @@ class MoveVariant:
     weight: float
 
 
+@dataclass
+class _CandidateSpace:
+    """The per-dimension choices one build enumerates over, in legacy loop order."""
+
+    build_input: CandidateBuildInput
+    revealed_moves: list[str]
+    constraints: list[CandidateConstraint]
+    checks: CompiledChecks
+    associations: PairAssociations
+    items: list[tuple[Optional[str], float]]
+    abilities: list[tuple[Optional[str], float]]
+    teras: list[tuple[Optional[str], float]]
+    spreads: list[WeightedSpread]
+    variants: list[MoveVariant]
+    variant_masks: list[int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.variant_masks = [self.checks.move_bits.mask(variant.moves) for variant in self.variants]
+
+    def combinations(self) -> Iterator[tuple[int, int, int, int, int]]:
+        return product(
+            range(len(self.items)),
+            range(len(self.abilities)),
+            range(len(self.teras)),
+            range(len(self.spreads)),
+            range(len(self.variants)),
+        )
+
+    def loop_index(self, combo: tuple[int, ...]) -> int:
+        """Position of `combo` in the nested item/ability/tera/spread/variant loop."""
+        index = 0
+        for position, size in zip(
+            combo,
+            (len(self.items), len(self.abilities), len(self.teras), len(self.spreads), len(self.variants)),
+        ):
+            index = index * size + position
+        return index
+
+    def has_nonnegative_weights(self) -> bool:
+        weights = [weight for _, weight in self.items + self.abilities + self.teras]
+        weights += [spread.weight for spread in self.spreads]
+        weights += [variant.weight for variant in self.variants]
+        return all(weight >= 0 for weight in weights)
+
+
 class CandidateBuilder:
     def __init__(self, config: CandidateBuilderConfig | None = None):
         self.config = config or CandidateBuilderConfig()
 
     def build(self, build_input: CandidateBuildInput) -> List[CandidateSet]:
+        """
+        Top `max_candidates` sets for the prior, best first.
+
+        Combinations are enumerated lazily in descending order of a factorized
+        upper bound on their final weight, and enumeration stops once no
+        unvisited combination can enter the result. Output is identical to
+        exhaustive enumeration (build_exhaustive), including tie order.
+        """
+        space = self._build_space(build_input)
+        if not space.has_nonnegative_weights():
+            return self._select(self._enumerate_all(space))
+
+        scored = self._enumerate_best_first(space)
+        scored.sort(key=lambda record: record[0])
+        return [self._materialize(space, combo) for combo in self._select_scored(scored)]
+
+    def build_exhaustive(self, build_input: CandidateBuildInput) -> List[CandidateSet]:
+        """Reference implementation: materialize and check every combination."""
+        return self._select(self._enumerate_all(self._build_space(build_input)))
+
+    def _build_space(self, build_input: CandidateBuildInput) -> "_CandidateSpace":
         prior = build_input.prior
         revealed_moves = list(dict.fromkeys(build_input.revealed_moves))
-        effective_constraints = self._effective_constraints(build_input)
 
         move_values = self._top_move_values(prior, revealed_moves)
         move_variants = self._generate_move_variants(
@@ -50,86 +174,294 @@ class CandidateBuilder:
             revealed_moves=revealed_moves,
             max_moves=self.config.max_moves_per_set,
             max_variants=4,
+            move_move_index=prior.associations.move_move_index,
+        )
+
+        constraints = self._effective_constraints(build_input)
+
+        return _CandidateSpace(
+            build_input=build_input,
+            revealed_moves=revealed_moves,
+            constraints=constraints,
+            checks=CompiledChecks(revealed_moves, constraints),
+            associations=prior.associations,
+            items=self._top_item_values(prior, build_input.confirmed_item),
+            abilities=self._top_ability_values(prior, build_input.confirmed_ability),
+            teras=self._top_tera_values(prior, build_input.confirmed_tera_type),
+            spreads=self._top_spreads(prior),
+            variants=[variant for variant in move_variants if variant.moves],
+        )
+
+    def _enumerate_all(self, space: "_CandidateSpace") -> list[CandidateSet]:
+        return [self._materialize(space, combo) for combo in space.combinations()]
+
+    def _enumerate_best_first(self, space: "_CandidateSpace") -> list[tuple[int, float, tuple, tuple[int, ...]]]:
+        """
+        Visit combinations in descending upper-bound order until the top-k is settled.
+
+        Each dimension is sorted by its bound factor, so the bound is monotone
+        along every axis of the index lattice and a heap over lattice points
+        yields combinations in non-increasing bound order. Stops once the next
+        bound is strictly below the k-th best deduplicated final weight, or below
+        the weight threshold when at least one candidate already passes it.
+        Strict comparisons keep ties in enumeration order exactly as exhaustive.
+
+        Visited combinations are only scored; returns (loop index, final weight,
+        dedupe key, combo) records so build() materializes just the selected ones.
+        """
+        factors = self._upper_bound_factors(space)
+        if not all(factors):
+            return []
+
+        orders = [
+            sorted(range(len(dimension)), key=lambda index, dimension=dimension: -dimension[index])
+            for dimension in factors
+        ]
+        sorted_factors = [[dimension[index] for index in order] for dimension, order in zip(factors, orders)]
+
+        def bound(point: tuple[int, ...]) -> float:
+            value = 1.0
+            for dimension, position in zip(sorted_factors, point):
+                value *= dimension[position]
+            # Slack so float rounding never makes the bound undercut an exact weight.
+            return value * (1.0 + 1e-9)
+
+        threshold = self.config.min_weight_threshold
+        max_candidates = self.config.max_candidates
+        best_by_key: dict[tuple, float] = {}
+        # Size-k min-heaps of the best deduplicated weights, overall and above threshold.
+        top_overall: list[float] = []
+        top_accepted: list[float] = []
+        accepted_count = 0
+        scored: list[tuple[int, float, tuple, tuple[int, ...]]] = []
+
+        def offer(top: list[float], weight: float) -> None:
+            if len(top) < max_candidates:
+                heapq.heappush(top, weight)
+            elif max_candidates > 0 and weight > top[0]:
+                heapq.heapreplace(top, weight)
+
+        origin = (0,) * len(sorted_factors)
+        heap = [(-bound(origin), origin)]
+        seen = {origin}
+
+        while heap:
+            negative_bound, point = heapq.heappop(heap)
+            combo = tuple(order[position] for order, position in zip(orders, point))
+            final_weight, key = self._score(space, combo)
+            scored.append((space.loop_index(combo), final_weight, key, combo))
+
+            previous = best_by_key.get(key)
+            if previous is None:
+                best_by_key[key] = final_weight
+                offer(top_overall, final_weight)
+                if final_weight >= threshold:
+                    accepted_count += 1
+                    offer(top_accepted, final_weight)
+            elif final_weight > previous:
+                # A repeated key improved (duplicate prior entries): rebuild the heaps.
+                best_by_key[key] = final_weight
+                weights = list(best_by_key.values())
+                accepted = [weight for weight in weights if weight >= threshold]
+                accepted_count = len(accepted)
+                top_overall = heapq.nlargest(max_candidates, weights)
+                top_accepted = heapq.nlargest(max_candidates, accepted)
+                heapq.heapify(top_overall)
+                heapq.heapify(top_accepted)
+
+            for axis in range(len(point)):
+                if point[axis] + 1 < len(sorted_factors[axis]):
+                    successor = point[:axis] + (point[axis] + 1,) + point[axis + 1 :]
+                    if successor not in seen:
+                        seen.add(successor)
+                        heapq.heappush(heap, (-bound(successor), successor))
+
+            if not heap:
+                break
+
+            next_bound = -heap[0][0]
+            if next_bound < threshold:
+                if accepted_count:
+                    break
+                # Nothing can pass the threshold any more, so the result is the
+                # below-threshold fallback: the best deduplicated candidates overall.
+                if len(best_by_key) >= max_candidates and next_bound < top_overall[0]:
+                    break
+            elif accepted_count >= max_candidates and next_bound < top_accepted[0]:
+                break
+
+        return scored
+
+    def _upper_bound_factors(self, space: "_CandidateSpace") -> list[list[float]]:
+        """
+        Per-dimension factors whose product bounds prior_weight x compatibility.
+
+        Each pairwise association term is bounded by its maximum over the other
+        dimension and charged to one side: move terms to the variant, item-spread
+        to the item. Consistency checks only ever multiply by <= 1.
+        """
+        prior = space.build_input.prior
+        associations = space.associations
+
+        variant_factors: list[float] = []
+        for variant, moves_mask in zip(space.variants, space.variant_masks):
+            moves = list(variant.moves)
+            item_terms = []
+            for item_name, _ in space.items:
+                tera_term = max(
+                    self._compute_revealed_move_family_nudge(moves=moves, item=item_name, tera_type=tera_type)[0]
+                    * self._compute_tera_compatibility(prior=prior, moves=moves, tera_type=tera_type, item=item_name)[0]
+                    for tera_type, _ in space.teras
+                )
+                item_terms.append(
+                    self._move_item_multiplier(associations.move_item_index, moves, item_name)
+                    * self._compute_contradiction_penalty(moves=moves, item=item_name, moves_mask=moves_mask)[0]
+                    * self._compute_move_item_signal_override(moves=moves, item=item_name)[0]
+                    * tera_term
+                )
+            ability_term = max(
+                self._move_ability_multiplier(associations.move_ability_index, moves, ability_name)
+                for ability_name, _ in space.abilities
+            )
+            variant_factors.append(
+                variant.weight
+                * self._move_move_multiplier(associations.move_move_index, moves)
+                * max(item_terms)
+                * ability_term
+            )
+
+        item_factors = [
+            item_weight
+            * max(
+                self._item_spread_multiplier(associations.item_spread_index, item_name, spread.label)
+                for spread in space.spreads
+            )
+            for item_name, item_weight in space.items
+        ]
+
+        return [
+            item_factors,
+            [weight for _, weight in space.abilities],
+            [weight for _, weight in space.teras],
+            [spread.weight for spread in space.spreads],
+            variant_factors,
+        ]
+
+    def _score(self, space: "_CandidateSpace", combo: tuple[int, ...]) -> tuple[float, tuple]:
+        """_materialize(space, combo)'s final weight and dedupe key, without building the set."""
+        item_index, ability_index, tera_index, spread_index, variant_index = combo
+        item_name, item_weight = space.items[item_index]
+        ability_name, ability_weight = space.abilities[ability_index]
+        tera_type, tera_weight = space.teras[tera_index]
+        spread = space.spreads[spread_index]
+        variant = space.variants[variant_index]
+        moves_mask = space.variant_masks[variant_index]
+        species = space.build_input.species
+
+        prior_weight = (item_weight * ability_weight * tera_weight * spread.weight) * variant.weight
+        association_compatibility_weight = math.prod(
+            multiplier
+            for multiplier, _ in self._association_terms(
+                prior=space.build_input.prior,
+                moves=list(variant.moves),
+                item=item_name,
+                ability=ability_name,
+                spread_label=spread.label,
+                tera_type=tera_type,
+                moves_mask=moves_mask,
+            )
+        )
+        combined = space.checks.check_fields(
+            CandidateFields(species, item_name, ability_name, tera_type),
+            moves_mask,
+        )
+
+        final_weight = 0.0
+        if not (combined.decision == "eliminate" and combined.reasons):
+            final_weight = prior_weight * (association_compatibility_weight * combined.multiplier) * 1.0
+
+        key = (species, tuple(variant.moves), item_name, ability_name, tera_type, spread.label)
+        return final_weight, key
+
+    def _materialize(self, space: "_CandidateSpace", combo: tuple[int, ...]) -> CandidateSet:
+        item_index, ability_index, tera_index, spread_index, variant_index = combo
+        item_name, item_weight = space.items[item_index]
+        ability_name, ability_weight = space.abilities[ability_index]
+        tera_type, tera_weight = space.teras[tera_index]
+        spread = space.spreads[spread_index]
+        variant = space.variants[variant_index]
+        moves_mask = space.variant_masks[variant_index]
+        build_input = space.build_input
+
+        shell_weight = (
+            item_weight
+            * ability_weight
+            * tera_weight
+            * spread.weight
         )
 
-        item_values = self._top_item_values(prior, build_input.confirmed_item)
-        ability_values = self._top_ability_values(prior, build_input.confirmed_ability)
-        tera_values = self._top_tera_values(prior, build_input.confirmed_tera_type)
-        spread_values = self._top_spreads(prior)
-
-        candidates: list[CandidateSet] = []
-
-        for item_name, item_weight in item_values:
-            for ability_name, ability_weight in ability_values:
-                for tera_type, tera_weight in tera_values:
-                    for spread in spread_values:
-                        shell_weight = (
-                            item_weight
-                            * ability_weight
-                            * tera_weight
-                            * spread.weight
-                        )
-
-                        for variant in move_variants:
-                            moves = list(variant.moves)
-                            if not moves:
-                                continue
-
-                            prior_weight = shell_weight * variant.weight
-
-                            label = self._build_label(
-                                species=build_input.species,
-                                item=item_name,
-                                ability=ability_name,
-                                tera_type=tera_type,
-                                spread_label=spread.label,
-                                moves=moves,
-                            )
-
-                            confirmed_moves = [move for move in revealed_moves if move in moves]
-                            assumed_moves = [move for move in moves if move not in confirmed_moves]
-
-                            association_compatibility_weight, association_notes = self._compute_association_compatibility(
-                                prior=prior,
-                                moves=moves,
-                                item=item_name,
-                                ability=ability_name,
-                                spread_label=spread.label,
-                                tera_type=tera_type,
-                            )
-
-                            base_candidate = CandidateSet(
-                                species=build_input.species,
-                                label=label,
-                                moves=moves,
-                                item=item_name,
-                                ability=ability_name,
-                                tera_type=tera_type,
-                                spread_label=spread.label,
-                                nature=spread.nature,
-                                evs=dict(spread.evs),
-                                ivs=dict(spread.ivs),
-                                prior_weight=prior_weight,
-                                compatibility_weight=association_compatibility_weight,
-                                evidence_weight=1.0,
-                                final_weight=prior_weight * association_compatibility_weight,
-                                source="meta_provider",
-                                confirmed_moves=confirmed_moves,
-                                assumed_moves=assumed_moves,
-                                notes=[
-                                    "Built from normalized species prior.",
-                                    "Builder uses bounded move-variant generation with revealed-move preservation.",
-                                    *association_notes,
-                                ],
-                            )
-
-                            checked_candidate = self._apply_consistency_checks(
-                                candidate=base_candidate,
-                                revealed_moves=revealed_moves,
-                                constraints=effective_constraints,
-                            )
-                            candidates.append(checked_candidate)
+        moves = list(variant.moves)
+        prior_weight = shell_weight * variant.weight
 
+        label = self._build_label(
+            species=build_input.species,
+            item=item_name,
+            ability=ability_name,
+            tera_type=tera_type,
+            spread_label=spread.label,
+            moves=moves,
+        )
+
+        confirmed_moves = [move for move in space.revealed_moves if move in moves]
+        assumed_moves = [move for move in moves if move not in confirmed_moves]
+
+        association_compatibility_weight, association_notes = self._compute_association_compatibility(
+            prior=build_input.prior,
+            moves=moves,
+            item=item_name,
+            ability=ability_name,
+            spread_label=spread.label,
+            tera_type=tera_type,
+            moves_mask=moves_mask,
+        )
+
+        base_candidate = CandidateSet(
+            species=build_input.species,
+            label=label,
+            moves=moves,
+            item=item_name,
+            ability=ability_name,
+            tera_type=tera_type,
+            spread_label=spread.label,
+            nature=spread.nature,
+            evs=dict(spread.evs),
+            ivs=dict(spread.ivs),
+            prior_weight=prior_weight,
+            compatibility_weight=association_compatibility_weight,
+            evidence_weight=1.0,
+            final_weight=prior_weight * association_compatibility_weight,
+            log_weight=(
+                sum(map(to_log_weight, (item_weight, ability_weight, tera_weight, spread.weight, variant.weight)))
+                + to_log_weight(association_compatibility_weight)
+            ),
+            source="meta_provider",
+            confirmed_moves=confirmed_moves,
+            assumed_moves=assumed_moves,
+            notes=[
+                "Built from normalized species prior.",
+                "Builder uses bounded move-variant generation with revealed-move preservation.",
+                *association_notes,
+            ],
+        )
+
+        return self._apply_consistency_checks(
+            candidate=base_candidate,
+            checks=space.checks,
+            moves_mask=moves_mask,
+        )
+
+    def _select(self, candidates: list[CandidateSet]) -> list[CandidateSet]:
+        """Sort (stable, so ties keep enumeration order), dedupe, threshold and cap."""
         candidates.sort(key=lambda c: c.final_weight, reverse=True)
 
         deduped = self._dedupe_candidates(candidates)
@@ -144,6 +476,25 @@ class CandidateBuilder:
 
         return filtered[: self.config.max_candidates]
 
+    def _select_scored(self, scored: list[tuple[int, float, tuple, tuple[int, ...]]]) -> list[tuple[int, ...]]:
+        """_select over scored records; returns the combos to materialize, best first."""
+        scored.sort(key=lambda record: record[1], reverse=True)
+
+        seen: set[tuple] = set()
+        deduped: list[tuple[float, tuple[int, ...]]] = []
+        for _, final_weight, key, combo in scored:
+            if key in seen:
+                continue
+            seen.add(key)
+            deduped.append((final_weight, combo))
+
+        filtered = [record for record in deduped if record[0] >= self.config.min_weight_threshold]
+
+        if not filtered and deduped:
+            filtered = deduped[: self.config.max_candidates]
+
+        return [combo for _, combo in filtered[: self.config.max_candidates]]
+
     def _effective_constraints(
         self,
         build_input: CandidateBuildInput,
@@ -185,28 +536,6 @@ class CandidateBuilder:
 
         return constraints
 
-    def _association_weight_map(
-        self,
-        pairs: list,
-    ) -> dict[tuple[str, str], float]:
-        mapping: dict[tuple[str, str], float] = {}
-        for pair in pairs:
-            key = (pair.left, pair.right)
-            mapping[key] = max(mapping.get(key, 0.0), pair.weight)
-        return mapping
-
-    def _symmetric_association_weight_map(
-        self,
-        pairs: list,
-    ) -> dict[tuple[str, str], float]:
-        mapping: dict[tuple[str, str], float] = {}
-        for pair in pairs:
-            key_ab = (pair.left, pair.right)
-            key_ba = (pair.right, pair.left)
-            mapping[key_ab] = max(mapping.get(key_ab, 0.0), pair.weight)
-            mapping[key_ba] = max(mapping.get(key_ba, 0.0), pair.weight)
-        return mapping
-
     def _average_or_default(self, values: list[float], default: float = 1.0) -> float:
         if not values:
             return default
@@ -222,74 +551,30 @@ class CandidateBuilder:
         bounded_score = max(0.0, min(1.0, score))
         return low + (high - low) * bounded_score
 
-    def _non_damaging_setup_or_status_moves(self) -> set[str]:
-        return {
-            "Bulk Up",
-            "Swords Dance",
-            "Calm Mind",
-            "Nasty Plot",
-            "Dragon Dance",
-            "Agility",
-            "Iron Defense",
-            "Curse",
-            "Trailblaze",
-            "Work Up",
-            "Stealth Rock",
-            "Spikes",
-            "Toxic Spikes",
-            "Sticky Web",
-            "Defog",
-            "Taunt",
-            "Toxic",
-            "Thunder Wave",
-            "Will-O-Wisp",
-            "Protect",
-            "Substitute",
-            "Roost",
-            "Recover",
-            "Slack Off",
-            "Soft-Boiled",
-            "Moonlight",
-            "Morning Sun",
-            "Synthesis",
-            "Wish",
-            "Pain Split",
-            "Encore",
-            "Healing Wish",
-            "Court Change",
-            "Parting Shot",
-        }
-
     def _compute_contradiction_penalty(
         self,
         *,
         moves: list[str],
         item: Optional[str],
+        moves_mask: Optional[int] = None,
     ) -> tuple[float, list[str]]:
         notes: list[str] = []
         item_name = item or ""
-        move_set = set(moves)
-        utility_moves = self._non_damaging_setup_or_status_moves()
+        if moves_mask is None:
+            moves_mask = move_mask(moves)
 
         penalty = 1.0
 
         if item_name == "Assault Vest":
-            blocked = sorted(move_set.intersection(utility_moves))
+            blocked = _moves_in(moves, moves_mask, _UTILITY_MOVE_MASK)
             if blocked:
                 penalty *= 0.15
                 notes.append(
                     f"Contradiction penalty: Assault Vest conflicts with non-damaging moves {blocked}."
                 )
 
-        choice_items = {"Choice Band", "Choice Specs", "Choice Scarf"}
-        choice_compatible_utility_moves = {"Trick", "Healing Wish"}
-
-        if item_name in choice_items:
-            blocked = sorted(
-                move
-                for move in move_set.intersection(utility_moves)
-                if move not in choice_compatible_utility_moves
-            )
+        if item_name in CHOICE_ITEMS:
+            blocked = _moves_in(moves, moves_mask, _CHOICE_LOCKED_UTILITY_MASK)
             if blocked:
                 penalty *= 0.30
                 notes.append(
@@ -297,8 +582,7 @@ class CandidateBuilder:
                 )
 
         if item_name == "Choice Band":
-            special_setup = {"Calm Mind", "Nasty Plot"}
-            blocked = sorted(move_set.intersection(special_setup))
+            blocked = _moves_in(moves, moves_mask, _SPECIAL_SETUP_MASK)
             if blocked:
                 penalty *= 0.20
                 notes.append(
@@ -306,8 +590,7 @@ class CandidateBuilder:
                 )
 
         if item_name == "Choice Specs":
-            physical_setup = {"Bulk Up", "Swords Dance", "Dragon Dance", "Curse"}
-            blocked = sorted(move_set.intersection(physical_setup))
+            blocked = _moves_in(moves, moves_mask, _PHYSICAL_SETUP_MASK)
             if blocked:
                 penalty *= 0.20
                 notes.append(
@@ -316,11 +599,11 @@ class CandidateBuilder:
 
         return penalty, notes
 
-    def _choice_items(self) -> set[str]:
-        return {"Choice Band", "Choice Specs", "Choice Scarf"}
+    def _choice_items(self) -> frozenset[str]:
+        return CHOICE_ITEMS
 
     def _has_move(self, moves: list[str], move_name: str) -> bool:
-        return move_name in set(moves)
+        return move_name in moves
 
     def _compute_revealed_move_family_nudge(
         self,
@@ -456,97 +739,111 @@ class CandidateBuilder:
 
         return multiplier, notes
 
-    def _compute_association_compatibility(
-        self,
-        *,
-        prior: SpeciesPrior,
-        moves: list[str],
-        item: Optional[str],
-        ability: Optional[str],
-        spread_label: Optional[str],
-        tera_type: Optional[str],
-    ) -> tuple[float, list[str]]:
-        notes: list[str] = []
-        associations = prior.associations
-
-        move_move_map = self._symmetric_association_weight_map(associations.move_move)
-        move_item_map = self._association_weight_map(associations.move_item)
-        move_ability_map = self._association_weight_map(associations.move_ability)
-        item_spread_map = self._association_weight_map(associations.item_spread)
-
+    def _move_move_multiplier(self, move_move_index: dict, moves: list[str]) -> float:
         move_move_scores: list[float] = []
         for i in range(len(moves)):
             for j in range(i + 1, len(moves)):
-                pair_weight = move_move_map.get((moves[i], moves[j]), 0.0)
+                pair_weight = move_move_index.get((moves[i], moves[j]), 0.0)
                 if pair_weight > 0.0:
                     move_move_scores.append(pair_weight)
 
+        move_move_avg = self._average_or_default(move_move_scores, default=0.35)
+        return self._bounded_component_multiplier(move_move_avg, low=_MOVE_MOVE_LOW, high=_MOVE_MOVE_HIGH)
+
+    def _move_item_multiplier(self, move_item_index: dict, moves: list[str], item: Optional[str]) -> float:
         move_item_scores: list[float] = []
         if item:
             for move in moves:
-                pair_weight = move_item_map.get((move, item), 0.0)
+                pair_weight = move_item_index.get((move, item), 0.0)
                 if pair_weight > 0.0:
                     move_item_scores.append(pair_weight)
 
+        move_item_avg = self._average_or_default(move_item_scores, default=0.35)
+        return self._bounded_component_multiplier(move_item_avg, low=0.84, high=1.10)
+
+    def _move_ability_multiplier(self, move_ability_index: dict, moves: list[str], ability: Optional[str]) -> float:
         move_ability_scores: list[float] = []
         if ability:
             for move in moves:
-                pair_weight = move_ability_map.get((move, ability), 0.0)
+                pair_weight = move_ability_index.get((move, ability), 0.0)
                 if pair_weight > 0.0:
                     move_ability_scores.append(pair_weight)
 
+        move_ability_avg = self._average_or_default(move_ability_scores, default=0.60)
+        return self._bounded_component_multiplier(move_ability_avg, low=0.92, high=1.06)
+
+    def _item_spread_multiplier(
+        self,
+        item_spread_index: dict,
+        item: Optional[str],
+        spread_label: Optional[str],
+    ) -> float:
         item_spread_scores: list[float] = []
         if item and spread_label:
-            pair_weight = item_spread_map.get((item, spread_label), 0.0)
+            pair_weight = item_spread_index.get((item, spread_label), 0.0)
             if pair_weight > 0.0:
                 item_spread_scores.append(pair_weight)
 
-        move_move_avg = self._average_or_default(move_move_scores, default=0.35)
-        move_item_avg = self._average_or_default(move_item_scores, default=0.35)
-        move_ability_avg = self._average_or_default(move_ability_scores, default=0.60)
         item_spread_avg = self._average_or_default(item_spread_scores, default=0.35)
+        return self._bounded_component_multiplier(item_spread_avg, low=0.86, high=1.08)
 
-        move_move_multiplier = self._bounded_component_multiplier(move_move_avg, low=0.88, high=1.08)
-        move_item_multiplier = self._bounded_component_multiplier(move_item_avg, low=0.84, high=1.10)
-        move_ability_multiplier = self._bounded_component_multiplier(move_ability_avg, low=0.92, high=1.06)
-        item_spread_multiplier = self._bounded_component_multiplier(item_spread_avg, low=0.86, high=1.08)
-
-        contradiction_penalty, contradiction_notes = self._compute_contradiction_penalty(
-            moves=moves,
-            item=item,
-        )
-
-        revealed_move_nudge, revealed_move_notes = self._compute_revealed_move_family_nudge(
-            moves=moves,
-            item=item,
-            tera_type=tera_type,
-        )
-
-        move_item_override, move_item_override_notes = self._compute_move_item_signal_override(
-            moves=moves,
-            item=item,
-        )
+    def _association_terms(
+        self,
+        *,
+        prior: SpeciesPrior,
+        moves: list[str],
+        item: Optional[str],
+        ability: Optional[str],
+        spread_label: Optional[str],
+        tera_type: Optional[str],
+        moves_mask: Optional[int] = None,
+    ) -> list[tuple[float, list[str]]]:
+        """Every association multiplier with its notes, in compatibility product order."""
+        associations = prior.associations
+        return [
+            (self._move_move_multiplier(associations.move_move_index, moves), []),
+            (self._move_item_multiplier(associations.move_item_index, moves, item), []),
+            (self._move_ability_multiplier(associations.move_ability_index, moves, ability), []),
+            (self._item_spread_multiplier(associations.item_spread_index, item, spread_label), []),
+            self._compute_contradiction_penalty(moves=moves, item=item, moves_mask=moves_mask),
+            self._compute_revealed_move_family_nudge(moves=moves, item=item, tera_type=tera_type),
+            self._compute_move_item_signal_override(moves=moves, item=item),
+            self._compute_tera_compatibility(prior=prior, moves=moves, tera_type=tera_type, item=item),
+        ]
 
-        tera_compatibility, tera_notes = self._compute_tera_compatibility(
+    def _compute_association_compatibility(
+        self,
+        *,
+        prior: SpeciesPrior,
+        moves: list[str],
+        item: Optional[str],
+        ability: Optional[str],
+        spread_label: Optional[str],
+        tera_type: Optional[str],
+        moves_mask: Optional[int] = None,
+    ) -> tuple[float, list[str]]:
+        terms = self._association_terms(
             prior=prior,
             moves=moves,
-            tera_type=tera_type,
             item=item,
+            ability=ability,
+            spread_label=spread_label,
+            tera_type=tera_type,
+            moves_mask=moves_mask,
         )
-
-        compatibility_weight = (
-            move_move_multiplier
-            * move_item_multiplier
-            * move_ability_multiplier
-            * item_spread_multiplier
-            * contradiction_penalty
-            * revealed_move_nudge
-            * move_item_override
-            * tera_compatibility
-        )
-    
-
-        notes.append(
+        (
+            move_move_multiplier,
+            move_item_multiplier,
+            move_ability_multiplier,
+            item_spread_multiplier,
+            contradiction_penalty,
+            revealed_move_nudge,
+            move_item_override,
+            tera_compatibility,
+        ) = (multiplier for multiplier, _ in terms)
+        compatibility_weight = math.prod(multiplier for multiplier, _ in terms)
+
+        notes = [
             f"Association compatibility -> move_move={move_move_multiplier:.3f}, "
             f"move_item={move_item_multiplier:.3f}, "
             f"move_ability={move_ability_multiplier:.3f}, "
@@ -555,27 +852,20 @@ class CandidateBuilder:
             f"revealed_move_nudge={revealed_move_nudge:.3f}, "
             f"move_item_override={move_item_override:.3f}, "
             f"tera_compatibility={tera_compatibility:.3f}."
-        )
-        notes.extend(contradiction_notes)
-        notes.extend(revealed_move_notes)
-        notes.extend(move_item_override_notes)
-        notes.extend(tera_notes)
+        ]
+        for _, term_notes in terms:
+            notes.extend(term_notes)
 
         return compatibility_weight, notes
-    
+
     def _apply_consistency_checks(
         self,
         *,
         candidate: CandidateSet,
-        revealed_moves: list[str],
-        constraints: list[CandidateConstraint],
+        checks: CompiledChecks,
+        moves_mask: Optional[int] = None,
     ) -> CandidateSet:
-        results = [check_revealed_moves(candidate, revealed_moves)]
-
-        for constraint in constraints:
-            results.append(check_constraint(candidate, constraint))
-
-        combined = combine_check_results(results)
+        combined = checks.check(candidate, moves_mask)
 
         compatibility_weight = candidate.compatibility_weight
         elimination_reasons = list(candidate.elimination_reasons)
@@ -591,12 +881,14 @@ class CandidateBuilder:
             elimination_reasons.extend(combined.reasons)
 
         final_weight = 0.0
+        log_weight = NEG_INF
         if not elimination_reasons:
             final_weight = (
                 candidate.prior_weight
                 * compatibility_weight
                 * candidate.evidence_weight
             )
+            log_weight = candidate.log_final_weight + to_log_weight(combined.multiplier)
 
         return CandidateSet(
             species=candidate.species,
@@ -613,6 +905,7 @@ class CandidateBuilder:
             compatibility_weight=compatibility_weight,
             evidence_weight=candidate.evidence_weight,
             final_weight=final_weight,
+            log_weight=log_weight,
             source=candidate.source,
             confirmed_moves=list(candidate.confirmed_moves),
             assumed_moves=list(candidate.assumed_moves),
@@ -648,7 +941,16 @@ class CandidateBuilder:
         revealed_moves: list[str],
         max_moves: int,
         max_variants: int,
+        move_move_index: Optional[dict] = None,
     ) -> list[MoveVariant]:
+        """
+        The `max_variants` best movesets that keep every revealed move.
+
+        Open slots are filled from the whole move pool. Variants are ranked by
+        product move weight times the move-move association multiplier (when
+        `move_move_index` is given); ties keep combination order. The variant
+        weight itself stays the product move weight.
+        """
         revealed = list(dict.fromkeys(revealed_moves))
         if len(revealed) >= max_moves:
             trimmed = tuple(revealed[:max_moves])
@@ -657,51 +959,107 @@ class CandidateBuilder:
         move_pool = [name for name, _ in move_values if name not in revealed]
         slots_remaining = max_moves - len(revealed)
 
-        if slots_remaining <= 0:
-            fixed = tuple(revealed[:max_moves])
-            return [MoveVariant(moves=fixed, weight=self._moves_weight(move_values, list(fixed)))]
-
-        bounded_pool = move_pool[: max(slots_remaining + 2, slots_remaining)]
-
-        variants: list[MoveVariant] = []
-
-        if len(bounded_pool) < slots_remaining:
-            combined = tuple((revealed + bounded_pool)[:max_moves])
+        if len(move_pool) < slots_remaining:
+            combined = tuple((revealed + move_pool)[:max_moves])
             return [MoveVariant(moves=combined, weight=self._moves_weight(move_values, list(combined)))]
 
-        for combo in combinations(bounded_pool, slots_remaining):
-            moves = tuple(revealed + list(combo))
-            variants.append(
-                MoveVariant(
-                    moves=moves,
-                    weight=self._moves_weight(move_values, list(moves)),
-                )
-            )
+        move_weight_map = dict(move_values)
 
-        if not variants:
-            fallback = tuple((revealed + bounded_pool)[:max_moves])
-            variants.append(
-                MoveVariant(
-                    moves=fallback,
-                    weight=self._moves_weight(move_values, list(fallback)),
-                )
+        def weight_of(moves: tuple[str, ...]) -> float:
+            # Same multiplication order as _moves_weight, so weights match it exactly.
+            total = 1.0
+            for move in moves:
+                total *= move_weight_map.get(move, 1.0)
+            return total
+
+        def score_of(moves: tuple[str, ...], weight: float) -> float:
+            if move_move_index is None:
+                return weight
+            return weight * self._move_move_multiplier(move_move_index, list(moves))
+
+        ranked = [
+            (score_of(moves, weight), combo, moves, weight)
+            for combo, moves, weight in self._best_move_combinations(
+                move_pool=move_pool,
+                revealed=tuple(revealed),
+                slots=slots_remaining,
+                count=max_variants,
+                weight_of=weight_of,
+                score_of=score_of,
+                max_score_factor=1.0 if move_move_index is None else _MOVE_MOVE_HIGH,
             )
+        ]
+        ranked.sort(key=lambda entry: (-entry[0], entry[1]))
 
-        variants.sort(key=lambda variant: variant.weight, reverse=True)
-
-        diverse: list[MoveVariant] = []
-        seen_move_sets: set[tuple[str, ...]] = set()
+        return [MoveVariant(moves=moves, weight=weight) for _, _, moves, weight in ranked[:max_variants]]
 
-        for variant in variants:
-            normalized_moves = tuple(variant.moves)
-            if normalized_moves in seen_move_sets:
-                continue
-            seen_move_sets.add(normalized_moves)
-            diverse.append(variant)
-            if len(diverse) >= max_variants:
+    def _best_move_combinations(
+        self,
+        *,
+        move_pool: list[str],
+        revealed: tuple[str, ...],
+        slots: int,
+        count: int,
+        weight_of: Callable[[tuple[str, ...]], float],
+        score_of: Callable[[tuple[str, ...], float], float],
+        max_score_factor: float,
+    ) -> Iterator[tuple[tuple[int, ...], tuple[str, ...], float]]:
+        """
+        Lazily visit slot combinations (pool index tuples) until the top `count` scores are settled.
+
+        The pool is sorted by move weight, so product weight never increases
+        from a combination to any successor that moves one index one step
+        later, and a heap over index tuples yields combinations in
+        non-increasing product order. A score is at most product times
+        `max_score_factor`; once that bound for the next combination is
+        strictly below the `count`-th best score nothing unvisited can enter
+        (or tie into) the result. Falls back to every combination when some
+        move weight is negative.
+        """
+        pool_weights = [weight_of((move,)) for move in move_pool]
+        if any(weight < 0 for weight in pool_weights):
+            for combo in combinations(range(len(move_pool)), slots):
+                moves = revealed + tuple(move_pool[index] for index in combo)
+                yield combo, moves, weight_of(moves)
+            return
+
+        order = sorted(range(len(move_pool)), key=lambda index: -pool_weights[index])
+
+        def visit(point: tuple[int, ...]) -> tuple[tuple[int, ...], tuple[str, ...], float]:
+            combo = tuple(sorted(order[position] for position in point))
+            moves = revealed + tuple(move_pool[index] for index in combo)
+            return combo, moves, weight_of(moves)
+
+        def bound(weight: float) -> float:
+            # Slack so float rounding never makes the bound undercut an exact score.
+            return weight * max_score_factor * (1.0 + 1e-9)
+
+        origin = tuple(range(slots))
+        first = visit(origin)
+        heap = [(-first[2], origin, first)]
+        seen = {origin}
+        best_scores: list[float] = []
+
+        while heap:
+            _, point, visited = heapq.heappop(heap)
+            if len(best_scores) >= count and bound(visited[2]) < best_scores[0]:
                 break
-
-        return diverse[:max_variants]
+            yield visited
+
+            score = score_of(visited[1], visited[2])
+            if len(best_scores) < count:
+                heapq.heappush(best_scores, score)
+            elif score > best_scores[0]:
+                heapq.heapreplace(best_scores, score)
+
+            for slot in range(slots):
+                limit = point[slot + 1] if slot + 1 < slots else len(move_pool)
+                if point[slot] + 1 < limit:
+                    successor = point[:slot] + (point[slot] + 1,) + point[slot + 1 :]
+                    if successor not in seen:
+                        seen.add(successor)
+                        successor_visit = visit(successor)
+                        heapq.heappush(heap, (-successor_visit[2], successor, successor_visit))
 
     def _top_item_values(
         self,
@@ -795,19 +1153,22 @@ class CandidateBuilder:
         move_part = "-".join(moves[:3]) if moves else "no-moves"
         return f"{species}|{item_part}|{ability_part}|{tera_part}|{spread_label}|{move_part}"
 
+    def _dedupe_key(self, candidate: CandidateSet) -> tuple:
+        return (
+            candidate.species,
+            tuple(candidate.moves),
+            candidate.item,
+            candidate.ability,
+            candidate.tera_type,
+            candidate.spread_label,
+        )
+
     def _dedupe_candidates(self, candidates: list[CandidateSet]) -> list[CandidateSet]:
         seen: set[tuple] = set()
         deduped: list[CandidateSet] = []
 
         for candidate in candidates:
-            key = (
-                candidate.species,
-                tuple(candidate.moves),
-                candidate.item,
-                candidate.ability,
-                candidate.tera_type,
-                candidate.spread_label,
-            )
+            key = self._dedupe_key(candidate)
             if key in seen:
                 continue
             seen.add(key)
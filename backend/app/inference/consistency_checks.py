@@ -1,24 +1,41 @@
 from __future__ import annotations
 
+from typing import Iterable, NamedTuple, Optional
+
+from app.domain.symbols import ABILITIES, ITEMS, MOVES, SPECIES, TYPES
 from app.inference.models import CandidateCheckResult, CandidateConstraint, CandidateSet
 
 
+class CandidateFields(NamedTuple):
+    """The candidate fields constraints are checked against."""
+
+    species: Optional[str]
+    item: Optional[str]
+    ability: Optional[str]
+    tera_type: Optional[str]
+
+
 def _normalized(value: str | None) -> str:
     return (value or "").strip().lower()
 
 
-def check_constraint(candidate: CandidateSet, constraint: CandidateConstraint) -> CandidateCheckResult:
-    expected = _normalized(constraint.expected_value)
-
+def check_constraint(
+    candidate: CandidateSet | CandidateFields,
+    constraint: CandidateConstraint,
+) -> CandidateCheckResult:
     field_value: str | None
     if constraint.field_name == "item":
         field_value = candidate.item
+        symbols = ITEMS
     elif constraint.field_name == "ability":
         field_value = candidate.ability
+        symbols = ABILITIES
     elif constraint.field_name == "tera_type":
         field_value = candidate.tera_type
+        symbols = TYPES
     elif constraint.field_name == "species":
         field_value = candidate.species
+        symbols = SPECIES
     else:
         return CandidateCheckResult(
             decision="keep",
@@ -26,9 +43,7 @@ def check_constraint(candidate: CandidateSet, constraint: CandidateConstraint) -
             reasons=[f"Unknown constraint field '{constraint.field_name}' was ignored."],
         )
 
-    actual = _normalized(field_value)
-
-    if not actual:
+    if not symbols.key(field_value):
         if constraint.hard:
             return CandidateCheckResult(
                 decision="downweight",
@@ -45,7 +60,7 @@ def check_constraint(candidate: CandidateSet, constraint: CandidateConstraint) -
             ],
         )
 
-    if actual == expected:
+    if symbols.same(field_value, constraint.expected_value):
         return CandidateCheckResult(
             decision="keep",
             multiplier=1.0,
@@ -72,18 +87,62 @@ def check_constraint(candidate: CandidateSet, constraint: CandidateConstraint) -
     )
 
 
-def check_revealed_moves(candidate: CandidateSet, revealed_moves: list[str]) -> CandidateCheckResult:
-    normalized_candidate_moves = {_normalized(move) for move in candidate.moves}
-    normalized_revealed = [_normalized(move) for move in revealed_moves if _normalized(move)]
+def move_bit(move: str | None) -> int:
+    """Bit of a known move in moveset masks (even bits by move symbol); 0 for names not in the move table."""
+    symbol = MOVES.lookup(move)
+    return 0 if symbol is None else 1 << (2 * symbol)
+
+
+def move_mask(moves: Iterable[str]) -> int:
+    """Mask of the known moves among `moves`."""
+    mask = 0
+    for move in moves:
+        mask |= move_bit(move)
+    return mask
+
+
+def move_family_mask(moves: Iterable[str]) -> int:
+    """Mask of a fixed move family defined in code; its names are interned so they always have a bit."""
+    return move_mask(name for name in moves if MOVES.intern(name) is not None)
+
+
+class MoveBits:
+    """
+    Moveset mask bits for one build.
+
+    Known moves use their global even bit (move_bit). Names missing from the
+    move table, such as made-up revealed moves in a request, get odd bits local
+    to this instance, keyed by normalized name, so request input never grows
+    the process-wide symbol table.
+    """
+
+    def __init__(self) -> None:
+        self._unknown: dict[str, int] = {}
+
+    def bit(self, move: str | None) -> int:
+        symbol = MOVES.lookup(move)
+        if symbol is not None:
+            return 1 << (2 * symbol)
+        index = self._unknown.setdefault(MOVES.key(move), len(self._unknown))
+        return 1 << (2 * index + 1)
 
-    if not normalized_revealed:
+    def mask(self, moves: Iterable[str]) -> int:
+        mask = 0
+        for move in moves:
+            mask |= self.bit(move)
+        return mask
+
+
+def _revealed_moves_result(revealed: list[tuple[str, int]], covered_mask: int) -> CandidateCheckResult:
+    """Coverage check for normalized revealed moves and their bits, given the bits a candidate covers."""
+    if not revealed:
         return CandidateCheckResult(
             decision="keep",
             multiplier=1.0,
             reasons=["No revealed move evidence was provided."],
         )
 
-    missing = [move for move in normalized_revealed if move not in normalized_candidate_moves]
+    missing = [normalized for normalized, bit in revealed if not bit & covered_mask]
 
     if not missing:
         return CandidateCheckResult(
@@ -92,7 +151,7 @@ def check_revealed_moves(candidate: CandidateSet, revealed_moves: list[str]) ->
             reasons=["Candidate fully covers all revealed moves."],
         )
 
-    if len(missing) == len(normalized_revealed):
+    if len(missing) == len(revealed):
         return CandidateCheckResult(
             decision="downweight",
             multiplier=0.20,
@@ -102,8 +161,8 @@ def check_revealed_moves(candidate: CandidateSet, revealed_moves: list[str]) ->
             ],
         )
 
-    covered = len(normalized_revealed) - len(missing)
-    coverage_ratio = covered / max(1, len(normalized_revealed))
+    covered = len(revealed) - len(missing)
+    coverage_ratio = covered / max(1, len(revealed))
 
     if coverage_ratio >= 0.75:
         multiplier = 0.80
@@ -116,12 +175,21 @@ def check_revealed_moves(candidate: CandidateSet, revealed_moves: list[str]) ->
         decision="downweight",
         multiplier=multiplier,
         reasons=[
-            f"Candidate only partially covers revealed moves ({covered}/{len(normalized_revealed)}).",
+            f"Candidate only partially covers revealed moves ({covered}/{len(revealed)}).",
             f"Missing revealed moves: {', '.join(missing)}.",
         ],
     )
 
 
+def _compile_revealed(revealed_moves: list[str], move_bits: MoveBits) -> list[tuple[str, int]]:
+    return [(_normalized(move), move_bits.bit(move)) for move in revealed_moves if _normalized(move)]
+
+
+def check_revealed_moves(candidate: CandidateSet, revealed_moves: list[str]) -> CandidateCheckResult:
+    move_bits = MoveBits()
+    return _revealed_moves_result(_compile_revealed(revealed_moves, move_bits), move_bits.mask(candidate.moves))
+
+
 def combine_check_results(results: list[CandidateCheckResult]) -> CandidateCheckResult:
     if not results:
         return CandidateCheckResult(
@@ -155,4 +223,46 @@ def combine_check_results(results: list[CandidateCheckResult]) -> CandidateCheck
         decision=decision,
         multiplier=multiplier,
         reasons=reasons,
-    )
\ No newline at end of file
+    )
+
+
+class CompiledChecks:
+    """
+    Revealed-move and field constraints compiled once per candidate build.
+
+    Revealed moves become one bitmask (see MoveBits), so coverage is a single
+    AND against the candidate's moveset mask from `move_bits`. Field constraints only
+    depend on species/item/ability/tera, and the candidates of one build share
+    few distinct (coverage, fields) keys, so combined results are computed once
+    per key; callers must not mutate the returned result.
+    """
+
+    def __init__(self, revealed_moves: list[str], constraints: list[CandidateConstraint]) -> None:
+        self.move_bits = MoveBits()
+        self._revealed = _compile_revealed(revealed_moves, self.move_bits)
+        self._revealed_mask = 0
+        for _, bit in self._revealed:
+            self._revealed_mask |= bit
+        self._constraints = list(constraints)
+        self._results: dict[tuple, CandidateCheckResult] = {}
+
+    def check(self, candidate: CandidateSet, moves_mask: int | None = None) -> CandidateCheckResult:
+        """check_revealed_moves and every check_constraint for `candidate`, combined."""
+        if moves_mask is None:
+            moves_mask = self.move_bits.mask(candidate.moves)
+        return self.check_fields(
+            CandidateFields(candidate.species, candidate.item, candidate.ability, candidate.tera_type),
+            moves_mask,
+        )
+
+    def check_fields(self, fields: CandidateFields, moves_mask: int) -> CandidateCheckResult:
+        """Same as check() for a combination that has not been built into a CandidateSet."""
+        covered_mask = moves_mask & self._revealed_mask
+        key = (covered_mask, *fields)
+
+        result = self._results.get(key)
+        if result is None:
+            results = [_revealed_moves_result(self._revealed, covered_mask)]
+            results.extend(check_constraint(fields, constraint) for constraint in self._constraints)
+            result = self._results[key] = combine_check_results(results)
+        return result
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import astuple
+from typing import Callable, Hashable
+
+from app.inference.candidate_builder import CandidateBuilder
+from app.inference.models import InferenceEvidence, InferenceResult
+from app.providers.data_registry import get_registry
+from app.providers.meta_provider import MetaProvider, MetaQuery
+
+
+DEFAULT_INFERENCE_CACHE_ENTRIES = int(os.environ.get("ESPURR_INFERENCE_CACHE_ENTRIES", "2048"))
+
+
+def inference_cache_key(
+    species: str,
+    evidence: InferenceEvidence,
+    *,
+    meta_provider: MetaProvider,
+    candidate_builder: CandidateBuilder,
+    query: MetaQuery,
+) -> Hashable:
+    """
+    Everything infer_pokemon_state's output depends on for one Pokemon.
+
+    Revealed moves keep their reveal order: candidate construction seeds move
+    variants from them in order, so a different order can give different sets.
+    """
+    return (
+        type(meta_provider),
+        meta_provider.base_dir,
+        query,
+        species,
+        evidence,
+        type(candidate_builder),
+        astuple(candidate_builder.config),
+    )
+
+
+class InferenceCache:
+    """
+    LRU of inference results shared across requests.
+
+    Results are deep-copied on the way in and out, so callers may mutate what
+    they get back (e.g. when applying evidence) without touching the cache.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_INFERENCE_CACHE_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, InferenceResult]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, compute: Callable[[], InferenceResult]) -> InferenceResult:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return copy.deepcopy(cached)
+            self.misses += 1
+
+        # Computed outside the lock; concurrent misses on one key both compute
+        # the same deterministic result and the later store wins.
+        result = compute()
+        with self._lock:
+            self._entries[key] = copy.deepcopy(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def get_inference_cache() -> InferenceCache:
+    """Inference results for the active data version; a reload starts a fresh cache."""
+    return get_registry().derived("inference_cache", InferenceCache)
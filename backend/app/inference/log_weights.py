@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+
+NEG_INF = float("-inf")
+
+
+def to_log_weight(weight: float) -> float:
+    """log(weight), with non-positive weights mapped to -inf (zero probability)."""
+    return math.log(weight) if weight > 0.0 else NEG_INF
+
+
+def log_sum_exp(log_weights: Iterable[float]) -> float:
+    """log(sum(exp(w))) without overflow or underflow; -inf for an empty or all -inf input."""
+    log_weights = list(log_weights)
+    peak = max(log_weights, default=NEG_INF)
+    if peak == NEG_INF:
+        return NEG_INF
+    return peak + math.log(sum(math.exp(weight - peak) for weight in log_weights))
+
+
+def log_normalize(log_weights: Iterable[float]) -> list[float]:
+    """Shift log-weights so they log-sum-exp to zero; all -inf stays all -inf."""
+    log_weights = list(log_weights)
+    total = log_sum_exp(log_weights)
+    if total == NEG_INF:
+        return [NEG_INF] * len(log_weights)
+    return [weight - total for weight in log_weights]
+
+
+def normalize_log_weights(log_weights: Iterable[float]) -> list[float]:
+    """
+    Probabilities proportional to exp(log_weights).
+
+    Works for scores far below the float range (e.g. products of thousands of
+    small factors); if every weight is -inf all probabilities are zero.
+    """
+    return [math.exp(weight) for weight in log_normalize(log_weights)]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, List, Literal, Optional
 
+from app.inference.log_weights import normalize_log_weights, to_log_weight
+
 
 ResponseKind = Literal["move", "switch"]
 EvidenceDecision = Literal["keep", "downweight", "eliminate"]
@@ -46,6 +49,37 @@ class PairAssociations:
     item_spread: List[WeightedPair] = field(default_factory=list)
     ability_tera: List[WeightedPair] = field(default_factory=list)
 
+    # Lookup indexes are built on first use and live as long as the prior, so
+    # candidate scoring does O(1) dict lookups instead of scanning pair lists.
+
+    @cached_property
+    def move_move_index(self) -> Dict[tuple[str, str], float]:
+        """Max weight per unordered move pair, stored under both orders."""
+        return _max_weight_index(self.move_move, symmetric=True)
+
+    @cached_property
+    def move_item_index(self) -> Dict[tuple[str, str], float]:
+        return _max_weight_index(self.move_item)
+
+    @cached_property
+    def move_ability_index(self) -> Dict[tuple[str, str], float]:
+        return _max_weight_index(self.move_ability)
+
+    @cached_property
+    def item_spread_index(self) -> Dict[tuple[str, str], float]:
+        return _max_weight_index(self.item_spread)
+
+
+def _max_weight_index(pairs: List[WeightedPair], symmetric: bool = False) -> Dict[tuple[str, str], float]:
+    index: Dict[tuple[str, str], float] = {}
+    for pair in pairs:
+        keys = [(pair.left, pair.right)]
+        if symmetric:
+            keys.append((pair.right, pair.left))
+        for key in keys:
+            index[key] = max(index.get(key, 0.0), pair.weight)
+    return index
+
 
 @dataclass(frozen=True)
 class SpeciesPrior:
@@ -129,6 +163,9 @@ class CandidateSet:
     compatibility_weight: float = 1.0
     evidence_weight: float = 1.0
     final_weight: float = 0.0
+    # Log of final_weight, carried separately so long products of small
+    # factors keep their precision; None means "derive from final_weight".
+    log_weight: Optional[float] = None
 
     source: str = "meta_provider"
 
@@ -143,6 +180,55 @@ class CandidateSet:
     def is_eliminated(self) -> bool:
         return bool(self.elimination_reasons)
 
+    @property
+    def log_final_weight(self) -> float:
+        return self.log_weight if self.log_weight is not None else to_log_weight(self.final_weight)
+
+
+@dataclass(frozen=True)
+class InferenceDelta:
+    """New evidence about one Pokemon since its last inference."""
+
+    revealed_move: Optional[str] = None
+    item: Optional[str] = None
+    ability: Optional[str] = None
+    tera_type: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class InferenceEvidence:
+    """Everything an InferenceResult was inferred from, so it can be updated incrementally."""
+
+    revealed_moves: tuple[str, ...] = ()
+    item: Optional[str] = None
+    ability: Optional[str] = None
+    tera_type: Optional[str] = None
+
+    def new_steps(self, delta: InferenceDelta) -> list[tuple[str, str]]:
+        """(kind, value) pairs of `delta` not already part of this evidence."""
+        steps = []
+        if delta.revealed_move and delta.revealed_move not in self.revealed_moves:
+            steps.append(("move", delta.revealed_move))
+        for kind, current, value in (
+            ("item", self.item, delta.item),
+            ("ability", self.ability, delta.ability),
+            ("tera", self.tera_type, delta.tera_type),
+        ):
+            if value and value != current:
+                steps.append((kind, value))
+        return steps
+
+    def with_delta(self, delta: InferenceDelta) -> "InferenceEvidence":
+        revealed_moves = self.revealed_moves
+        if delta.revealed_move and delta.revealed_move not in revealed_moves:
+            revealed_moves = (*revealed_moves, delta.revealed_move)
+        return InferenceEvidence(
+            revealed_moves=revealed_moves,
+            item=delta.item or self.item,
+            ability=delta.ability or self.ability,
+            tera_type=delta.tera_type or self.tera_type,
+        )
+
 
 @dataclass
 class InferenceResult:
@@ -150,13 +236,14 @@ class InferenceResult:
     candidates: List[CandidateSet] = field(default_factory=list)
     confidence_label: str = "unknown"
     notes: List[str] = field(default_factory=list)
+    evidence: Optional[InferenceEvidence] = None
 
     def normalized_weights(self) -> Dict[str, float]:
         viable = [candidate for candidate in self.candidates if not candidate.is_eliminated]
-        total = sum(candidate.final_weight for candidate in viable) or 1.0
+        weights = normalize_log_weights(candidate.log_final_weight for candidate in viable)
         return {
-            candidate.label: candidate.final_weight / total
-            for candidate in viable
+            candidate.label: weight
+            for candidate, weight in zip(viable, weights)
         }
 
 
@@ -1,8 +1,25 @@
 from __future__ import annotations
 
-from app.domain.battle_state import BattleState, PokemonState
+import contextvars
+import math
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.domain.battle_state import BattleState, FormatContext, PokemonState
 from app.inference.candidate_builder import CandidateBuildInput, CandidateBuilder
-from app.inference.models import CandidateBuilderConfig, CandidateSet, InferenceResult
+from app.inference.belief_state import BeliefState
+from app.inference.inference_cache import get_inference_cache, inference_cache_key
+from app.inference.log_weights import NEG_INF, log_normalize
+from app.inference.models import (
+    CandidateBuilderConfig,
+    CandidateSet,
+    InferenceDelta,
+    InferenceEvidence,
+    InferenceResult,
+)
+from app.providers.format_provider import get_format_data
 from app.providers.meta_provider import MetaProvider, MetaQuery
 
 
@@ -21,6 +38,12 @@ SPECIES_FALLBACK_MOVES: dict[str, list[str]] = {
 }
 
 
+TEAM_INFERENCE_WORKERS = int(os.environ.get("ESPURR_INFERENCE_WORKERS", "4"))
+
+_team_executor: ThreadPoolExecutor | None = None
+_team_executor_lock = threading.Lock()
+
+
 DEFAULT_META_QUERY = MetaQuery(
     format_id="gen9ou",
     generation=9,
@@ -29,6 +52,33 @@ DEFAULT_META_QUERY = MetaQuery(
 )
 
 
+def meta_query_for_format(format_context: FormatContext | None) -> MetaQuery:
+    """
+    Meta query selected by a battle's format context.
+
+    The format name is compacted to a Showdown-style id ("Gen 9 OU" -> "gen9ou");
+    "manual" or blank formats fall back to DEFAULT_META_QUERY's format. Rating
+    bucket and month window default to DEFAULT_META_QUERY's when not given.
+    """
+    if format_context is None:
+        return DEFAULT_META_QUERY
+
+    format_id = re.sub(r"[^a-z0-9]", "", (format_context.format_name or "").lower())
+    if format_id in {"", "manual"}:
+        format_id = DEFAULT_META_QUERY.format_id
+        generation = DEFAULT_META_QUERY.generation
+    else:
+        format_data = get_format_data(format_id) or {}
+        generation = int(format_data.get("generation") or format_context.generation)
+
+    return MetaQuery(
+        format_id=format_id,
+        generation=generation,
+        rating_bucket=format_context.rating_bucket or DEFAULT_META_QUERY.rating_bucket,
+        month_window=format_context.month_window or DEFAULT_META_QUERY.month_window,
+    )
+
+
 def _merge_revealed_moves(base_moves: list[str], revealed_moves: list[str]) -> list[str]:
     merged = list(base_moves)
     for revealed_move in revealed_moves:
@@ -88,12 +138,13 @@ def _build_placeholder_candidate(pokemon: PokemonState) -> CandidateSet:
 
 
 def _normalize_candidates(candidates: list[CandidateSet]) -> list[CandidateSet]:
-    viable = [candidate for candidate in candidates if not candidate.is_eliminated]
-    total = sum(max(0.0, candidate.final_weight) for candidate in viable) or 1.0
+    log_weights = log_normalize(
+        NEG_INF if candidate.is_eliminated else candidate.log_final_weight
+        for candidate in candidates
+    )
 
     normalized: list[CandidateSet] = []
-    for candidate in candidates:
-        final_weight = 0.0 if candidate.is_eliminated else max(0.0, candidate.final_weight) / total
+    for candidate, log_weight in zip(candidates, log_weights):
         normalized.append(
             CandidateSet(
                 species=candidate.species,
@@ -109,7 +160,8 @@ def _normalize_candidates(candidates: list[CandidateSet]) -> list[CandidateSet]:
                 prior_weight=candidate.prior_weight,
                 compatibility_weight=candidate.compatibility_weight,
                 evidence_weight=candidate.evidence_weight,
-                final_weight=final_weight,
+                final_weight=math.exp(log_weight),
+                log_weight=log_weight,
                 source=candidate.source,
                 confirmed_moves=list(candidate.confirmed_moves),
                 assumed_moves=list(candidate.assumed_moves),
@@ -128,6 +180,7 @@ def _build_from_provider(
     meta_provider: MetaProvider,
     candidate_builder: CandidateBuilder,
     query: MetaQuery,
+    evidence: InferenceEvidence,
 ) -> InferenceResult | None:
     species = pokemon.species
     if not species:
@@ -142,6 +195,9 @@ def _build_from_provider(
             species=species,
             prior=species_prior,
             revealed_moves=list(pokemon.revealed_moves),
+            confirmed_item=evidence.item,
+            confirmed_ability=evidence.ability,
+            confirmed_tera_type=evidence.tera_type,
         )
     )
 
@@ -193,15 +249,66 @@ def infer_opposing_active_set(
         state.opponent_side.active,
         meta_provider=meta_provider,
         candidate_builder=candidate_builder,
+        query=meta_query_for_format(state.format_context),
     )
 
 
+def _team_inference_executor() -> ThreadPoolExecutor:
+    global _team_executor
+    with _team_executor_lock:
+        if _team_executor is None:
+            _team_executor = ThreadPoolExecutor(
+                max_workers=TEAM_INFERENCE_WORKERS,
+                thread_name_prefix="team-inference",
+            )
+        return _team_executor
+
+
+def infer_opposing_team(
+    state: BattleState,
+    *,
+    meta_provider: MetaProvider | None = None,
+    candidate_builder: CandidateBuilder | None = None,
+) -> dict[str, InferenceResult]:
+    """
+    Inference for every revealed opposing Pokemon (active and bench), keyed by species.
+
+    Members are inferred concurrently on a shared worker pool. Each task runs in
+    a copy of the caller's context, so a request pinned to a data version infers
+    the whole team against that version. Results come from the cross-request
+    inference cache when the same evidence was seen before.
+    """
+    query = meta_query_for_format(state.format_context)
+    members: dict[str, PokemonState] = {}
+    for pokemon in [state.opponent_side.active, *state.opponent_side.bench]:
+        if pokemon.species and pokemon.species not in members:
+            members[pokemon.species] = pokemon
+
+    executor = _team_inference_executor()
+    futures = {
+        species: executor.submit(
+            contextvars.copy_context().run,
+            infer_pokemon_state,
+            pokemon,
+            meta_provider=meta_provider,
+            candidate_builder=candidate_builder,
+            query=query,
+        )
+        for species, pokemon in members.items()
+    }
+    return {species: future.result() for species, future in futures.items()}
+
+
 def infer_pokemon_state(
     pokemon: PokemonState,
     *,
     meta_provider: MetaProvider | None = None,
     candidate_builder: CandidateBuilder | None = None,
     query: MetaQuery = DEFAULT_META_QUERY,
+    use_cache: bool = True,
+    confirmed_item: str | None = None,
+    confirmed_ability: str | None = None,
+    confirmed_tera_type: str | None = None,
 ) -> InferenceResult:
     species = pokemon.species
 
@@ -214,19 +321,98 @@ def infer_pokemon_state(
         )
 
     builder = candidate_builder or CandidateBuilder(CandidateBuilderConfig())
+    evidence = InferenceEvidence(
+        revealed_moves=tuple(dict.fromkeys(pokemon.revealed_moves)),
+        item=confirmed_item,
+        ability=confirmed_ability,
+        tera_type=confirmed_tera_type,
+    )
+
+    def infer() -> InferenceResult:
+        return _infer_from_evidence(
+            pokemon,
+            meta_provider=meta_provider,
+            candidate_builder=builder,
+            query=query,
+            evidence=evidence,
+        )
+
+    if meta_provider is None or not use_cache:
+        return infer()
+
+    key = inference_cache_key(species, evidence, meta_provider=meta_provider, candidate_builder=builder, query=query)
+    return get_inference_cache().get(key, infer)
+
+
+def update_inference(
+    previous: InferenceResult,
+    delta: InferenceDelta,
+    *,
+    meta_provider: MetaProvider | None = None,
+    candidate_builder: CandidateBuilder | None = None,
+    query: MetaQuery = DEFAULT_META_QUERY,
+) -> InferenceResult:
+    """
+    Update `previous` with newly revealed evidence instead of re-inferring from scratch.
+
+    When every new piece of evidence is already held by some viable candidate,
+    it is applied to the existing distribution with belief-updater rules.
+    Otherwise the pool cannot represent it and the Pokemon is re-inferred from
+    its priors with all evidence so far.
+    """
+    evidence = previous.evidence or InferenceEvidence()
+    steps = evidence.new_steps(delta)
+    if not steps:
+        return previous
+
+    updated_evidence = evidence.with_delta(delta)
+    belief = BeliefState.from_inference(previous)
+    if previous.species and all(belief.covers(kind, value) for kind, value in steps):
+        for kind, value in steps:
+            belief.apply(kind, value)
+        updated = belief.to_inference()
+        updated.evidence = updated_evidence
+        updated.notes.append("Incremental update: the existing candidate pool covers the new evidence.")
+        return updated
+
+    rebuilt = infer_pokemon_state(
+        PokemonState(species=previous.species, types=[], revealed_moves=list(updated_evidence.revealed_moves)),
+        meta_provider=meta_provider,
+        candidate_builder=candidate_builder,
+        query=query,
+        confirmed_item=updated_evidence.item,
+        confirmed_ability=updated_evidence.ability,
+        confirmed_tera_type=updated_evidence.tera_type,
+    )
+    rebuilt.notes.append("Candidate pool did not cover the new evidence, so the set was re-inferred from priors.")
+    return rebuilt
+
+
+def _infer_from_evidence(
+    pokemon: PokemonState,
+    *,
+    meta_provider: MetaProvider | None,
+    candidate_builder: CandidateBuilder,
+    query: MetaQuery,
+    evidence: InferenceEvidence,
+) -> InferenceResult:
+    species = pokemon.species
 
     if meta_provider is not None:
         provider_result = _build_from_provider(
             pokemon,
             meta_provider=meta_provider,
-            candidate_builder=builder,
+            candidate_builder=candidate_builder,
             query=query,
+            evidence=evidence,
         )
         if provider_result is not None:
+            provider_result.evidence = evidence
             return provider_result
 
     species_fallback_result = _build_from_species_fallback(pokemon)
     if species_fallback_result is not None:
+        species_fallback_result.evidence = evidence
         return species_fallback_result
 
     placeholder_candidate = _build_placeholder_candidate(pokemon)
@@ -239,4 +425,5 @@ def infer_pokemon_state(
             "Placeholder candidate preserves revealed moves only.",
             "Provider data is missing for this species and no species fallback applied.",
         ],
+        evidence=evidence,
     )
\ No newline at end of file
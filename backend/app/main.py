@@ -1,12 +1,42 @@
-from fastapi import FastAPI
+import os
+import threading
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.providers.data_registry import pinned_registry
+from app.routes.admin_routes import router as admin_router
 from app.routes.battle_routes import router as battle_router
 from app.routes.data_routes import router as data_router
 from app.routes.health_routes import router as health_router
 from app.routes.type_routes import router as type_router
+from app.services.data_reload import get_data_reloader
+from app.services.warmup import get_readiness
+
+DATA_VERSION_HEADER = "X-Data-Version"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Preload data and run a synthetic evaluation off the event loop; /health
+    # answers 503 "warming" until it finishes.
+    get_readiness().start()
+
+    # Opt-in file watcher: reload canonical/meta data when it changes on disk.
+    stop_watching = threading.Event()
+    if os.environ.get("ESPURR_WATCH_DATA") == "1":
+        threading.Thread(
+            target=get_data_reloader().watch,
+            args=(stop_watching,),
+            name="data-watch",
+            daemon=True,
+        ).start()
+    yield
+    stop_watching.set()
 
-app = FastAPI(title="Pokemon Decision Engine API")
+
+app = FastAPI(title="Pokemon Decision Engine API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -14,9 +44,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[DATA_VERSION_HEADER],
 )
 
+
+@app.middleware("http")
+async def pin_data_version(request: Request, call_next):
+    # Each request reads one data version end to end, even if a reload swaps mid-request.
+    with pinned_registry() as registry:
+        response = await call_next(request)
+    response.headers[DATA_VERSION_HEADER] = registry.version
+    return response
+
+
 app.include_router(health_router)
 app.include_router(type_router)
 app.include_router(battle_router)
-app.include_router(data_router)
\ No newline at end of file
+app.include_router(data_router)
+app.include_router(admin_router)
\ No newline at end of file
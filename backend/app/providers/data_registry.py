@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from contextlib import contextmanager
+from collections import OrderedDict
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterator, TypeVar
+
+
+DEFAULT_CANONICAL_DIR = Path(__file__).resolve().parents[1] / "data" / "canonical"
+DEFAULT_META_DIR = Path(__file__).resolve().parents[1] / "data" / "meta"
+
+CANONICAL_FILES: tuple[str, ...] = (
+    "species.json",
+    "moves.json",
+    "items.json",
+    "abilities.json",
+    "type_chart.json",
+    "natures.json",
+    "formats.json",
+    "field_effects.json",
+    "statuses.json",
+)
+
+T = TypeVar("T")
+
+
+def _data_files(canonical_dir: Path, meta_dir: Path) -> list[Path]:
+    files = [canonical_dir / filename for filename in CANONICAL_FILES]
+    if meta_dir.exists():
+        files.extend(sorted(path for path in meta_dir.rglob("*") if path.suffix in {".json", ".bin"}))
+    return files
+
+
+def compute_data_version(canonical_dir: Path, meta_dir: Path) -> str:
+    """Content hash of every canonical and meta data file, so identical data gets the same version."""
+    digest = hashlib.sha256()
+    for path in _data_files(canonical_dir, meta_dir):
+        digest.update(str(path.relative_to(path.anchor)).encode("utf-8"))
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        raw = f.read().strip()
+
+    if not raw:
+        raise ValueError(f"Canonical data file is empty: {path}")
+
+    return json.loads(raw)
+
+
+class BoundedMemo:
+    """
+    Thread-safe LRU mapping for hot-path memoization, capped at `maxsize` entries.
+
+    Keys are often built from request data, so the cap keeps a long-lived data
+    version from accumulating them without limit.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return default
+            return self._entries[key]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class DataRegistry:
+    """
+    All canonical and meta data for one data version, plus everything derived from it.
+
+    Canonical files, name indexes, meta snapshots and other derived structures are
+    built at most once per registry under a lock; reads of already-built entries are
+    plain dict lookups. Nothing here is module-global, so a registry can be swapped
+    atomically or built against other directories for an isolated test.
+    """
+
+    def __init__(
+        self,
+        canonical_dir: Path = DEFAULT_CANONICAL_DIR,
+        meta_dir: Path = DEFAULT_META_DIR,
+        version: str | None = None,
+    ) -> None:
+        self.canonical_dir = canonical_dir
+        self.meta_dir = meta_dir
+        self.version = version or compute_data_version(canonical_dir, meta_dir)
+        self._lock = threading.RLock()
+        self._canonical: dict[str, dict[str, Any]] = {}
+        self._derived: dict[Hashable, Any] = {}
+
+    def canonical(self, filename: str) -> dict[str, Any]:
+        data = self._canonical.get(filename)
+        if data is not None:
+            return data
+
+        with self._lock:
+            data = self._canonical.get(filename)
+            if data is None:
+                data = _load_json(self.canonical_dir / filename)
+                self._canonical[filename] = data
+            return data
+
+    def derived(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Build `key` with `factory` once per registry; concurrent callers wait for the first build."""
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = factory()
+            return self._derived[key]
+
+    def memo(self, namespace: str, maxsize: int) -> BoundedMemo:
+        """Per-version bounded LRU for hot-path memoization (stat lines, base stats, ...)."""
+        return self.derived(("memo", namespace), lambda: BoundedMemo(maxsize))
+
+    def preload(self) -> None:
+        for filename in CANONICAL_FILES:
+            self.canonical(filename)
+
+    def close(self) -> None:
+        """Release OS resources (e.g. snapshot file mappings) held by derived structures."""
+        with self._lock:
+            derived = list(self._derived.values())
+        for value in derived:
+            close = getattr(value, "close", None)
+            if callable(close):
+                close()
+
+
+_active_registry: DataRegistry | None = None
+_active_lock = threading.Lock()
+_pinned_registry: ContextVar[DataRegistry | None] = ContextVar("pinned_registry", default=None)
+
+
+def get_registry() -> DataRegistry:
+    """The registry pinned to the current context if any, otherwise the active one."""
+    registry = _pinned_registry.get() or _active_registry
+    if registry is not None:
+        return registry
+
+    with _active_lock:
+        if _active_registry is None:
+            set_registry(DataRegistry())
+        return _active_registry
+
+
+def set_registry(registry: DataRegistry) -> DataRegistry | None:
+    """Make `registry` the active data version and return the one it replaced."""
+    global _active_registry
+    previous = _active_registry
+    _active_registry = registry
+    return previous
+
+
+@contextmanager
+def pinned_registry(registry: DataRegistry | None = None) -> Iterator[DataRegistry]:
+    """
+    Pin a registry (the active one by default) for the current context.
+
+    Work started inside the block keeps reading that data version even if
+    set_registry() swaps in a new one meanwhile.
+    """
+    registry = registry or get_registry()
+    token = _pinned_registry.set(registry)
+    try:
+        yield registry
+    finally:
+        _pinned_registry.reset(token)
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import weakref
+import zlib
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+from app.inference.models import MetaPriorSnapshot, SpeciesPrior
+from app.providers.meta_normalizer import species_prior_from_dict
+
+
+# Layout (little endian):
+#   MAGIC
+#   <II   metadata length, species count
+#   metadata: compact UTF-8 JSON without species_priors, plus "source_sha256"
+#             of the JSON snapshot it was built from
+#   per species: <H name length, UTF-8 name, <QI blob offset (from data start), blob length
+#   data: one zlib-compressed compact JSON blob per species
+MAGIC = b"ESPMETA1"
+_HEADER = struct.Struct("<II")
+_NAME_LEN = struct.Struct("<H")
+_ENTRY = struct.Struct("<QI")
+
+
+def _compact_json(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def source_digest(data: bytes) -> str:
+    """Digest of a JSON snapshot's bytes, recorded in the binary built from it."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def encode_binary_snapshot(snapshot: dict[str, Any], source_sha256: str | None = None) -> bytes:
+    """
+    Encode a normalized snapshot dict (build_meta_snapshot output) into the binary layout.
+
+    `source_sha256` is the digest of the JSON file the snapshot was written to,
+    so loaders can tell when the binary no longer matches it.
+    """
+    metadata = {key: value for key, value in snapshot.items() if key != "species_priors"}
+    if source_sha256 is not None:
+        metadata["source_sha256"] = source_sha256
+    species_priors = dict(snapshot.get("species_priors", {}))
+
+    blobs: list[tuple[bytes, bytes]] = [
+        (name.encode("utf-8"), zlib.compress(_compact_json(payload), 9))
+        for name, payload in species_priors.items()
+    ]
+
+    metadata_bytes = _compact_json(metadata)
+    parts = [MAGIC, _HEADER.pack(len(metadata_bytes), len(blobs)), metadata_bytes]
+
+    offset = 0
+    for name, blob in blobs:
+        parts.append(_NAME_LEN.pack(len(name)))
+        parts.append(name)
+        parts.append(_ENTRY.pack(offset, len(blob)))
+        offset += len(blob)
+
+    parts.extend(blob for _, blob in blobs)
+    return b"".join(parts)
+
+
+def write_binary_snapshot(snapshot: dict[str, Any], path: Path, source_sha256: str | None = None) -> None:
+    """Write via a temp file and rename, so live memory maps of the old file stay valid."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(encode_binary_snapshot(snapshot, source_sha256))
+    os.replace(tmp_path, path)
+
+
+def _close_mapping(buffer: mmap.mmap, file) -> None:
+    buffer.close()
+    file.close()
+
+
+class BinarySnapshotReader:
+    """
+    Memory-mapped reader for a binary meta snapshot.
+
+    Only the header and offset table are parsed on open; each species blob is
+    inflated and decoded the first time it is requested and memoized after that.
+
+    close() releases the mapping and file descriptor (a finalizer does the same
+    if the reader is dropped unclosed). Already decoded priors stay readable, and
+    a closed reader remaps the file if a new species is requested, so snapshots
+    still held by in-flight requests keep working after eviction.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._decoded: dict[str, SpeciesPrior] = {}
+        self._offsets: dict[str, tuple[int, int]] = {}
+        self._open()
+        self.mapped_bytes = len(self._mmap)
+        self.metadata = self._read_header()
+
+    def _open(self) -> None:
+        file = self.path.open("rb")
+        try:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            file.close()
+            raise
+        self._finalizer = weakref.finalize(self, _close_mapping, self._mmap, file)
+
+    def _reopen(self) -> bool:
+        """Remap the file after close(); False if it was rewritten since the header was read."""
+        try:
+            self._open()
+        except (OSError, ValueError):
+            return False
+        if self._mmap[: len(self._header)] != self._header:
+            self._finalizer()
+            return False
+        return True
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def _read_header(self) -> dict[str, Any]:
+        buffer = self._mmap
+        if buffer[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a binary meta snapshot: {self.path}")
+
+        position = len(MAGIC)
+        metadata_length, species_count = _HEADER.unpack_from(buffer, position)
+        position += _HEADER.size
+
+        metadata = json.loads(bytes(buffer[position : position + metadata_length]).decode("utf-8"))
+        position += metadata_length
+
+        entries: list[tuple[str, int, int]] = []
+        for _ in range(species_count):
+            (name_length,) = _NAME_LEN.unpack_from(buffer, position)
+            position += _NAME_LEN.size
+            name = bytes(buffer[position : position + name_length]).decode("utf-8")
+            position += name_length
+            offset, length = _ENTRY.unpack_from(buffer, position)
+            position += _ENTRY.size
+            entries.append((name, offset, length))
+
+        for name, offset, length in entries:
+            self._offsets[name] = (position + offset, length)
+        self._header = bytes(buffer[:position])
+
+        return metadata
+
+    @property
+    def source_sha256(self) -> str | None:
+        return self.metadata.get("source_sha256")
+
+    def species_names(self) -> list[str]:
+        return list(self._offsets)
+
+    def decoded_priors(self) -> list[SpeciesPrior]:
+        return list(self._decoded.values())
+
+    def has_species(self, species: str) -> bool:
+        return species in self._offsets
+
+    def decode_species(self, species: str) -> SpeciesPrior | None:
+        prior = self._decoded.get(species)
+        if prior is not None:
+            return prior
+
+        entry = self._offsets.get(species)
+        if entry is None:
+            return None
+
+        start, length = entry
+        with self._lock:
+            if self.closed and not self._reopen():
+                return None
+            blob = self._mmap[start : start + length]
+        payload = json.loads(zlib.decompress(blob).decode("utf-8"))
+        prior = species_prior_from_dict(payload)
+        self._decoded[species] = prior
+        return prior
+
+    def to_snapshot(self) -> MetaPriorSnapshot:
+        metadata = self.metadata
+        return MetaPriorSnapshot(
+            format_id=str(metadata.get("format_id", "")),
+            generation=int(metadata.get("generation", 0)),
+            rating_bucket=str(metadata.get("rating_bucket", "")),
+            month_window=list(metadata.get("month_window", [])),
+            species_priors=LazySpeciesPriors(self),
+            notes=list(metadata.get("notes", [])),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._finalizer()
+
+
+class LazySpeciesPriors(Mapping[str, SpeciesPrior]):
+    """Read-only species_priors mapping that decodes entries from the reader on access."""
+
+    def __init__(self, reader: BinarySnapshotReader) -> None:
+        self._reader = reader
+
+    @property
+    def reader(self) -> BinarySnapshotReader:
+        return self._reader
+
+    def __getitem__(self, species: str) -> SpeciesPrior:
+        prior = self._reader.decode_species(species)
+        if prior is None:
+            raise KeyError(species)
+        return prior
+
+    def __contains__(self, species: object) -> bool:
+        return isinstance(species, str) and self._reader.has_species(species)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._reader.species_names())
+
+    def __len__(self) -> int:
+        return len(self._reader.species_names())
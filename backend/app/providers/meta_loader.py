@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Optional
 
 from app.inference.models import MetaPriorSnapshot
+from app.providers.meta_binary import BinarySnapshotReader, source_digest
 from app.providers.meta_normalizer import snapshot_from_dict
 
 
@@ -23,6 +24,31 @@ def snapshot_path_for_query(
     return base_dir / format_id / rating_bucket / filename
 
 
+def binary_snapshot_path(json_path: Path) -> Path:
+    return json_path.with_suffix(".bin")
+
+
+def _open_binary_snapshot(path: Path, json_path: Path) -> Optional[BinarySnapshotReader]:
+    """
+    Reader for the binary next to `json_path`, unless it is missing, corrupt or stale.
+
+    A binary is stale when the JSON beside it no longer has the digest recorded
+    at build time (e.g. a later --no-binary rebuild or a hand edit), in which
+    case the JSON wins.
+    """
+    if not path.exists():
+        return None
+    try:
+        reader = BinarySnapshotReader(path)
+    except (OSError, ValueError):
+        return None
+
+    if json_path.exists() and reader.source_sha256 != source_digest(json_path.read_bytes()):
+        reader.close()
+        return None
+    return reader
+
+
 def load_snapshot_from_disk(
     *,
     base_dir: Path,
@@ -37,15 +63,23 @@ def load_snapshot_from_disk(
         rating_bucket=rating_bucket,
         month_window=month_window,
     )
-
-    if not path.exists():
+    if not path.resolve().is_relative_to(base_dir.resolve()):
+        # Query parts are request input; never read outside the meta directory.
         return None
 
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    snapshot = snapshot_from_dict(payload)
+    reader = _open_binary_snapshot(binary_snapshot_path(path), path)
+    if reader is not None:
+        snapshot = reader.to_snapshot()
+    elif path.exists():
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        snapshot = snapshot_from_dict(payload)
+    else:
+        return None
 
     # Defensive check so bad files fail soft instead of poisoning provider behavior.
     if snapshot.format_id != format_id or snapshot.generation != generation:
+        if reader is not None:
+            reader.close()
         return None
 
     return snapshot
\ No newline at end of file
@@ -11,7 +11,9 @@ from app.inference.models import (
     WeightedSpread,
     WeightedValue,
 )
-from app.providers.meta_loader import default_meta_base_dir, load_snapshot_from_disk
+from app.providers.data_registry import get_registry
+from app.providers.meta_loader import load_snapshot_from_disk
+from app.providers.meta_snapshot_cache import MetaSnapshotCache
 
 
 @dataclass(frozen=True)
@@ -145,9 +147,14 @@ def _kingambit_prior() -> SpeciesPrior:
     )
 
 
+def get_snapshot_cache() -> MetaSnapshotCache:
+    """Budgeted LRU of decoded disk snapshots for the active data version."""
+    return get_registry().derived("meta_snapshot_cache", MetaSnapshotCache)
+
+
 class MetaProvider:
     def __init__(self, base_dir: Path | None = None) -> None:
-        self._base_dir = base_dir or default_meta_base_dir()
+        self._base_dir = base_dir
         self._memory_snapshots: dict[tuple[str, int, str, int], MetaPriorSnapshot] = {}
         self._seed_builtin_snapshots()
 
@@ -168,13 +175,22 @@ class MetaProvider:
             ],
         )
 
+    @property
+    def base_dir(self) -> Path:
+        """Directory disk snapshots are read from: the override, else the active registry's meta dir."""
+        return self._base_dir or get_registry().meta_dir
+
     def get_snapshot(self, query: MetaQuery) -> MetaPriorSnapshot:
-        disk_snapshot = load_snapshot_from_disk(
-            base_dir=self._base_dir,
-            format_id=query.format_id,
-            generation=query.generation,
-            rating_bucket=query.rating_bucket,
-            month_window=query.month_window,
+        base_dir = self.base_dir
+        disk_snapshot = get_snapshot_cache().get(
+            (base_dir, query),
+            lambda: load_snapshot_from_disk(
+                base_dir=base_dir,
+                format_id=query.format_id,
+                generation=query.generation,
+                rating_bucket=query.rating_bucket,
+                month_window=query.month_window,
+            ),
         )
         if disk_snapshot is not None:
             return disk_snapshot
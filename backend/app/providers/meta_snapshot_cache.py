@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Hashable, Optional
+
+from app.inference.models import MetaPriorSnapshot
+from app.providers.meta_binary import LazySpeciesPriors
+
+
+DEFAULT_SNAPSHOT_BUDGET_BYTES = int(os.environ.get("ESPURR_META_CACHE_MB", "256")) * 1024 * 1024
+
+
+def _deep_sizeof(root: Any) -> int:
+    """Approximate retained size of an object graph of dataclasses, containers and scalars."""
+    seen: set[int] = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            stack.extend(getattr(obj, item.name) for item in fields(obj))
+    return total
+
+
+def snapshot_nbytes(snapshot: Optional[MetaPriorSnapshot]) -> int:
+    """
+    Estimated memory held by a snapshot.
+
+    Binary-backed snapshots count their memory-mapped file plus the species
+    priors decoded so far, so their size grows as more species are requested.
+    """
+    if snapshot is None:
+        return 0
+
+    priors = snapshot.species_priors
+    if isinstance(priors, LazySpeciesPriors):
+        reader = priors.reader
+        metadata = _deep_sizeof(snapshot.month_window) + _deep_sizeof(snapshot.notes)
+        return reader.mapped_bytes + metadata + _deep_sizeof(reader.decoded_priors())
+    return _deep_sizeof(snapshot)
+
+
+def _close_snapshot(snapshot: MetaPriorSnapshot) -> None:
+    priors = snapshot.species_priors
+    if isinstance(priors, LazySpeciesPriors):
+        priors.reader.close()
+
+
+def _decoded_priors(snapshot: MetaPriorSnapshot) -> list:
+    priors = snapshot.species_priors
+    if isinstance(priors, LazySpeciesPriors):
+        return priors.reader.decoded_priors()
+    return []
+
+
+@dataclass
+class SnapshotCacheStats:
+    key: Hashable
+    nbytes: int
+    hits: int
+    loads: int
+
+
+@dataclass
+class _Entry:
+    snapshot: MetaPriorSnapshot
+    nbytes: int
+    hits: int = 0
+    loads: int = 1
+    decoded_seen: int = 0
+
+
+class MetaSnapshotCache:
+    """
+    Decoded meta snapshots for many format/rating/window queries under a memory budget.
+
+    Entries are kept in LRU order. After a load, least recently used snapshots
+    are evicted until the estimated total fits the budget; the snapshot just
+    requested is never evicted, so a single oversized snapshot still works.
+    Missing snapshots are not cached, so arbitrary queries cannot grow the cache.
+    Evicted binary snapshots have their reader closed, releasing the mapping.
+
+    Sizes are kept as a running total: each snapshot is measured once when
+    loaded, and binary-backed snapshots add only the species priors decoded
+    since their last measurement.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_SNAPSHOT_BUDGET_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._loads: dict[Hashable, int] = {}
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Optional[MetaPriorSnapshot]],
+    ) -> Optional[MetaPriorSnapshot]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.hits += 1
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.snapshot
+
+            self.misses += 1
+            snapshot = loader()
+            if snapshot is None:
+                return None
+
+            # Only snapshots that exist on disk are counted, so this stays bounded.
+            loads = self._loads[key] = self._loads.get(key, 0) + 1
+            entry = _Entry(
+                snapshot=snapshot,
+                nbytes=snapshot_nbytes(snapshot),
+                loads=loads,
+                decoded_seen=len(_decoded_priors(snapshot)),
+            )
+            self._entries[key] = entry
+            self._nbytes += entry.nbytes
+            self._evict_over_budget(keep=key)
+            return entry.snapshot
+
+    def _account_decoded(self, entry: _Entry) -> None:
+        """Add the size of species priors decoded since the entry was last measured."""
+        decoded = _decoded_priors(entry.snapshot)
+        if len(decoded) > entry.decoded_seen:
+            added = sum(_deep_sizeof(prior) for prior in decoded[entry.decoded_seen :])
+            entry.decoded_seen = len(decoded)
+            entry.nbytes += added
+            self._nbytes += added
+
+    def _evict_over_budget(self, *, keep: Hashable) -> None:
+        for entry in self._entries.values():
+            self._account_decoded(entry)
+
+        for key in list(self._entries):
+            if self._nbytes <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            entry = self._entries.pop(key)
+            self._nbytes -= entry.nbytes
+            _close_snapshot(entry.snapshot)
+            self.evictions += 1
+
+    def close(self) -> None:
+        """Release the file mappings of every cached binary snapshot and empty the cache."""
+        with self._lock:
+            for entry in self._entries.values():
+                _close_snapshot(entry.snapshot)
+            self._entries.clear()
+            self._nbytes = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> list[SnapshotCacheStats]:
+        """Per-snapshot size, hits and load count, most recently used last."""
+        with self._lock:
+            for entry in self._entries.values():
+                self._account_decoded(entry)
+            return [
+                SnapshotCacheStats(
+                    key=key,
+                    nbytes=entry.nbytes,
+                    hits=entry.hits,
+                    loads=entry.loads,
+                )
+                for key, entry in self._entries.items()
+            ]
@@ -1,24 +1,33 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from app.domain.actions import MoveAction
+from app.domain.symbols import MOVES
 from app.providers.canonical_loader import load_moves_data
-from app.providers.provider_utils import build_name_index
+from app.providers.data_registry import get_registry
+from app.providers.provider_utils import NameSearchIndex, build_name_index
+from app.services.fuzzy_names import FuzzyNameResolver
 from app.services.name_normalize import normalize_key
 
-_moves_index: Dict[str, str] | None = None
-
 
 def load_moves_data_map() -> Dict[str, Any]:
     return load_moves_data()
 
 
 def get_moves_index() -> Dict[str, str]:
-    global _moves_index
-    if _moves_index is None:
-        _moves_index = build_name_index(list(load_moves_data_map().keys()))
-    return _moves_index
+    return get_registry().derived(
+        "moves_index",
+        lambda: build_name_index(list(load_moves_data_map().keys()), MOVES),
+    )
+
+
+def get_moves_search_index() -> NameSearchIndex:
+    return get_registry().derived(
+        "moves_search_index",
+        lambda: NameSearchIndex(get_moves_index()),
+    )
 
 
 def resolve_move_name(name: str) -> str | None:
@@ -26,6 +35,25 @@ def resolve_move_name(name: str) -> str | None:
     return index.get(normalize_key(name))
 
 
+def get_move_fuzzy_resolver() -> FuzzyNameResolver:
+    return get_registry().derived(
+        "move_fuzzy_resolver",
+        lambda: FuzzyNameResolver(get_moves_index()),
+    )
+
+
+def fuzzy_resolve_move_name(name: str) -> str | None:
+    """Exact normalized match first, then the closest canonical name within the typo budget."""
+    return get_move_fuzzy_resolver().resolve(name)
+
+
+def get_move_id(name: str) -> int | None:
+    resolved = resolve_move_name(name)
+    if resolved is None:
+        return None
+    return MOVES.lookup(resolved)
+
+
 def get_move_data(name: str) -> Optional[Dict[str, Any]]:
     moves = load_moves_data_map()
     resolved = resolve_move_name(name)
@@ -34,25 +62,67 @@ def get_move_data(name: str) -> Optional[Dict[str, Any]]:
     return moves.get(resolved)
 
 
-def build_move_action_from_name(name: str) -> MoveAction | None:
-    move_data = get_move_data(name)
-    if move_data is None:
-        return None
+def get_move_data_by_id(move_id: int) -> Optional[Dict[str, Any]]:
+    return get_move_data(MOVES.name_of(move_id))
+
 
-    resolved_name = resolve_move_name(name) or name
+MOVE_CATEGORIES = {"physical", "special", "status"}
 
-    move_type = move_data.get("type") or "Normal"
+
+def _compile_move_action(name: str, move_data: Dict[str, Any]) -> MoveAction:
     category = (move_data.get("category") or "Physical").lower()
-    if category not in {"physical", "special", "status"}:
+    if category not in MOVE_CATEGORIES:
         category = "physical"
 
-    base_power = int(move_data.get("power") or 0)
-    priority = int(move_data.get("priority") or 0)
-
     return MoveAction(
-        move_name=resolved_name,
-        move_type=move_type,
+        move_name=name,
+        move_type=move_data.get("type") or "Normal",
         move_category=category,
-        base_power=base_power,
-        priority=priority,
-    )
\ No newline at end of file
+        base_power=int(move_data.get("power") or 0),
+        priority=int(move_data.get("priority") or 0),
+    )
+
+
+class MoveActionTable:
+    """
+    Precompiled MoveAction for every canonical move of one data version.
+
+    Canonical names hit a plain dict. Any other spelling goes through
+    normalize_key once and is then remembered in a bounded LRU, including
+    unknown names, so repeated lookups of raw request strings stay a cache hit.
+    """
+
+    def __init__(self, moves_data: Dict[str, Any], alias_cache_size: int = 4096) -> None:
+        self._by_name: Dict[str, MoveAction] = {
+            name: _compile_move_action(name, data) for name, data in moves_data.items()
+        }
+        self._by_key: Dict[str, MoveAction] = {
+            normalize_key(name): action for name, action in self._by_name.items()
+        }
+        self._lookup_alias = lru_cache(maxsize=alias_cache_size)(self._lookup_normalized)
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def _lookup_normalized(self, name: str) -> MoveAction | None:
+        return self._by_key.get(normalize_key(name))
+
+    def get(self, name: str | None) -> MoveAction | None:
+        if not name:
+            return None
+        action = self._by_name.get(name)
+        if action is not None:
+            return action
+        return self._lookup_alias(name)
+
+
+def get_move_action_table() -> MoveActionTable:
+    return get_registry().derived(
+        "move_action_table",
+        lambda: MoveActionTable(load_moves_data_map()),
+    )
+
+
+def build_move_action_from_name(name: str) -> MoveAction | None:
+    """Shared, immutable MoveAction for a move name, or None for unknown moves."""
+    return get_move_action_table().get(name)
@@ -3,21 +3,20 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 
 from app.providers.canonical_loader import load_natures_data
+from app.providers.data_registry import get_registry
 from app.providers.provider_utils import build_name_index
 from app.services.name_normalize import normalize_key
 
-_natures_index: Dict[str, str] | None = None
-
 
 def load_natures_data_map() -> Dict[str, Any]:
     return load_natures_data()
 
 
 def get_natures_index() -> Dict[str, str]:
-    global _natures_index
-    if _natures_index is None:
-        _natures_index = build_name_index(list(load_natures_data_map().keys()))
-    return _natures_index
+    return get_registry().derived(
+        "natures_index",
+        lambda: build_name_index(list(load_natures_data_map().keys())),
+    )
 
 
 def resolve_nature_name(name: str) -> str | None:
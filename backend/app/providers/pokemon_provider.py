@@ -2,22 +2,30 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
+from app.domain.symbols import SPECIES
 from app.providers.canonical_loader import load_species_data
-from app.providers.provider_utils import build_name_index
+from app.providers.data_registry import get_registry
+from app.providers.provider_utils import NameSearchIndex, build_name_index
+from app.services.fuzzy_names import FuzzyNameResolver
 from app.services.name_normalize import normalize_key
 
-_pokemon_index: Dict[str, str] | None = None
-
 
 def load_pokemon_data() -> Dict[str, Any]:
     return load_species_data()
 
 
 def get_pokemon_index() -> Dict[str, str]:
-    global _pokemon_index
-    if _pokemon_index is None:
-        _pokemon_index = build_name_index(list(load_pokemon_data().keys()))
-    return _pokemon_index
+    return get_registry().derived(
+        "pokemon_index",
+        lambda: build_name_index(list(load_pokemon_data().keys()), SPECIES),
+    )
+
+
+def get_pokemon_search_index() -> NameSearchIndex:
+    return get_registry().derived(
+        "pokemon_search_index",
+        lambda: NameSearchIndex(get_pokemon_index()),
+    )
 
 
 def resolve_pokemon_name(name: str) -> str | None:
@@ -25,6 +33,25 @@ def resolve_pokemon_name(name: str) -> str | None:
     return index.get(normalize_key(name))
 
 
+def get_pokemon_fuzzy_resolver() -> FuzzyNameResolver:
+    return get_registry().derived(
+        "pokemon_fuzzy_resolver",
+        lambda: FuzzyNameResolver(get_pokemon_index()),
+    )
+
+
+def fuzzy_resolve_pokemon_name(name: str) -> str | None:
+    """Exact normalized match first, then the closest canonical name within the typo budget."""
+    return get_pokemon_fuzzy_resolver().resolve(name)
+
+
+def get_pokemon_id(name: str) -> int | None:
+    resolved = resolve_pokemon_name(name)
+    if resolved is None:
+        return None
+    return SPECIES.lookup(resolved)
+
+
 def get_pokemon_data(name: str) -> Optional[Dict[str, Any]]:
     pokemon = load_pokemon_data()
     resolved = resolve_pokemon_name(name)
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import heapq
+from bisect import bisect_left
 from typing import Dict, List
 
+from app.domain.symbols import SymbolTable
 from app.services.name_normalize import normalize_key
 
 
-def build_name_index(names: list[str]) -> Dict[str, str]:
+def build_name_index(names: list[str], symbols: SymbolTable | None = None) -> Dict[str, str]:
+    """Normalized-key -> canonical name index; also interns the names into `symbols`."""
+    if symbols is not None:
+        symbols.intern_all(names)
     return {
         normalize_key(name): name
         for name in names
@@ -29,4 +35,78 @@ def search_keys(index: Dict[str, str], query: str, limit: int = 10) -> List[str]
     starts.sort()
     contains.sort()
 
-    return (starts + contains)[:limit]
\ No newline at end of file
+    return (starts + contains)[:limit]
+
+
+_NGRAM_SIZES = (1, 2, 3)
+_PREFIX_END = "\uffff"
+
+
+class NameSearchIndex:
+    """
+    Prebuilt autocomplete index with the same ordering as search_keys.
+
+    Entries are numbered by canonical-name order. "Starts with" is a bisect range
+    over the sorted normalized keys; "contains" intersects 1-3 gram postings
+    (lists of entry numbers, so already in canonical order) and verifies the
+    survivors. Build it once per loaded name index and reuse it per request.
+    """
+
+    def __init__(self, index: Dict[str, str]) -> None:
+        entries = sorted(index.items(), key=lambda item: item[1])
+        self._canonicals: List[str] = [canonical for _, canonical in entries]
+        self._norms: List[str] = [norm for norm, _ in entries]
+
+        prefix_order = sorted(range(len(entries)), key=lambda entry: self._norms[entry])
+        self._sorted_norms: List[str] = [self._norms[entry] for entry in prefix_order]
+        self._sorted_entries: List[int] = prefix_order
+
+        self._postings: Dict[str, List[int]] = {}
+        for entry, norm in enumerate(self._norms):
+            grams: set[str] = set()
+            for size in _NGRAM_SIZES:
+                for start in range(len(norm) - size + 1):
+                    grams.add(norm[start : start + size])
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(entry)
+        self._posting_sets: Dict[str, frozenset[int]] = {
+            gram: frozenset(posting) for gram, posting in self._postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._canonicals)
+
+    def _prefix_entries(self, q: str, limit: int) -> List[int]:
+        lo = bisect_left(self._sorted_norms, q)
+        hi = bisect_left(self._sorted_norms, q + _PREFIX_END, lo)
+        return heapq.nsmallest(limit, self._sorted_entries[lo:hi])
+
+    def _contains_entries(self, q: str, limit: int) -> List[int]:
+        size = min(len(q), _NGRAM_SIZES[-1])
+        grams = {q[start : start + size] for start in range(len(q) - size + 1)}
+
+        if any(gram not in self._postings for gram in grams):
+            return []
+        ordered = sorted(grams, key=lambda gram: len(self._postings[gram]))
+
+        others = [self._posting_sets[gram] for gram in ordered[1:]]
+        matches: List[int] = []
+        for entry in self._postings[ordered[0]]:
+            if any(entry not in other for other in others):
+                continue
+            norm = self._norms[entry]
+            if q in norm and not norm.startswith(q):
+                matches.append(entry)
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        q = normalize_key(query)
+        if not q or limit <= 0:
+            return []
+
+        entries = self._prefix_entries(q, limit)
+        if len(entries) < limit:
+            entries.extend(self._contains_entries(q, limit - len(entries)))
+        return [self._canonicals[entry] for entry in entries]
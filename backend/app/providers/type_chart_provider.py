@@ -2,8 +2,21 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+from app.domain.symbols import TYPES
 from app.providers.canonical_loader import load_type_chart_data
+from app.providers.data_registry import get_registry
+
+
+def _interned_type_chart() -> Dict[str, Any]:
+    chart = load_type_chart_data()
+    TYPES.intern_all(chart.keys())
+    return chart
 
 
 def load_type_chart() -> Dict[str, Any]:
-    return load_type_chart_data()
\ No newline at end of file
+    return get_registry().derived("type_chart", _interned_type_chart)
+
+
+def get_type_id(name: str) -> int | None:
+    load_type_chart()
+    return TYPES.lookup(name)
\ No newline at end of file
@@ -0,0 +1,111 @@
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from app.inference.inference_cache import get_inference_cache
+from app.providers.meta_provider import get_snapshot_cache
+from app.schemas.admin_endpoints import (
+    DataReloadResponse,
+    InferenceCacheResponse,
+    MetaSnapshotCacheResponse,
+)
+from app.services.data_reload import get_data_reloader
+
+ADMIN_TOKEN_ENV = "ESPURR_ADMIN_TOKEN"
+
+
+def require_admin_token(authorization: Optional[str] = Header(default=None)) -> None:
+    """
+    Gate for every admin endpoint: `Authorization: Bearer <ESPURR_ADMIN_TOKEN>`.
+
+    Admin endpoints are off (403) unless the token is configured; a missing
+    header is 401 and a wrong token 403.
+    """
+    expected = os.environ.get(ADMIN_TOKEN_ENV)
+    if not expected:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled.")
+
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(
+            status_code=401,
+            detail="Admin token required.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not hmac.compare_digest(token.strip().encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token.")
+
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin_token)])
+
+
+def _reload_response(started: bool) -> dict:
+    status = get_data_reloader().status()
+    return {
+        "state": status.state,
+        "started": started,
+        "dataVersion": status.active_version,
+        "lastError": status.last_error,
+        "lastReloadSeconds": status.last_reload_seconds,
+    }
+
+
+@router.get("/reload-data", response_model=DataReloadResponse)
+def reload_data_status():
+    return _reload_response(started=False)
+
+
+@router.post("/reload-data", response_model=DataReloadResponse, status_code=202)
+def reload_data(
+    force: bool = Query(default=False),
+    wait: bool = Query(default=False),
+):
+    reloader = get_data_reloader()
+    started = reloader.trigger(force=force)
+    if wait:
+        reloader.wait()
+    return _reload_response(started=started)
+
+
+@router.get("/meta-snapshots", response_model=MetaSnapshotCacheResponse)
+def meta_snapshot_cache_stats():
+    cache = get_snapshot_cache()
+    snapshots = []
+    for entry in cache.stats():
+        _, query = entry.key
+        snapshots.append(
+            {
+                "formatId": query.format_id,
+                "generation": query.generation,
+                "ratingBucket": query.rating_bucket,
+                "monthWindow": query.month_window,
+                "bytes": entry.nbytes,
+                "hits": entry.hits,
+                "loads": entry.loads,
+            }
+        )
+
+    return {
+        "budgetBytes": cache.max_bytes,
+        "totalBytes": sum(snapshot["bytes"] for snapshot in snapshots),
+        "hits": cache.hits,
+        "misses": cache.misses,
+        "hitRate": cache.hit_rate,
+        "evictions": cache.evictions,
+        "snapshots": snapshots,
+    }
+
+
+@router.get("/inference-cache", response_model=InferenceCacheResponse)
+def inference_cache_stats():
+    cache = get_inference_cache()
+    return {
+        "maxEntries": cache.max_entries,
+        "entries": len(cache),
+        "hits": cache.hits,
+        "misses": cache.misses,
+        "hitRate": cache.hit_rate,
+        "evictions": cache.evictions,
+    }
@@ -1,66 +1,184 @@
-from fastapi import APIRouter, HTTPException, Query
+import gzip
+import json
+from dataclasses import asdict
+from typing import Optional
 
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from app.domain.battle_state import FormatContext
+from app.engine.speed_tier_index import get_speed_tier_index
+from app.inference.set_inference import meta_query_for_format
+from app.providers.data_registry import get_registry
+from app.providers.meta_provider import MetaProvider
 from app.providers.move_provider import (
-    get_moves_index,
+    MOVE_CATEGORIES,
+    fuzzy_resolve_move_name,
+    get_moves_search_index,
     load_moves_data,
-    resolve_move_name,
 )
 from app.providers.pokemon_provider import (
-    get_pokemon_index,
+    fuzzy_resolve_pokemon_name,
+    get_pokemon_search_index,
     load_pokemon_data,
-    resolve_pokemon_name,
 )
-from app.providers.provider_utils import search_keys
+from app.providers.type_chart_provider import load_type_chart
 from app.schemas.data_endpoints import (
     MoveDetailResponse,
     PokemonDetailResponse,
     SearchListResponse,
+    SpeedTierResponse,
 )
+from app.services.http_cache import accepts_encoding, conditional_response
 
 router = APIRouter()
 
 
 @router.get("/pokemon", response_model=SearchListResponse)
 def search_pokemon(search: str = Query(default="", min_length=1), limit: int = 10):
-    index = get_pokemon_index()
-    results = search_keys(index, search, limit=limit)
+    results = get_pokemon_search_index().search(search, limit=limit)
     return {"results": results}
 
 
 @router.get("/pokemon/{name}", response_model=PokemonDetailResponse)
-def get_pokemon(name: str):
-    data = load_pokemon_data()
-    canonical = resolve_pokemon_name(name)
+def get_pokemon(name: str, request: Request, response: Response):
+    canonical = fuzzy_resolve_pokemon_name(name)
     if not canonical:
         raise HTTPException(status_code=404, detail=f"Unknown Pokémon: {name}")
 
-    entry = data[canonical]
+    not_modified = conditional_response(request, response)
+    if not_modified is not None:
+        return not_modified
+
+    entry = load_pokemon_data()[canonical]
     return {
         "name": canonical,
         "types": entry["types"],
-        "base": entry["base"],
+        "base": entry["base_stats"],
     }
 
 
 @router.get("/moves", response_model=SearchListResponse)
 def search_moves(search: str = Query(default="", min_length=1), limit: int = 10):
-    index = get_moves_index()
-    results = search_keys(index, search, limit=limit)
+    results = get_moves_search_index().search(search, limit=limit)
     return {"results": results}
 
 
+def _move_category(entry: dict) -> str:
+    category = str(entry.get("category") or "physical").lower()
+    return category if category in MOVE_CATEGORIES else "physical"
+
+
 @router.get("/moves/{name}", response_model=MoveDetailResponse)
-def get_move(name: str):
-    data = load_moves_data()
-    canonical = resolve_move_name(name)
+def get_move(name: str, request: Request, response: Response):
+    canonical = fuzzy_resolve_move_name(name)
     if not canonical:
         raise HTTPException(status_code=404, detail=f"Unknown move: {name}")
 
-    entry = data[canonical]
+    not_modified = conditional_response(request, response)
+    if not_modified is not None:
+        return not_modified
+
+    entry = load_moves_data()[canonical]
     return {
         "name": canonical,
         "type": entry["type"],
-        "category": entry["category"],
+        "category": _move_category(entry),
         "power": int(entry.get("power", 0) or 0),
         "priority": int(entry.get("priority", 0) or 0),
-    }
\ No newline at end of file
+    }
+
+
+def _build_data_bundle() -> tuple[bytes, bytes]:
+    """Whole species/moves/types catalog as compact JSON, plus its gzip encoding."""
+    payload = {
+        "dataVersion": get_registry().version,
+        "pokemon": [
+            {
+                "name": name,
+                "types": entry.get("types") or [],
+                "baseStats": entry.get("base_stats") or {},
+            }
+            for name, entry in sorted(load_pokemon_data().items())
+        ],
+        "moves": [
+            {
+                "name": name,
+                "type": entry.get("type") or "Normal",
+                "category": _move_category(entry),
+                "power": int(entry.get("power", 0) or 0),
+                "priority": int(entry.get("priority", 0) or 0),
+            }
+            for name, entry in sorted(load_moves_data().items())
+        ],
+        "types": sorted(load_type_chart().keys()),
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return raw, gzip.compress(raw, compresslevel=9, mtime=0)
+
+
+@router.get("/data/bundle")
+def get_data_bundle(request: Request, response: Response):
+    """
+    Species, moves and types in one payload for client-side name resolution.
+
+    Serialized and gzip-compressed once per data version; served compressed to
+    clients that accept gzip.
+    """
+    accepts_gzip = accepts_encoding(request.headers.get("accept-encoding"), "gzip")
+    response.headers["Vary"] = "Accept-Encoding"
+    not_modified = conditional_response(request, response, variant="gzip" if accepts_gzip else None)
+    if not_modified is not None:
+        not_modified.headers["Vary"] = "Accept-Encoding"
+        return not_modified
+
+    raw, compressed = get_registry().derived("data_bundle", _build_data_bundle)
+    headers = dict(response.headers)
+    if accepts_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=compressed, media_type="application/json", headers=headers)
+    return Response(content=raw, media_type="application/json", headers=headers)
+
+
+@router.get("/speed-tiers", response_model=SpeedTierResponse)
+def get_speed_tiers(
+    species: str = Query(min_length=1),
+    speed: Optional[float] = Query(default=None, gt=0),
+    stage: int = Query(default=0, ge=-6, le=6),
+    scarf: bool = False,
+    generation: int = Query(default=9, ge=1, le=9),
+    format_name: str = Query(default="manual", alias="formatName"),
+    rating_bucket: Optional[str] = Query(default=None, alias="ratingBucket", pattern=r"^\d+$"),
+    month_window: Optional[int] = Query(default=None, alias="monthWindow", ge=1, le=12),
+):
+    """
+    Speed tiers of one species in the meta snapshot selected by the format query.
+
+    The format parameters mirror the battle request's formatContext; without them
+    the default meta snapshot is used.
+    """
+    meta_query = meta_query_for_format(
+        FormatContext(
+            generation=generation,
+            format_name=format_name,
+            rating_bucket=rating_bucket,
+            month_window=month_window,
+        )
+    )
+    index = get_speed_tier_index(MetaProvider().get_snapshot(meta_query))
+    canonical = fuzzy_resolve_pokemon_name(species) or species
+    tiers = index.tiers(canonical, scarf=scarf, stage=stage)
+    if tiers is None:
+        raise HTTPException(status_code=404, detail=f"No speed tiers for: {species}")
+
+    outspeed = None
+    if speed is not None:
+        outspeed = asdict(index.outspeed_probability(canonical, speed, stage=stage, scarf=scarf))
+
+    return {
+        "species": tiers.species,
+        "stage": tiers.stage,
+        "scarf": tiers.scarf,
+        "scarfShare": index.scarf_share(canonical),
+        "tiers": [asdict(tier) for tier in tiers.tiers],
+        "outspeed": outspeed,
+    }
@@ -1,11 +1,26 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+
+from app.providers.data_registry import get_registry
+from app.services.data_reload import get_data_reloader
+from app.services.warmup import get_readiness
 
 router = APIRouter()
 
 
 @router.get("/health")
-def health():
-    return {"status": "ok"}
+def health(response: Response):
+    readiness = get_readiness()
+    if not readiness.ready:
+        response.status_code = 503
+        return {"status": "warming", "dataVersion": get_registry().version}
+
+    report = readiness.report
+    return {
+        "status": "ok",
+        "dataVersion": get_registry().version,
+        "dataReload": get_data_reloader().status().state,
+        "warmupMs": round(report.total_seconds * 1000, 1) if report is not None else None,
+    }
 
 
 @router.get("/")
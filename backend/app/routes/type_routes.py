@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from app.engine.type_engine import combined_multiplier
 from app.providers.type_chart_provider import load_type_chart
@@ -6,6 +6,7 @@ from app.schemas.type_effectiveness import (
     TypeEffectivenessRequest,
     TypeEffectivenessResponse,
 )
+from app.services.http_cache import conditional_response
 
 router = APIRouter()
 
@@ -25,6 +26,10 @@ def type_effectiveness(payload: TypeEffectivenessRequest):
 
 
 @router.get("/types")
-def get_types():
+def get_types(request: Request, response: Response):
+    not_modified = conditional_response(request, response)
+    if not_modified is not None:
+        return not_modified
+
     chart = load_type_chart()
     return {"types": sorted(chart.keys())}
\ No newline at end of file
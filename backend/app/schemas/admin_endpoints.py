@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from typing import List, Literal, Optional
+
+
+class DataReloadResponse(BaseModel):
+    state: Literal["idle", "reloading", "failed"]
+    started: bool
+    dataVersion: str
+    lastError: Optional[str] = None
+    lastReloadSeconds: Optional[float] = None
+
+
+class MetaSnapshotStats(BaseModel):
+    formatId: str
+    generation: int
+    ratingBucket: str
+    monthWindow: int
+    bytes: int
+    hits: int
+    loads: int
+
+
+class MetaSnapshotCacheResponse(BaseModel):
+    budgetBytes: int
+    totalBytes: int
+    hits: int
+    misses: int
+    hitRate: float
+    evictions: int
+    snapshots: List[MetaSnapshotStats]
+
+
+class InferenceCacheResponse(BaseModel):
+    maxEntries: int
+    entries: int
+    hits: int
+    misses: int
+    hitRate: float
+    evictions: int
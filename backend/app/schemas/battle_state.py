@@ -71,6 +71,8 @@ class FormatContextRequest(BaseModel):
     generation: int = Field(default=9, ge=1, le=9)
     formatName: Optional[str] = "manual"
     ruleset: List[str] = Field(default_factory=list)
+    ratingBucket: Optional[str] = Field(default=None, pattern=r"^\d+$")
+    monthWindow: Optional[int] = Field(default=None, ge=1, le=12)
 
 
 class BattleStateRequest(BaseModel):
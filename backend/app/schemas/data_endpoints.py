@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Literal
+from typing import List, Literal, Optional
 
 MoveCategory = Literal["physical", "special", "status"]
 
@@ -20,3 +20,24 @@ class MoveDetailResponse(BaseModel):
     category: MoveCategory
     power: int
     priority: int = 0
+
+
+class SpeedTierEntry(BaseModel):
+    speed: float
+    weight: float
+    label: str
+
+
+class OutspeedResponse(BaseModel):
+    faster: float
+    tie: float
+    slower: float
+
+
+class SpeedTierResponse(BaseModel):
+    species: str
+    stage: int
+    scarf: bool
+    scarfShare: float
+    tiers: List[SpeedTierEntry]
+    outspeed: Optional[OutspeedResponse] = None
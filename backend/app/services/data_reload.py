@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from app.providers.data_registry import (
+    CANONICAL_FILES,
+    DataRegistry,
+    compute_data_version,
+    get_registry,
+    set_registry,
+)
+from app.providers.move_provider import MOVE_CATEGORIES
+from app.services.warmup import log_warmup_report, warm_registry
+
+
+logger = logging.getLogger(__name__)
+
+STAT_KEYS = ("hp", "atk", "def", "spa", "spd", "spe")
+
+
+class DataValidationError(ValueError):
+    """A candidate data version failed validation and was not swapped in."""
+
+
+def validate_registry(registry: DataRegistry) -> None:
+    """
+    Load every canonical file of `registry` and check the fields the engines rely on.
+
+    Raises DataValidationError on the first problem; the registry is never made
+    active in that case.
+    """
+    for filename in CANONICAL_FILES:
+        try:
+            data = registry.canonical(filename)
+        except (OSError, ValueError) as exc:
+            raise DataValidationError(f"{filename}: {exc}") from exc
+        if not isinstance(data, dict) or not data:
+            raise DataValidationError(f"{filename}: expected a non-empty object")
+
+    type_chart = registry.canonical("type_chart.json")
+    for species, entry in registry.canonical("species.json").items():
+        types = entry.get("types") or []
+        if not types or any(type_name not in type_chart for type_name in types):
+            raise DataValidationError(f"species.json: {species} has invalid types {types!r}")
+        base_stats = entry.get("base_stats") or {}
+        if any(not isinstance(base_stats.get(key), int) for key in STAT_KEYS):
+            raise DataValidationError(f"species.json: {species} is missing base stats")
+
+    for move, entry in registry.canonical("moves.json").items():
+        if entry.get("type") not in type_chart:
+            raise DataValidationError(f"moves.json: {move} has unknown type {entry.get('type')!r}")
+        if str(entry.get("category", "")).lower() not in MOVE_CATEGORIES:
+            raise DataValidationError(f"moves.json: {move} has unknown category {entry.get('category')!r}")
+
+
+def build_registry(
+    canonical_dir: Optional[Path] = None,
+    meta_dir: Optional[Path] = None,
+) -> DataRegistry:
+    """Build, validate and warm a registry for the data currently on disk, without activating it."""
+    active = get_registry()
+    registry = DataRegistry(
+        canonical_dir=canonical_dir or active.canonical_dir,
+        meta_dir=meta_dir or active.meta_dir,
+    )
+    validate_registry(registry)
+    log_warmup_report(warm_registry(registry))
+    return registry
+
+
+def reload_data(*, force: bool = False) -> DataRegistry:
+    """
+    Swap in a freshly built registry when the data on disk changed.
+
+    Requests pinned to the previous registry keep reading it until they finish.
+    Unchanged data is a no-op unless `force` is set.
+    """
+    active = get_registry()
+    if not force and compute_data_version(active.canonical_dir, active.meta_dir) == active.version:
+        return active
+
+    registry = build_registry()
+    set_registry(registry)
+    # Pinned requests may still read the old version; its snapshot readers remap on demand.
+    active.close()
+    logger.info("Data version %s -> %s", active.version, registry.version)
+    return registry
+
+
+@dataclass
+class ReloadStatus:
+    state: str
+    active_version: str
+    last_error: Optional[str] = None
+    last_reload_seconds: Optional[float] = None
+
+
+class DataReloader:
+    """
+    Runs reload_data() on a background thread, one reload at a time.
+
+    Triggered by the admin endpoint or by the optional file watcher; triggers
+    that arrive while a reload is running are coalesced into one follow-up run,
+    so files written mid-reload are never missed.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._pending = False
+        self._pending_force = False
+        self._last_error: Optional[str] = None
+        self._last_reload_seconds: Optional[float] = None
+
+    @property
+    def reloading(self) -> bool:
+        return self._running
+
+    def status(self) -> ReloadStatus:
+        if self.reloading:
+            state = "reloading"
+        elif self._last_error is not None:
+            state = "failed"
+        else:
+            state = "idle"
+        return ReloadStatus(
+            state=state,
+            active_version=get_registry().version,
+            last_error=self._last_error,
+            last_reload_seconds=self._last_reload_seconds,
+        )
+
+    def trigger(self, *, force: bool = False) -> bool:
+        """Start a background reload; returns False if it was queued behind a running one."""
+        with self._lock:
+            if self._running:
+                self._pending = True
+                self._pending_force = self._pending_force or force
+                return False
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run,
+                kwargs={"force": force},
+                name="data-reload",
+                daemon=True,
+            )
+            self._thread.start()
+            return True
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self, *, force: bool) -> None:
+        while True:
+            started = time.perf_counter()
+            try:
+                reload_data(force=force)
+            except Exception as exc:
+                self._last_error = str(exc)
+                logger.exception("Data reload failed; keeping version %s", get_registry().version)
+            else:
+                self._last_error = None
+            finally:
+                self._last_reload_seconds = time.perf_counter() - started
+
+            with self._lock:
+                if not self._pending:
+                    self._running = False
+                    return
+                force = self._pending_force
+                self._pending = False
+                self._pending_force = False
+
+    def watch(self, stop_event: threading.Event) -> None:
+        """
+        Trigger a reload whenever canonical or meta data files change.
+
+        Uses the optional `watchfiles` package; without it file watching is
+        disabled and only the admin endpoint reloads.
+        """
+        try:
+            from watchfiles import watch
+        except ImportError:
+            logger.warning("watchfiles is not installed; data file watching disabled")
+            return
+
+        registry = get_registry()
+        paths = [path for path in (registry.canonical_dir, registry.meta_dir) if path.exists()]
+        for changes in watch(*paths, stop_event=stop_event):
+            if any(Path(path).suffix in {".json", ".bin"} for _, path in changes):
+                self.trigger()
+
+
+_data_reloader = DataReloader()
+
+
+def get_data_reloader() -> DataReloader:
+    return _data_reloader
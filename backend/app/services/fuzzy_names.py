@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+from app.services.name_normalize import normalize_key
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance (insert, delete, substitute) between two strings."""
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+MAX_TYPO_DISTANCE = 2
+
+
+def max_edit_distance(length: int) -> int:
+    """Typo budget for a normalized name: none for very short names, then 1, then 2."""
+    if length < 3:
+        return 0
+    if length <= 5:
+        return 1
+    return MAX_TYPO_DISTANCE
+
+
+def _deletes(key: str, depth: int) -> set[str]:
+    """`key` plus every string reachable from it by up to `depth` single-character deletions."""
+    variants = {key}
+    frontier = {key}
+    for _ in range(depth):
+        next_frontier: set[str] = set()
+        for variant in frontier:
+            for i in range(len(variant)):
+                next_frontier.add(variant[:i] + variant[i + 1 :])
+        next_frontier -= variants
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+
+class DeletionIndex:
+    """
+    Symmetric-delete (SymSpell-style) index over normalized keys.
+
+    Every key is stored under all of its deletion variants up to `max_distance`.
+    Two strings within that Levenshtein distance always share a variant, so a
+    query only verifies the few keys that share one of its own variants instead
+    of comparing against the whole vocabulary.
+    """
+
+    def __init__(self, keys: Iterable[str] = (), max_distance: int = MAX_TYPO_DISTANCE) -> None:
+        self.max_distance = max_distance
+        self._variants: Dict[str, List[str]] = {}
+        self._size = 0
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: str) -> None:
+        self._size += 1
+        for variant in _deletes(key, self.max_distance):
+            self._variants.setdefault(variant, []).append(key)
+
+    def search(self, query: str, tolerance: int) -> List[Tuple[int, str]]:
+        """All keys within `tolerance` edits of `query`, as sorted (distance, key) pairs."""
+        tolerance = min(tolerance, self.max_distance)
+
+        candidates: set[str] = set()
+        for variant in _deletes(query, tolerance):
+            candidates.update(self._variants.get(variant, ()))
+
+        matches: List[Tuple[int, str]] = []
+        for key in candidates:
+            if abs(len(key) - len(query)) > tolerance:
+                continue
+            distance = edit_distance(query, key)
+            if distance <= tolerance:
+                matches.append((distance, key))
+
+        matches.sort()
+        return matches
+
+
+class FuzzyNameResolver:
+    """
+    Exact-then-fuzzy resolution over a normalized-key -> canonical-name index.
+
+    Exact normalized matches always win. Otherwise the closest canonical names
+    within the length-scaled edit budget are returned, ties broken by name.
+    """
+
+    def __init__(self, index: Dict[str, str]) -> None:
+        self._index = dict(index)
+        self._deletions = DeletionIndex(sorted(self._index))
+
+    def matches(self, name: str | None, limit: int = 5) -> List[Tuple[str, int]]:
+        key = normalize_key(name or "")
+        if not key:
+            return []
+
+        exact = self._index.get(key)
+        if exact is not None:
+            return [(exact, 0)]
+
+        found = self._deletions.search(key, max_edit_distance(len(key)))
+        ranked = sorted((distance, self._index[match]) for distance, match in found)
+        return [(canonical, distance) for distance, canonical in ranked[:limit]]
+
+    def resolve(self, name: str | None) -> str | None:
+        found = self.matches(name, limit=1)
+        return found[0][0] if found else None
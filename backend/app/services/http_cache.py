@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+from app.providers.data_registry import CANONICAL_FILES, DataRegistry, get_registry
+
+
+# Clients may reuse static data for a minute, then revalidate with the ETag;
+# a reload therefore reaches every client within that window.
+STATIC_DATA_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+
+def data_etag(registry: Optional[DataRegistry] = None, variant: Optional[str] = None) -> str:
+    """
+    Strong ETag for data that only changes with the canonical/meta data version.
+
+    `variant` distinguishes byte-different representations of the same data,
+    e.g. a gzip-encoded body.
+    """
+    registry = registry or get_registry()
+    suffix = f"-{variant}" if variant else ""
+    return f'"{registry.version}{suffix}"'
+
+
+def _last_modified(registry: DataRegistry) -> datetime:
+    def newest_mtime() -> datetime:
+        mtimes = [
+            path.stat().st_mtime
+            for path in (registry.canonical_dir / filename for filename in CANONICAL_FILES)
+            if path.exists()
+        ]
+        # HTTP dates have second precision.
+        return datetime.fromtimestamp(int(max(mtimes, default=0)), tz=timezone.utc)
+
+    return registry.derived("last_modified", newest_mtime)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified <= since
+
+
+def _quality(params: list[str]) -> float:
+    for param in params:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value.strip())
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def accepts_encoding(header: Optional[str], coding: str) -> bool:
+    """
+    Whether an Accept-Encoding header allows `coding`, honouring q-values.
+
+    An explicit entry for the coding wins over `*`; a q-value of 0 refuses it.
+    """
+    if not header:
+        return False
+
+    explicit: Optional[float] = None
+    wildcard: Optional[float] = None
+    for entry in header.split(","):
+        name, *params = entry.split(";")
+        name = name.strip().lower()
+        if name == coding:
+            explicit = _quality(params)
+        elif name == "*":
+            wildcard = _quality(params)
+
+    quality = explicit if explicit is not None else wildcard
+    return quality is not None and quality > 0
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    variant: Optional[str] = None,
+) -> Optional[Response]:
+    """
+    Attach ETag/Last-Modified/Cache-Control for the pinned data version to `response`.
+
+    Returns a bodiless 304 response when the client's If-None-Match (or, without
+    one, If-Modified-Since) shows it already holds this version; the route should
+    return that instead of building its payload.
+    """
+    registry = get_registry()
+    headers = {
+        "ETag": data_etag(registry, variant),
+        "Last-Modified": format_datetime(_last_modified(registry), usegmt=True),
+        "Cache-Control": STATIC_DATA_CACHE_CONTROL,
+    }
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, headers["ETag"])
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        fresh = if_modified_since is not None and _not_modified_since(
+            if_modified_since, _last_modified(registry)
+        )
+
+    if fresh:
+        return Response(status_code=304, headers=headers)
+    return None
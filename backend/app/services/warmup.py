@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from app.adapters.manual_input_adapter import to_domain_battle_state
+from app.engine.evaluation_engine import evaluate_battle_state
+from app.engine.speed_tier_index import get_speed_tier_index
+from app.inference.set_inference import DEFAULT_META_QUERY
+from app.providers.data_registry import CANONICAL_FILES, DataRegistry, get_registry, pinned_registry
+from app.providers.meta_provider import MetaProvider
+from app.providers.move_provider import (
+    get_move_action_table,
+    get_move_fuzzy_resolver,
+    get_moves_search_index,
+)
+from app.providers.pokemon_provider import get_pokemon_fuzzy_resolver, get_pokemon_search_index
+from app.providers.type_chart_provider import load_type_chart
+from app.schemas.battle_state import BattleStateRequest
+
+
+logger = logging.getLogger(__name__)
+
+
+# Small but complete position: meta-known opposing active, a bench on both sides
+# and one move of each category, so inference, speed tiers, switch responses and
+# lookahead all run once.
+SYNTHETIC_POSITION = {
+    "mySide": {
+        "active": {"species": "Dragonite", "types": ["Dragon", "Flying"], "atk": 403, "spe": 259, "hp": 386},
+        "bench": [{"species": "Gholdengo", "types": ["Steel", "Ghost"], "spa": 367, "spe": 293, "hp": 348}],
+    },
+    "opponentSide": {
+        "active": {"species": "Great Tusk", "types": ["Ground", "Fighting"], "atk": 367, "spe": 275, "hp": 431},
+        "bench": [{"species": "Kingambit", "types": ["Dark", "Steel"], "atk": 405, "spe": 199, "hp": 404}],
+    },
+    "moves": [
+        {"name": "Extreme Speed", "type": "Normal", "power": 80, "category": "physical", "priority": 2},
+        {"name": "Earthquake", "type": "Ground", "power": 100, "category": "physical"},
+        {"name": "Dragon Dance", "type": "Dragon", "power": 0, "category": "status"},
+    ],
+}
+
+
+@dataclass
+class WarmupReport:
+    data_version: str
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.timings.values())
+
+
+def _timed(report: WarmupReport, step: str, action: Callable[[], object]) -> None:
+    started = time.perf_counter()
+    action()
+    report.timings[step] = time.perf_counter() - started
+
+
+def _synthetic_evaluation() -> None:
+    state = to_domain_battle_state(BattleStateRequest.model_validate(SYNTHETIC_POSITION))
+    evaluate_battle_state(state=state)
+
+
+def warm_registry(registry: Optional[DataRegistry] = None, *, evaluate: bool = True) -> WarmupReport:
+    """
+    Load every data source and index of `registry` (the active one by default).
+
+    Each step is timed separately so cold-start cost can be attributed to a data
+    source. With `evaluate` a synthetic evaluation runs last to warm the engine
+    code paths and the per-version memo tables.
+    """
+    registry = registry or get_registry()
+    report = WarmupReport(data_version=registry.version)
+
+    with pinned_registry(registry):
+        for filename in CANONICAL_FILES:
+            _timed(report, f"canonical:{filename}", lambda: registry.canonical(filename))
+        _timed(report, "type_chart", load_type_chart)
+        _timed(report, "pokemon_indexes", lambda: (get_pokemon_search_index(), get_pokemon_fuzzy_resolver()))
+        _timed(
+            report,
+            "move_indexes",
+            lambda: (get_moves_search_index(), get_move_fuzzy_resolver(), get_move_action_table()),
+        )
+        _timed(report, "meta_snapshot", lambda: MetaProvider().get_snapshot(DEFAULT_META_QUERY))
+        _timed(
+            report,
+            "speed_tiers",
+            lambda: get_speed_tier_index(MetaProvider().get_snapshot(DEFAULT_META_QUERY)),
+        )
+        if evaluate:
+            _timed(report, "synthetic_evaluation", _synthetic_evaluation)
+
+    return report
+
+
+def log_warmup_report(report: WarmupReport) -> None:
+    breakdown = ", ".join(f"{step}={seconds * 1000:.1f}ms" for step, seconds in report.timings.items())
+    logger.info(
+        "Warm-up of data version %s took %.1fms (%s)",
+        report.data_version,
+        report.total_seconds * 1000,
+        breakdown,
+    )
+
+
+class Readiness:
+    """Process readiness: set once the startup warm-up finished (or failed and was logged)."""
+
+    def __init__(self) -> None:
+        self._ready = threading.Event()
+        self.report: Optional[WarmupReport] = None
+        self.error: Optional[str] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def warm_up(self) -> None:
+        try:
+            self.report = warm_registry()
+            log_warmup_report(self.report)
+        except Exception as exc:
+            # A failed warm-up only costs latency; requests still load lazily.
+            self.error = str(exc)
+            logger.exception("Startup warm-up failed")
+        finally:
+            self._ready.set()
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.warm_up, name="warm-up", daemon=True)
+        thread.start()
+        return thread
+
+
+_readiness = Readiness()
+
+
+def get_readiness() -> Readiness:
+    return _readiness
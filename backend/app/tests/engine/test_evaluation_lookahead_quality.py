@@ -15,7 +15,9 @@ from app.engine.evaluation_engine import (
     evaluate_action_in_world,
     top_influential_world,
 )
+from app.engine.evaluation_context import EvaluationContext
 from app.engine.lookahead_engine import estimate_lookahead_bonus
+from app.engine.response_engine import generate_opponent_responses
 from app.inference.models import (
     ActionWorldEvaluation,
     CandidateSet,
@@ -391,4 +393,95 @@ def test_estimate_lookahead_bonus_returns_branch_notes_and_finite_value() -> Non
 
     assert isinstance(bonus, float)
     assert notes
-    assert any("Lookahead branch" in note or "Discounted shallow-lookahead bonus" in note for note in notes)
\ No newline at end of file
+    assert any("Lookahead branch" in note or "Discounted shallow-lookahead bonus" in note for note in notes)
+
+
+def test_estimate_lookahead_bonus_uses_team_worlds_after_opposing_switch() -> None:
+    state = _test_state()
+    my_action = MoveAction(
+        move_name="Earthquake",
+        move_type="Ground",
+        move_category="physical",
+        base_power=100,
+        priority=0,
+    )
+
+    world = _world(
+        label="gt-rapid-spin",
+        weight=1.0,
+        known_moves=["Headlong Rush"],
+        assumed_moves=["Rapid Spin", "Stealth Rock"],
+    )
+    team_worlds = {
+        "Great Tusk": [world],
+        "Gholdengo": [
+            _world(
+                label="gholdengo-nasty-plot",
+                weight=1.0,
+                species="Gholdengo",
+                known_moves=[],
+                assumed_moves=["Make It Rain", "Shadow Ball", "Nasty Plot", "Recover"],
+            )
+        ],
+        "Rillaboom": [
+            _world(
+                label="rillaboom-band",
+                weight=1.0,
+                species="Rillaboom",
+                known_moves=[],
+                assumed_moves=["Grassy Glide", "Wood Hammer", "Knock Off", "U-turn"],
+            )
+        ],
+    }
+
+    _, notes = estimate_lookahead_bonus(
+        state=state,
+        my_action=my_action,
+        world=world,
+        all_worlds=[world],
+        response_limit=8,
+        context=EvaluationContext(team_worlds=team_worlds),
+    )
+
+    assert any("own inferred sets after the opposing switch" in note for note in notes)
+    assert any("gholdengo-nasty-plot" in note or "rillaboom-band" in note for note in notes)
+
+
+def test_switch_responses_score_bench_pokemon_from_their_inferred_sets() -> None:
+    state = _test_state()
+    my_action = MoveAction(
+        move_name="Earthquake",
+        move_type="Ground",
+        move_category="physical",
+        base_power=100,
+        priority=0,
+    )
+    world = _world(
+        label="gt-rapid-spin",
+        weight=1.0,
+        known_moves=["Headlong Rush"],
+        assumed_moves=["Rapid Spin", "Stealth Rock"],
+    )
+    team_worlds = {
+        "Rillaboom": [
+            _world(
+                label="rillaboom-ice-coverage",
+                weight=1.0,
+                species="Rillaboom",
+                known_moves=[],
+                assumed_moves=["Grassy Glide", "Wood Hammer", "Ice Spinner", "U-turn"],
+            )
+        ],
+    }
+
+    def rillaboom_switch(context: EvaluationContext | None):
+        responses = generate_opponent_responses(state=state, world=world, my_action=my_action, context=context)
+        return next(response for response in responses if response.label == "switch::Rillaboom")
+
+    raw = rillaboom_switch(None)
+    inferred = rillaboom_switch(EvaluationContext(team_worlds=team_worlds))
+
+    # Ice Spinner is 4x into Dragonite, where Rillaboom's Grass STAB is resisted.
+    assert inferred.weight > raw.weight
+    assert "Offensive matchup score=2.00." in inferred.notes
+    assert any("inferred set" in note for note in inferred.notes)
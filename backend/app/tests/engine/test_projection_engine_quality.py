@@ -8,7 +8,11 @@ from app.domain.battle_state import (
     SideConditions,
     SideState,
 )
-from app.engine.projection_engine import project_action_against_response
+from app.engine.evaluation_context import EvaluationContext
+from app.engine.projection_engine import (
+    precompute_damage_table,
+    project_action_against_response,
+)
 from app.inference.models import CandidateSet, OpponentResponse, OpponentWorld
 from app.providers.move_provider import build_move_action_from_name
 
@@ -303,4 +307,141 @@ def test_projection_leftovers_hook_can_restore_hp() -> None:
     )
 
     projection = project_action_against_response(state, my_action, response, world)
-    assert projection.opp_hp_after >= 0.0
\ No newline at end of file
+    assert projection.opp_hp_after >= 0.0
+
+
+def test_projection_with_precomputed_damage_table_matches_direct_projection() -> None:
+    state = _test_state()
+    my_action = build_move_action_from_name("Earthquake")
+    assert my_action is not None
+
+    world = _world(
+        known_moves=["Headlong Rush"],
+        assumed_moves=["Ice Spinner"],
+        item="Choice Band",
+        ability="Protosynthesis",
+    )
+
+    response = OpponentResponse(
+        kind="move",
+        label="move::Headlong Rush",
+        weight=1.0,
+        move_name="Headlong Rush",
+        move_type="Ground",
+        move_category="physical",
+        base_power=120,
+        priority=0,
+        notes=[],
+    )
+
+    context = EvaluationContext()
+    precompute_damage_table(state, [world], list(state.moves), context)
+    assert len(context.damage_table) > 0
+    misses_after_precompute = context.damage_table.misses
+
+    direct = project_action_against_response(state, my_action, response, world)
+    cached = project_action_against_response(state, my_action, response, world, context=context)
+
+    assert cached.my_hp_after == direct.my_hp_after
+    assert cached.opp_hp_after == direct.opp_hp_after
+    assert cached.notes == direct.notes
+    assert context.damage_table.misses == misses_after_precompute
+    assert context.damage_table.hits >= 2
+
+
+def test_prepared_combatants_are_reused_with_hook_notes_across_responses() -> None:
+    state = _test_state()
+    my_action = build_move_action_from_name("Earthquake")
+    assert my_action is not None
+
+    world = _world(
+        known_moves=["Headlong Rush", "Rapid Spin"],
+        item="Choice Scarf",
+        ability="Intimidate",
+    )
+
+    responses = [
+        OpponentResponse(
+            kind="move",
+            label=f"move::{name}",
+            weight=0.5,
+            move_name=name,
+            move_type=move_type,
+            move_category="physical",
+            base_power=power,
+            priority=0,
+            notes=[],
+        )
+        for name, move_type, power in [("Headlong Rush", "Ground", 120), ("Rapid Spin", "Normal", 50)]
+    ]
+
+    context = EvaluationContext()
+    projections = [
+        project_action_against_response(state, my_action, response, world, context=context)
+        for response in responses
+    ]
+
+    assert context.prepared_combatants.hits >= 2
+    for projection in projections:
+        assert any("Intimidate hook applied" in note for note in projection.notes)
+        assert any("boosts projected Speed" in note for note in projection.notes)
+
+
+def test_projection_scales_opponent_stats_to_world_spread() -> None:
+    state = _test_state()
+    my_action = build_move_action_from_name("Dragon Dance")
+    assert my_action is not None
+
+    response = OpponentResponse(
+        kind="move",
+        label="move::Rapid Spin",
+        weight=1.0,
+        move_name="Rapid Spin",
+        move_type="Normal",
+        move_category="physical",
+        base_power=50,
+        priority=0,
+        notes=[],
+    )
+
+    uninvested = _world(known_moves=["Rapid Spin"], item="Leftovers")
+    invested = _world(known_moves=["Rapid Spin"], item="Leftovers")
+    invested.candidate.nature = "Adamant"
+    invested.candidate.evs = {"atk": 252, "spe": 252}
+
+    baseline = project_action_against_response(state, my_action, response, uninvested)
+    scaled = project_action_against_response(state, my_action, response, invested)
+
+    assert scaled.my_damage_taken > baseline.my_damage_taken
+    assert any("inferred spread" in note for note in scaled.notes)
+
+
+def test_prepared_spread_notes_name_each_worlds_own_spread() -> None:
+    state = _test_state()
+    my_action = build_move_action_from_name("Dragon Dance")
+    assert my_action is not None
+
+    response = OpponentResponse(
+        kind="move",
+        label="move::Rapid Spin",
+        weight=1.0,
+        move_name="Rapid Spin",
+        move_type="Normal",
+        move_category="physical",
+        base_power=50,
+        priority=0,
+        notes=[],
+    )
+
+    worlds = []
+    for label in ("jolly-sweeper", "jolly-lead"):
+        world = _world(known_moves=["Rapid Spin"])
+        world.candidate.spread_label = label
+        world.candidate.nature = "Jolly"
+        world.candidate.evs = {"atk": 252, "spe": 252}
+        worlds.append(world)
+
+    context = EvaluationContext()
+    for world in worlds:
+        projection = project_action_against_response(state, my_action, response, world, context=context)
+        assert any(f"inferred spread {world.candidate.spread_label}" in note for note in projection.notes)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from app.domain.battle_state import PokemonState, SideConditions
+from app.engine.speed_engine import OutspeedEstimate, turn_order_context
+from app.engine.speed_tier_index import SpeedTierIndex
+from app.engine.switch_engine import score_switch
+from app.inference.models import MetaPriorSnapshot, SpeciesPrior, WeightedSpread, WeightedValue
+from app.providers.meta_binary import BinarySnapshotReader, write_binary_snapshot
+from app.providers.meta_loader import default_meta_base_dir, snapshot_path_for_query
+
+
+def _snapshot() -> MetaPriorSnapshot:
+    return MetaPriorSnapshot(
+        format_id="gen9ou",
+        generation=9,
+        rating_bucket="1695",
+        month_window=["test"],
+        species_priors={
+            "Great Tusk": SpeciesPrior(
+                species="Great Tusk",
+                usage_weight=1.0,
+                items=[
+                    WeightedValue("Leftovers", 0.75),
+                    WeightedValue("Choice Scarf", 0.25),
+                ],
+                spreads=[
+                    WeightedSpread(label="fast", nature="Jolly", evs={"atk": 252, "spe": 252}, weight=0.6),
+                    WeightedSpread(label="bulky", nature="Impish", evs={"hp": 252, "def": 252}, weight=0.4),
+                ],
+            ),
+        },
+    )
+
+
+def test_speed_tiers_are_sorted_actual_stats() -> None:
+    index = SpeedTierIndex(_snapshot())
+    tiers = index.tiers("great tusk")
+
+    assert tiers is not None
+    assert tiers.speeds == (210, 300)
+    assert [tier.label for tier in tiers.tiers] == ["bulky", "fast"]
+
+    scarfed = index.tiers("Great Tusk", scarf=True, stage=1)
+    assert scarfed is not None
+    assert scarfed.speeds == (472, 675)
+
+
+def test_outspeed_probability_bisects_spread_weights() -> None:
+    index = SpeedTierIndex(_snapshot())
+
+    between = index.outspeed_probability("Great Tusk", 250, scarf=False)
+    assert between is not None
+    assert abs(between.faster - 0.4) < 1e-9
+    assert abs(between.slower - 0.6) < 1e-9
+
+    tied = index.outspeed_probability("Great Tusk", 300, scarf=False)
+    assert tied is not None
+    assert abs(tied.tie - 0.6) < 1e-9
+
+
+def test_outspeed_probability_mixes_scarf_share_by_default() -> None:
+    index = SpeedTierIndex(_snapshot())
+
+    mixed = index.outspeed_probability("Great Tusk", 350)
+    assert mixed is not None
+    # Outspeeds every non-Scarf spread but only the bulky Scarf spread (315).
+    assert abs(mixed.faster - (0.75 * 1.0 + 0.25 * 0.4)) < 1e-9
+    assert index.outspeed_probability("Pikachu", 350) is None
+
+
+
+def test_speed_tiers_decode_only_the_species_asked_for(tmp_path: Path) -> None:
+    json_path = snapshot_path_for_query(
+        base_dir=default_meta_base_dir(),
+        format_id="gen9ou",
+        rating_bucket="1695",
+        month_window=3,
+    )
+    path = tmp_path / "rolling_3m.bin"
+    write_binary_snapshot(json.loads(json_path.read_text(encoding="utf-8")), path)
+
+    reader = BinarySnapshotReader(path)
+    try:
+        index = SpeedTierIndex(reader.to_snapshot())
+        assert reader.decoded_priors() == []
+
+        assert index.tiers("great tusk", scarf=True, stage=2) is not None
+        assert index.outspeed_probability("Great Tusk", 300) is not None
+        assert [prior.species for prior in reader.decoded_priors()] == ["Great Tusk"]
+    finally:
+        reader.close()
+
+
+def _pokemon(species: str, spe: float) -> PokemonState:
+    return PokemonState(species=species, types=["Normal"], hp=100, current_hp=100, spe=spe, level=100)
+
+
+def test_turn_order_follows_the_speed_tier_majority() -> None:
+    attacker = _pokemon("Dragonite", 80)
+    defender = _pokemon("Great Tusk", 87)
+
+    order, _ = turn_order_context(attacker, defender, move=None)
+    assert order == "attacker_second"
+
+    order, notes = turn_order_context(
+        attacker, defender, move=None, outspeed=OutspeedEstimate(faster=0.7, tie=0.0, slower=0.3)
+    )
+    assert order == "attacker_first"
+    assert any("outspeeds 70%" in note for note in notes)
+
+    order, _ = turn_order_context(
+        attacker, defender, move=None, outspeed=OutspeedEstimate(faster=0.4, tie=0.2, slower=0.4)
+    )
+    assert order == "speed_tie"
+
+
+def test_switch_score_scales_speed_credit_by_outspeed_fraction() -> None:
+    target = _pokemon("Dragonite", 80)
+    opposing = _pokemon("Great Tusk", 87)
+
+    slower, _ = score_switch(target, opposing, SideConditions())
+    mostly_faster, notes = score_switch(
+        target, opposing, SideConditions(), outspeed=OutspeedEstimate(faster=0.75, tie=0.0, slower=0.25)
+    )
+
+    assert abs((mostly_faster - slower) - 3.0) < 1e-9
+    assert any("outspeeds 75%" in note for note in notes)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from app.engine.stat_engine import (
+    MAX_IVS,
+    ZERO_EVS,
+    derive_stats,
+    derive_stats_batch,
+    spread_tuple,
+)
+from app.providers.data_registry import DataRegistry, pinned_registry
+
+
+def test_derive_stats_matches_level_100_formula_for_jolly_great_tusk() -> None:
+    stats = derive_stats(
+        "Great Tusk",
+        "Jolly",
+        spread_tuple({"atk": 252, "def": 4, "spe": 252}, 0),
+    )
+    assert stats is not None
+    assert stats.hp == 371
+    assert stats.atk == 361
+    assert stats.spa == 127
+    assert stats.spe == 300
+
+
+def test_derive_stats_applies_boost_stages() -> None:
+    neutral = derive_stats("Great Tusk", None)
+    boosted = derive_stats("Great Tusk", None, boosts=(0, 0, 0, 0, 1))
+    assert neutral is not None and boosted is not None
+    assert boosted.spe == neutral.spe * 1.5
+    assert boosted.atk == neutral.atk
+
+
+def test_derive_stats_batch_matches_single_spread_path() -> None:
+    spreads = [
+        ("Jolly", spread_tuple({"atk": 252, "spe": 252}, 0), MAX_IVS),
+        ("Impish", spread_tuple({"hp": 252, "def": 252}, 0), MAX_IVS),
+        (None, ZERO_EVS, spread_tuple({"spe": 0}, 31)),
+    ]
+    batch = derive_stats_batch("Great Tusk", spreads)
+    assert batch == [
+        derive_stats("Great Tusk", nature, evs, ivs=ivs)
+        for nature, evs, ivs in spreads
+    ]
+
+
+def test_unknown_species_has_no_derived_stats() -> None:
+    assert derive_stats("not-a-real-mon", "Jolly") is None
+    assert derive_stats_batch("not-a-real-mon", [("Jolly", ZERO_EVS, MAX_IVS)]) is None
+
+
+def test_derived_stats_memo_is_bounded_per_registry() -> None:
+    registry = DataRegistry()
+    with pinned_registry(registry):
+        for ev in range(0, 9000):
+            derive_stats("Great Tusk", "Jolly", (0, ev % 256, 0, 0, 0, ev // 256))
+
+        memo = registry.memo("derived_stats", maxsize=8192)
+        assert len(memo) == 8192
+        assert derive_stats("Great Tusk", "Jolly", (0, 0, 0, 0, 0, 0)) == derive_stats("Great Tusk", "Jolly")
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from fastapi import Response
+
+import app.routes.health_routes as health_routes
+from app.providers.data_registry import CANONICAL_FILES, DataRegistry
+from app.services.warmup import Readiness, warm_registry
+
+
+def test_warm_registry_times_every_data_source() -> None:
+    registry = DataRegistry()
+    report = warm_registry(registry)
+
+    assert report.data_version == registry.version
+    for filename in CANONICAL_FILES:
+        assert f"canonical:{filename}" in report.timings
+    for step in ("type_chart", "pokemon_indexes", "move_indexes", "meta_snapshot", "speed_tiers", "synthetic_evaluation"):
+        assert report.timings[step] >= 0
+    assert report.total_seconds == sum(report.timings.values())
+
+
+def test_health_reports_warming_until_ready(monkeypatch) -> None:
+    readiness = Readiness()
+    monkeypatch.setattr(health_routes, "get_readiness", lambda: readiness)
+
+    response = Response()
+    assert health_routes.health(response)["status"] == "warming"
+    assert response.status_code == 503
+
+    readiness.start().join()
+
+    response = Response()
+    body = health_routes.health(response)
+    assert body["status"] == "ok"
+    assert body["warmupMs"] is not None
+    assert response.status_code == 200
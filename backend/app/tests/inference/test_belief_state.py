@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import math
+
+from app.inference.belief_state import BeliefState, BranchEvidence
+from app.inference.models import CandidateSet, InferenceResult
+
+
+def _candidate(label: str, moves: list[str], item: str | None, *, eliminated: bool = False) -> CandidateSet:
+    return CandidateSet(
+        species="Great Tusk",
+        label=label,
+        moves=moves,
+        item=item,
+        prior_weight=0.5,
+        final_weight=0.5,
+        elimination_reasons=["contradiction"] if eliminated else [],
+    )
+
+
+def test_belief_state_applies_evidence_in_place_and_explains_on_materialize() -> None:
+    candidates = [
+        _candidate("scarf", ["Headlong Rush", "Knock Off"], "Choice Scarf"),
+        _candidate("boots", ["Rapid Spin", "Knock Off"], "Heavy-Duty Boots"),
+        _candidate("unknown", ["Rapid Spin"], None),
+        _candidate("dead", ["Rapid Spin"], "Leftovers", eliminated=True),
+    ]
+    belief = BeliefState.from_inference(InferenceResult(species="Great Tusk", candidates=candidates))
+
+    belief.apply_revealed_move("Rapid Spin")
+    belief.apply_item_evidence("Heavy-Duty Boots")
+
+    assert candidates[0].moves == ["Headlong Rush", "Knock Off"]
+    assert abs(sum(belief.weights) - 1.0) < 1e-9
+    assert belief.weights[3] == 0.0
+    assert max(range(len(belief)), key=belief.weights.__getitem__) == 1
+
+    scarf, boots, unknown, _ = belief.candidates()
+    assert scarf.moves == ["Headlong Rush", "Knock Off", "Rapid Spin"]
+    assert scarf.assumed_moves == ["Headlong Rush", "Knock Off"]
+    assert scarf.penalties == ["Observed item Heavy-Duty Boots conflicts with assumed item Choice Scarf."]
+    assert boots.penalties == []
+    assert unknown.item == "Heavy-Duty Boots"
+    assert unknown.notes == ["Revealed move evidence applied: Rapid Spin.", "Item evidence applied: Heavy-Duty Boots."]
+
+
+def test_branch_weight_matrix_matches_applying_each_branch_separately() -> None:
+    candidates = [
+        _candidate("scarf", ["Headlong Rush", "Knock Off"], "Choice Scarf"),
+        _candidate("boots", ["Rapid Spin", "Knock Off"], "Heavy-Duty Boots"),
+        _candidate("unknown", ["Rapid Spin"], None),
+    ]
+    baseline = BeliefState.from_inference(InferenceResult(species="Great Tusk", candidates=candidates))
+    branches = [
+        BranchEvidence(revealed_move="Rapid Spin"),
+        BranchEvidence(revealed_move="Headlong Rush", item="Choice Scarf"),
+        BranchEvidence(),
+    ]
+
+    matrix = baseline.branch_weight_matrix(branches)
+    updated = baseline.branches(branches)
+
+    for branch, row, belief in zip(branches, matrix, updated):
+        sequential = BeliefState.from_inference(InferenceResult(species="Great Tusk", candidates=candidates))
+        for kind, name in branch.steps():
+            {"move": sequential.apply_revealed_move, "item": sequential.apply_item_evidence}[kind](name)
+        assert list(row) == list(sequential.weights) == list(belief.weights)
+        assert [c.moves for c in belief.candidates()] == [c.moves for c in sequential.candidates()]
+
+    assert list(baseline.weights) == [0.5, 0.5, 0.5]
+
+
+def test_log_space_weights_survive_products_below_float_range() -> None:
+    candidates = [
+        CandidateSet(species="Great Tusk", label="a", final_weight=0.0, log_weight=-2000.0),
+        CandidateSet(species="Great Tusk", label="b", final_weight=0.0, log_weight=-2000.0 + math.log(3.0)),
+    ]
+    inference = InferenceResult(species="Great Tusk", candidates=candidates)
+
+    weights = inference.normalized_weights()
+    assert abs(weights["a"] - 0.25) < 1e-12 and abs(weights["b"] - 0.75) < 1e-12
+
+    belief = BeliefState.from_inference(inference)
+    for _ in range(2000):
+        belief.apply_item_evidence("Leftovers")
+    assert abs(sum(belief.weights) - 1.0) < 1e-9
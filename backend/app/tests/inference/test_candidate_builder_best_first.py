@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from itertools import combinations
+
+from app.inference.candidate_builder import CandidateBuildInput, CandidateBuilder
+from app.inference.models import CandidateBuilderConfig
+from app.inference.set_inference import DEFAULT_META_QUERY
+from app.providers.meta_provider import MetaProvider
+
+
+def _signature(candidates) -> list[tuple]:
+    return [
+        (candidate.label, candidate.nature, candidate.final_weight, tuple(candidate.notes))
+        for candidate in candidates
+    ]
+
+
+def _inputs() -> list[CandidateBuildInput]:
+    snapshot = MetaProvider().get_snapshot(DEFAULT_META_QUERY)
+    inputs: list[CandidateBuildInput] = []
+    for species, prior in snapshot.species_priors.items():
+        moves = [move.value for move in prior.moves]
+        inputs.append(CandidateBuildInput(species=species, prior=prior))
+        inputs.append(CandidateBuildInput(species=species, prior=prior, revealed_moves=moves[2:4]))
+        inputs.append(
+            CandidateBuildInput(
+                species=species,
+                prior=prior,
+                revealed_moves=["Trick", "Tera Blast"],
+                confirmed_item="Choice Scarf",
+            )
+        )
+    return inputs
+
+
+def test_best_first_build_matches_exhaustive_enumeration() -> None:
+    for config in (
+        CandidateBuilderConfig(),
+        CandidateBuilderConfig(max_candidates=3),
+        CandidateBuilderConfig(max_candidates=40, min_weight_threshold=0.0),
+    ):
+        builder = CandidateBuilder(config)
+        for build_input in _inputs():
+            assert _signature(builder.build(build_input)) == _signature(builder.build_exhaustive(build_input)), (
+                build_input.species,
+                build_input.revealed_moves,
+            )
+
+
+def test_best_first_build_materializes_only_the_selected_candidates(monkeypatch) -> None:
+    builder = CandidateBuilder(CandidateBuilderConfig(max_candidates=3))
+    build_input = _inputs()[0]
+    materialize = builder._materialize
+    calls: list[tuple[int, ...]] = []
+
+    def counting_materialize(space, combo):
+        calls.append(combo)
+        return materialize(space, combo)
+
+    monkeypatch.setattr(builder, "_materialize", counting_materialize)
+    candidates = builder.build(build_input)
+
+    assert 0 < len(candidates) <= 3
+    assert len(calls) == len(candidates)
+
+
+def test_association_indexes_are_built_once_per_prior() -> None:
+    associations = MetaProvider().get_snapshot(DEFAULT_META_QUERY).species_priors["Great Tusk"].associations
+    pair = associations.move_move[0]
+
+    assert associations.move_move_index is associations.move_move_index
+    assert associations.move_move_index[(pair.left, pair.right)] >= pair.weight
+    assert associations.move_move_index[(pair.right, pair.left)] >= pair.weight
+
+
+def test_move_variants_match_full_ranking_with_move_move_associations() -> None:
+    builder = CandidateBuilder(CandidateBuilderConfig(top_moves=20))
+    snapshot = MetaProvider().get_snapshot(DEFAULT_META_QUERY)
+
+    for prior in snapshot.species_priors.values():
+        move_move_index = prior.associations.move_move_index
+        for revealed in ([], [move.value for move in prior.moves[:1]], [move.value for move in prior.moves[1:3]]):
+            move_values = builder._top_move_values(prior, revealed)
+            pool = [name for name, _ in move_values if name not in revealed]
+
+            ranked = []
+            for combo in combinations(range(len(pool)), 4 - len(revealed)):
+                moves = tuple(revealed) + tuple(pool[index] for index in combo)
+                weight = builder._moves_weight(move_values, list(moves))
+                score = weight * builder._move_move_multiplier(move_move_index, list(moves))
+                ranked.append((-score, combo, moves, weight))
+            ranked.sort(key=lambda entry: entry[:2])
+
+            variants = builder._generate_move_variants(
+                move_values=move_values,
+                revealed_moves=revealed,
+                max_moves=4,
+                max_variants=4,
+                move_move_index=move_move_index,
+            )
+            assert [(variant.moves, variant.weight) for variant in variants] == [
+                (moves, weight) for _, _, moves, weight in ranked[:4]
+            ]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from app.domain.battle_state import PokemonState
+from app.domain.move_tags import is_setup_move
+from app.domain.symbols import ABILITIES, ITEMS, MOVES
+from app.inference.candidate_builder import CandidateBuilder
+from app.inference.consistency_checks import (
+    CompiledChecks,
+    check_constraint,
+    check_revealed_moves,
+    combine_check_results,
+)
+from app.inference.models import CandidateConstraint, CandidateSet, InferenceDelta
+from app.inference.set_inference import infer_pokemon_state, update_inference
+from app.providers.meta_provider import MetaProvider
+
+
+def _candidate(moves: list[str], item: str | None = "Leftovers", ability: str | None = "Protosynthesis") -> CandidateSet:
+    return CandidateSet(species="Great Tusk", label="test", moves=moves, item=item, ability=ability)
+
+
+def test_compiled_checks_match_individual_checks() -> None:
+    revealed = ["Rapid Spin", "headlong rush", "Knock Off", "  "]
+    constraints = [
+        CandidateConstraint(kind="confirmed", field_name="item", expected_value="Leftovers", source="test", hard=True),
+        CandidateConstraint(kind="soft", field_name="ability", expected_value="Protosynthesis", source="test"),
+        CandidateConstraint(kind="soft", field_name="nature", expected_value="Jolly", source="test"),
+    ]
+    checks = CompiledChecks(revealed, constraints)
+
+    candidates = [
+        _candidate(["Headlong Rush", "Rapid Spin", "Knock Off", "Ice Spinner"]),
+        _candidate(["Headlong Rush", "Close Combat", "Stealth Rock", "Ice Spinner"]),
+        _candidate(["Bulk Up", "Close Combat", "Stealth Rock", "Ice Spinner"], item="Booster Energy"),
+        _candidate(["Rapid Spin", "Close Combat"], item=None, ability=None),
+    ]
+    for candidate in candidates:
+        expected = combine_check_results(
+            [check_revealed_moves(candidate, revealed)]
+            + [check_constraint(candidate, constraint) for constraint in constraints]
+        )
+        assert checks.check(candidate) == expected
+        assert checks.check(candidate, checks.move_bits.mask(candidate.moves)) == expected
+
+
+def test_contradiction_penalty_uses_move_family_masks() -> None:
+    builder = CandidateBuilder()
+
+    penalty, notes = builder._compute_contradiction_penalty(
+        moves=["Swords Dance", "Trick", "Healing Wish", "Close Combat"],
+        item="Choice Specs",
+    )
+    assert penalty == 0.30 * 0.20
+    assert notes == [
+        "Contradiction penalty: Choice Specs conflicts with locking into utility/setup moves ['Swords Dance'].",
+        "Contradiction penalty: Choice Specs conflicts with physical setup moves ['Swords Dance'].",
+    ]
+
+    assert builder._compute_contradiction_penalty(moves=["Close Combat", "Knock Off"], item="Assault Vest") == (1.0, [])
+
+
+def test_unknown_names_get_build_local_bits() -> None:
+    checks = CompiledChecks(["Made Up Move", "Other Fake"], [])
+
+    result = checks.check(_candidate(["made up move", "Close Combat"]))
+    assert result.multiplier == 0.60
+    assert result.reasons[-1] == "Missing revealed moves: other fake."
+
+
+def test_request_names_are_not_interned_into_symbol_tables() -> None:
+    sizes = (len(MOVES), len(ITEMS), len(ABILITIES))
+
+    for index in range(50):
+        result = infer_pokemon_state(
+            PokemonState(species="Great Tusk", types=["Ground", "Fighting"], revealed_moves=[f"Fake Move {index}"]),
+            meta_provider=MetaProvider(),
+            use_cache=False,
+        )
+        update_inference(
+            result,
+            InferenceDelta(item=f"Fake Item {index}", ability=f"Fake Ability {index}"),
+            meta_provider=MetaProvider(),
+        )
+        CompiledChecks(
+            [f"Fake Move {index}"],
+            [CandidateConstraint(kind="soft", field_name="item", expected_value=f"Fake Item {index}", source="test")],
+        ).check(_candidate(["Rapid Spin"]))
+
+    assert (len(MOVES), len(ITEMS), len(ABILITIES)) == sizes
+
+
+def test_spelling_variants_do_not_grow_the_symbol_tables() -> None:
+    is_setup_move("Swords Dance")
+    sizes = (len(MOVES), len(MOVES._ids), len(MOVES._raw_ids))
+
+    for index in range(5000):
+        variant = "swords" + " " * (index % 7 + 1) + "DANCE" + " " * (index // 7)
+        assert is_setup_move(variant)
+
+    assert (len(MOVES), len(MOVES._ids), len(MOVES._raw_ids)) == sizes
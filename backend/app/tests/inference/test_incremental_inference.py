@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from app.domain.battle_state import PokemonState
+from app.inference.models import InferenceDelta
+from app.inference.set_inference import infer_pokemon_state, update_inference
+from app.providers.meta_provider import MetaProvider
+
+
+def _great_tusk():
+    return infer_pokemon_state(PokemonState(species="Great Tusk", types=["Ground", "Fighting"]), meta_provider=MetaProvider())
+
+
+def test_covered_move_is_applied_to_the_existing_pool() -> None:
+    previous = _great_tusk()
+    move = previous.candidates[-1].moves[0]
+
+    updated = update_inference(previous, InferenceDelta(revealed_move=move), meta_provider=MetaProvider())
+
+    assert updated.evidence.revealed_moves == (move,)
+    assert "Incremental update" in updated.notes[-1]
+    assert [c.label for c in updated.candidates] == [c.label for c in previous.candidates]
+    assert abs(sum(c.final_weight for c in updated.candidates) - 1.0) < 1e-9
+    assert update_inference(updated, InferenceDelta(revealed_move=move), meta_provider=MetaProvider()) is updated
+
+
+def test_uncovered_evidence_rebuilds_from_priors() -> None:
+    previous = _great_tusk()
+    assert all(candidate.item != "Choice Band" for candidate in previous.candidates)
+
+    updated = update_inference(previous, InferenceDelta(item="Choice Band"), meta_provider=MetaProvider())
+
+    assert updated.evidence.item == "Choice Band"
+    assert "re-inferred" in updated.notes[-1]
+    viable = [candidate for candidate in updated.candidates if not candidate.is_eliminated]
+    assert viable and all(candidate.item == "Choice Band" for candidate in viable)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from app.domain.battle_state import PokemonState
+from app.inference.inference_cache import get_inference_cache
+from app.inference.set_inference import infer_pokemon_state
+from app.providers.data_registry import DataRegistry, pinned_registry
+from app.providers.meta_provider import MetaProvider
+
+
+def _signature(result) -> list[tuple]:
+    return [(candidate.label, candidate.final_weight, tuple(candidate.moves)) for candidate in result.candidates]
+
+
+def test_cached_inference_matches_uncached_and_is_copy_safe() -> None:
+    with pinned_registry(DataRegistry()):
+        cache = get_inference_cache()
+        pokemon = PokemonState(species="Great Tusk", types=["Ground", "Fighting"], revealed_moves=["Rapid Spin"])
+
+        first = infer_pokemon_state(pokemon, meta_provider=MetaProvider())
+        first.candidates[0].moves.append("Splash")
+        second = infer_pokemon_state(pokemon, meta_provider=MetaProvider())
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert "Splash" not in second.candidates[0].moves
+        assert _signature(second) == _signature(
+            infer_pokemon_state(pokemon, meta_provider=MetaProvider(), use_cache=False)
+        )
+
+        infer_pokemon_state(
+            PokemonState(species="Great Tusk", types=["Ground", "Fighting"], revealed_moves=["Knock Off"]),
+            meta_provider=MetaProvider(),
+        )
+        assert cache.misses == 2
+
+    with pinned_registry(DataRegistry()):
+        assert len(get_inference_cache()) == 0
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from app.adapters.manual_input_adapter import to_domain_battle_state
+from app.inference.inference_cache import get_inference_cache
+from app.inference.set_inference import infer_opposing_team, infer_pokemon_state
+from app.providers.data_registry import DataRegistry, pinned_registry
+from app.providers.meta_provider import MetaProvider
+from app.schemas.battle_state import BattleStateRequest
+from app.services.warmup import SYNTHETIC_POSITION
+
+
+def test_team_inference_covers_bench_and_runs_in_the_pinned_registry() -> None:
+    state = to_domain_battle_state(BattleStateRequest.model_validate(SYNTHETIC_POSITION))
+
+    with pinned_registry(DataRegistry()):
+        team = infer_opposing_team(state, meta_provider=MetaProvider())
+
+        assert list(team) == ["Great Tusk", "Kingambit"]
+        assert len(get_inference_cache()) == 2
+
+        bench = state.opponent_side.bench[0]
+        single = infer_pokemon_state(bench, meta_provider=MetaProvider(), use_cache=False)
+        assert [c.label for c in team["Kingambit"].candidates] == [c.label for c in single.candidates]
+        assert team["Kingambit"].confidence_label == "provider-backed"
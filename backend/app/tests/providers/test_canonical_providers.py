@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from app.domain.move_tags import is_choice_item, is_pivot_move, is_setup_move
+from app.domain.symbols import MOVES
 from app.providers.ability_provider import get_ability_data, resolve_ability_name
+from app.providers.canonical_loader import load_moves_data
 from app.providers.format_provider import get_format_data
 from app.providers.item_provider import get_item_data, resolve_item_name
 from app.providers.move_provider import (
     build_move_action_from_name,
+    get_move_action_table,
     get_move_data,
+    get_move_data_by_id,
+    get_move_id,
     resolve_move_name,
 )
 from app.providers.nature_provider import get_nature_data, resolve_nature_name
@@ -114,4 +120,34 @@ def test_unknown_item_ability_nature_return_none() -> None:
     assert get_ability_data("not-a-real-ability") is None
 
     assert resolve_nature_name("not-a-real-nature") is None
-    assert get_nature_data("not-a-real-nature") is None
\ No newline at end of file
+    assert get_nature_data("not-a-real-nature") is None
+
+
+def test_symbol_ids_are_dense_and_shared_across_spellings() -> None:
+    move_id = get_move_id("make it rain")
+    assert move_id is not None
+    assert get_move_id("Make-It-Rain") == move_id
+    assert 0 <= move_id < len(MOVES)
+    assert get_move_data_by_id(move_id)["name"] == "Make It Rain"
+    assert get_move_id("not a real move") is None
+
+
+def test_move_tags_match_names_through_symbol_ids() -> None:
+    assert is_setup_move("Swords Dance")
+    assert is_setup_move(" swords-dance ")
+    assert is_pivot_move("U-turn")
+    assert is_choice_item("choice scarf")
+    assert not is_setup_move("Earthquake")
+    assert not is_choice_item(None)
+
+
+def test_move_action_table_shares_one_action_per_move() -> None:
+    table = get_move_action_table()
+
+    canonical = table.get("U-turn")
+    assert canonical is not None
+    assert canonical.move_name == "U-turn"
+    assert table.get("u turn") is canonical
+    assert build_move_action_from_name("U_TURN") is canonical
+    assert table.get("not-a-real-move") is None
+    assert len(table) == len(load_moves_data())
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+from fastapi import HTTPException, Request, Response
+
+from app.providers.data_registry import get_registry
+from app.routes.data_routes import get_data_bundle, get_move, get_pokemon, get_speed_tiers
+from app.services.http_cache import accepts_encoding
+from app.routes.type_routes import get_types
+
+
+def _request(path: str, **headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": b"",
+            "headers": [(key.replace("_", "-").encode(), value.encode()) for key, value in headers.items()],
+        }
+    )
+
+
+def test_static_data_carries_version_etag_and_answers_304() -> None:
+    response = Response()
+    body = get_move("earthquake", _request("/moves/earthquake"), response)
+
+    etag = response.headers["etag"]
+    assert body["name"] == "Earthquake"
+    assert etag == f'"{get_registry().version}"'
+    assert "max-age" in response.headers["cache-control"]
+
+    cached = get_move("earthquake", _request("/moves/earthquake", if_none_match=etag), Response())
+    assert cached.status_code == 304
+    assert cached.body == b""
+
+    stale = get_types(_request("/types", if_none_match='"older-version"'), Response())
+    assert "Ground" in stale["types"]
+
+
+def test_data_bundle_is_gzipped_with_its_own_etag() -> None:
+    plain = get_data_bundle(_request("/data/bundle"), Response())
+    zipped = get_data_bundle(_request("/data/bundle", accept_encoding="gzip"), Response())
+
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(zipped.body) == plain.body
+    assert zipped.headers["etag"] != plain.headers["etag"]
+
+    bundle = json.loads(plain.body)
+    assert bundle["dataVersion"] == get_registry().version
+    assert any(move["name"] == "Earthquake" and move["category"] == "physical" for move in bundle["moves"])
+    assert any(pokemon["name"] == "Kingambit" for pokemon in bundle["pokemon"])
+
+    revalidated = get_data_bundle(
+        _request("/data/bundle", accept_encoding="gzip", if_none_match=zipped.headers["etag"]),
+        Response(),
+    )
+    assert revalidated.status_code == 304
+
+
+def test_unknown_names_are_404_even_with_a_matching_etag() -> None:
+    etag = f'"{get_registry().version}"'
+
+    with pytest.raises(HTTPException) as move_error:
+        get_move("not-a-real-move-xyz", _request("/moves/x", if_none_match=etag), Response())
+    with pytest.raises(HTTPException) as pokemon_error:
+        get_pokemon("not-a-real-pokemon-xyz", _request("/pokemon/x", if_none_match=etag), Response())
+
+    assert move_error.value.status_code == 404
+    assert pokemon_error.value.status_code == 404
+
+
+def test_gzip_negotiation_honours_q_values() -> None:
+    assert accepts_encoding("gzip, deflate", "gzip")
+    assert accepts_encoding("br;q=1.0, gzip;q=0.5", "gzip")
+    assert accepts_encoding("*", "gzip")
+    assert not accepts_encoding("gzip;q=0", "gzip")
+    assert not accepts_encoding("gzip; q=0.0, *;q=1", "gzip")
+    assert not accepts_encoding("*;q=0", "gzip")
+    assert not accepts_encoding("identity", "gzip")
+    assert not accepts_encoding(None, "gzip")
+
+    refused = get_data_bundle(_request("/data/bundle", accept_encoding="gzip;q=0"), Response())
+    assert "content-encoding" not in refused.headers
+    assert json.loads(refused.body)["dataVersion"] == get_registry().version
+
+
+def _speed_tiers(format_name: str, rating_bucket: str | None = None) -> dict:
+    return get_speed_tiers(
+        species="Great Tusk",
+        speed=None,
+        stage=0,
+        scarf=False,
+        generation=9,
+        format_name=format_name,
+        rating_bucket=rating_bucket,
+        month_window=None,
+    )
+
+
+def test_speed_tiers_resolve_the_requested_format() -> None:
+    tiers = _speed_tiers("gen9ou", rating_bucket="1695")
+    assert tiers["species"] == "Great Tusk"
+    assert tiers["tiers"]
+
+    with pytest.raises(HTTPException) as missing:
+        _speed_tiers("gen9uu")
+    assert missing.value.status_code == 404
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import shutil
+import threading
+from pathlib import Path
+
+from app.providers.data_registry import (
+    CANONICAL_FILES,
+    DEFAULT_CANONICAL_DIR,
+    DEFAULT_META_DIR,
+    DataRegistry,
+    compute_data_version,
+    set_registry,
+)
+from app.providers.pokemon_provider import get_pokemon_data
+
+
+def _copy_canonical(tmp_path: Path) -> Path:
+    canonical_dir = tmp_path / "canonical"
+    canonical_dir.mkdir()
+    for filename in CANONICAL_FILES:
+        shutil.copy(DEFAULT_CANONICAL_DIR / filename, canonical_dir / filename)
+    return canonical_dir
+
+
+def test_data_version_is_content_hash(tmp_path: Path) -> None:
+    canonical_dir = _copy_canonical(tmp_path)
+    meta_dir = tmp_path / "meta"
+
+    before = compute_data_version(canonical_dir, meta_dir)
+    assert before == compute_data_version(canonical_dir, meta_dir)
+
+    species_path = canonical_dir / "species.json"
+    species = json.loads(species_path.read_text(encoding="utf-8"))
+    species.pop(next(iter(species)))
+    species_path.write_text(json.dumps(species), encoding="utf-8")
+
+    assert compute_data_version(canonical_dir, meta_dir) != before
+
+
+def test_swapped_registry_isolates_providers(tmp_path: Path) -> None:
+    canonical_dir = _copy_canonical(tmp_path)
+    species_path = canonical_dir / "species.json"
+    species = json.loads(species_path.read_text(encoding="utf-8"))
+    species["Testmon"] = {**next(iter(species.values())), "name": "Testmon"}
+    species_path.write_text(json.dumps(species), encoding="utf-8")
+
+    assert get_pokemon_data("Testmon") is None
+
+    previous = set_registry(DataRegistry(canonical_dir, DEFAULT_META_DIR))
+    try:
+        assert get_pokemon_data("Testmon") is not None
+    finally:
+        set_registry(previous)
+
+    assert get_pokemon_data("Testmon") is None
+
+
+def test_derived_entries_build_once_across_threads() -> None:
+    registry = DataRegistry(version="test")
+    calls: list[int] = []
+    results: list[object] = []
+    start = threading.Barrier(8)
+
+    def factory() -> object:
+        calls.append(1)
+        return object()
+
+    def worker() -> None:
+        start.wait()
+        results.append(registry.derived("shared", factory))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
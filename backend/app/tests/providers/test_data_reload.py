@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+from app.providers.data_registry import (
+    CANONICAL_FILES,
+    DEFAULT_CANONICAL_DIR,
+    DEFAULT_META_DIR,
+    DataRegistry,
+    get_registry,
+    pinned_registry,
+    set_registry,
+)
+from app.domain.symbols import MOVES
+from app.providers.move_provider import get_moves_index
+from app.providers.pokemon_provider import get_pokemon_data
+from app.routes.admin_routes import ADMIN_TOKEN_ENV, require_admin_token, router as admin_router
+from app.services.data_reload import DataValidationError, reload_data
+
+
+@pytest.fixture
+def canonical_dir(tmp_path: Path):
+    canonical_dir = tmp_path / "canonical"
+    canonical_dir.mkdir()
+    for filename in CANONICAL_FILES:
+        shutil.copy(DEFAULT_CANONICAL_DIR / filename, canonical_dir / filename)
+
+    previous = set_registry(DataRegistry(canonical_dir, DEFAULT_META_DIR))
+    try:
+        yield canonical_dir
+    finally:
+        set_registry(previous)
+
+
+def _edit_json(path: Path, edit) -> None:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    edit(data)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_reload_swaps_version_while_pinned_requests_keep_old_data(canonical_dir: Path) -> None:
+    assert reload_data() is get_registry()
+
+    with pinned_registry() as old:
+        old.preload()
+        _edit_json(
+            canonical_dir / "species.json",
+            lambda species: species.update(Testmon={**species["Kingambit"], "name": "Testmon"}),
+        )
+        new = reload_data()
+
+        assert new.version != old.version
+        assert get_registry() is old
+        assert get_pokemon_data("Testmon") is None
+
+    assert get_registry() is new
+    assert get_pokemon_data("Testmon") is not None
+
+
+def test_invalid_data_is_rejected_and_active_version_kept(canonical_dir: Path) -> None:
+    active = get_registry()
+    _edit_json(
+        canonical_dir / "moves.json",
+        lambda moves: moves["Aqua Jet"].update(category="Weird"),
+    )
+
+    with pytest.raises(DataValidationError, match="Aqua Jet"):
+        reload_data()
+
+    assert get_registry() is active
+
+
+def test_symbol_ids_are_append_only_across_reloads(canonical_dir: Path) -> None:
+    with pinned_registry() as old:
+        get_moves_index()
+        before = {name: MOVES.lookup(name) for name in ("Aqua Jet", "Earthquake", "Swords Dance")}
+        size = len(MOVES)
+
+        _edit_json(
+            canonical_dir / "moves.json",
+            lambda moves: moves.update({"Reload Testmove": {**moves["Aqua Jet"], "name": "Reload Testmove"}}),
+        )
+        new = reload_data()
+
+    with pinned_registry(new):
+        get_moves_index()
+        assert MOVES.lookup("Reload Testmove") >= size
+
+    with pinned_registry(old):
+        assert {name: MOVES.lookup(name) for name in before} == before
+
+
+def test_admin_endpoints_require_the_configured_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert [dependency.dependency for dependency in admin_router.dependencies] == [require_admin_token]
+
+    monkeypatch.delenv(ADMIN_TOKEN_ENV, raising=False)
+    with pytest.raises(HTTPException) as disabled:
+        require_admin_token(authorization="Bearer anything")
+    assert disabled.value.status_code == 403
+
+    monkeypatch.setenv(ADMIN_TOKEN_ENV, "s3cret")
+    with pytest.raises(HTTPException) as missing:
+        require_admin_token(authorization=None)
+    assert missing.value.status_code == 401
+
+    with pytest.raises(HTTPException) as wrong:
+        require_admin_token(authorization="Bearer nope")
+    assert wrong.value.status_code == 403
+
+    assert require_admin_token(authorization="Bearer s3cret") is None
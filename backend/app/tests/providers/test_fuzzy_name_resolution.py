@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from app.adapters.manual_input_adapter import to_domain_battle_state
+from app.inference.set_inference import DEFAULT_META_QUERY
+from app.providers.data_registry import DataRegistry, get_registry, pinned_registry
+from app.providers.meta_provider import MetaProvider
+from app.providers.move_provider import fuzzy_resolve_move_name
+from app.providers.pokemon_provider import fuzzy_resolve_pokemon_name
+from app.schemas.battle_state import BattleStateRequest
+from app.services.fuzzy_names import DeletionIndex, FuzzyNameResolver, edit_distance
+
+
+def test_deletion_index_finds_every_key_within_tolerance() -> None:
+    keys = ["great tusk", "kingambit", "gholdengo", "dragapult", "dragonite", "garchomp"]
+    index = DeletionIndex(keys)
+
+    for query in ["dragonit", "dragapult", "draganite", "gholdnego", "kingambt", "garchmop"]:
+        expected = sorted(
+            (edit_distance(query, key), key) for key in keys if edit_distance(query, key) <= 2
+        )
+        assert index.search(query, 2) == expected
+
+
+def test_fuzzy_resolver_prefers_exact_then_closest_within_budget() -> None:
+    resolver = FuzzyNameResolver({"dragapult": "Dragapult", "dragonite": "Dragonite"})
+
+    assert resolver.resolve("dragapult") == "Dragapult"
+    assert resolver.resolve("Dragapul") == "Dragapult"
+    assert resolver.resolve("Dragonxte") == "Dragonite"
+    assert resolver.resolve("Drag") is None
+    assert resolver.resolve("") is None
+
+
+def test_provider_fuzzy_resolution_corrects_typos() -> None:
+    assert fuzzy_resolve_pokemon_name("Great Tsuk") == "Great Tusk"
+    assert fuzzy_resolve_pokemon_name("great tusk") == "Great Tusk"
+    assert fuzzy_resolve_move_name("Make It Rian") == "Make It Rain"
+    assert fuzzy_resolve_move_name("Totally Unknown Move") is None
+
+
+def test_manual_input_adapter_corrects_misspelled_species_and_revealed_moves() -> None:
+    payload = BattleStateRequest.model_validate(
+        {
+            "my_side": {"active": {"species": "Gholdengo", "types": ["Steel", "Ghost"]}},
+            "opponent_side": {
+                "active": {
+                    "species": "Great Tsuk",
+                    "types": ["Ground", "Fighting"],
+                    "revealedMoves": ["Headlong Rsh", "Rapid Spin"],
+                }
+            },
+            "moves": [{"name": "Make It Rain", "type": "Steel", "category": "special", "power": 120}],
+        }
+    )
+
+    state = to_domain_battle_state(payload)
+    assert state.opponent_side.active.species == "Great Tusk"
+    assert state.opponent_side.active.revealed_moves == ["Headlong Rush", "Rapid Spin"]
+    assert state.my_side.active.species == "Gholdengo"
+
+
+def test_manual_input_adapter_reads_only_meta_species_keys_of_the_requested_format() -> None:
+    payload = {
+        "my_side": {"active": {"species": "Gholdengo", "types": ["Steel", "Ghost"]}},
+        "opponent_side": {
+            "active": {"species": "Great Tsuk", "types": ["Ground", "Fighting"], "revealedMoves": ["Headlong Rsh"]}
+        },
+        "moves": [{"name": "Make It Rain", "type": "Steel", "category": "special", "power": 120}],
+    }
+
+    with pinned_registry(DataRegistry()):
+        state = to_domain_battle_state(BattleStateRequest.model_validate(payload))
+        snapshot = MetaProvider().get_snapshot(DEFAULT_META_QUERY)
+
+        assert state.opponent_side.active.species == "Great Tusk"
+        assert state.opponent_side.active.revealed_moves == ["Headlong Rush"]
+        assert snapshot.species_priors.reader.decoded_priors() == []
+
+        payload["formatContext"] = {"formatName": "gen9uu"}
+        other = to_domain_battle_state(BattleStateRequest.model_validate(payload))
+        assert other.opponent_side.active.species == "Great Tusk"
+        assert not any(isinstance(key, tuple) and "gen9uu" in key for key in get_registry()._derived)
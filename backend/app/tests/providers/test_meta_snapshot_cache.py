@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from app.domain.battle_state import FormatContext
+from app.inference.models import MetaPriorSnapshot, SpeciesPrior, WeightedValue
+from app.inference.set_inference import DEFAULT_META_QUERY, meta_query_for_format
+from app.providers.meta_binary import BinarySnapshotReader, write_binary_snapshot
+from app.providers.meta_loader import default_meta_base_dir, load_snapshot_from_disk, snapshot_path_for_query
+from app.providers.meta_snapshot_cache import MetaSnapshotCache, snapshot_nbytes
+from app.schemas.battle_state import FormatContextRequest
+
+
+def _snapshot(format_id: str, species_count: int) -> MetaPriorSnapshot:
+    return MetaPriorSnapshot(
+        format_id=format_id,
+        generation=9,
+        rating_bucket="1695",
+        month_window=["rolling-3m"],
+        species_priors={
+            f"Species {i}": SpeciesPrior(
+                species=f"Species {i}",
+                usage_weight=1.0,
+                moves=[WeightedValue(f"Move {i}-{j}", 0.5) for j in range(8)],
+            )
+            for i in range(species_count)
+        },
+    )
+
+
+def test_snapshot_cache_evicts_least_recently_used_over_budget() -> None:
+    snapshots = {name: _snapshot(name, 20) for name in ("gen9ou", "gen9uu", "gen9ubers")}
+    cache = MetaSnapshotCache(max_bytes=int(snapshot_nbytes(snapshots["gen9ou"]) * 2.5))
+
+    assert cache.get("gen9ou", lambda: snapshots["gen9ou"]) is snapshots["gen9ou"]
+    assert cache.get("gen9uu", lambda: snapshots["gen9uu"]) is snapshots["gen9uu"]
+    assert cache.get("gen9ou", lambda: None) is snapshots["gen9ou"]
+    cache.get("gen9ubers", lambda: snapshots["gen9ubers"])
+
+    assert "gen9uu" not in cache
+    assert "gen9ou" in cache and "gen9ubers" in cache
+    assert cache.evictions == 1
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    stats = {entry.key: entry for entry in cache.stats()}
+    assert stats["gen9ou"].hits == 1
+    assert stats["gen9ubers"].nbytes > 0
+
+    cache.get("gen9uu", lambda: snapshots["gen9uu"])
+    assert {entry.key: entry.loads for entry in cache.stats()}["gen9uu"] == 2
+
+
+def test_meta_query_follows_format_context() -> None:
+    assert meta_query_for_format(FormatContext()) == DEFAULT_META_QUERY
+
+    query = meta_query_for_format(
+        FormatContext(generation=8, format_name="Gen 8 UU", rating_bucket="1500", month_window=1)
+    )
+    assert (query.format_id, query.generation, query.rating_bucket, query.month_window) == (
+        "gen8uu",
+        8,
+        "1500",
+        1,
+    )
+
+
+def test_snapshot_cache_does_not_retain_misses() -> None:
+    cache = MetaSnapshotCache()
+    for bucket in range(100):
+        assert cache.get(("gen9ou", str(bucket)), lambda: None) is None
+
+    assert len(cache) == 0
+    assert cache.misses == 100
+    assert cache.stats() == []
+
+
+def test_rating_bucket_cannot_escape_the_meta_directory(tmp_path) -> None:
+    base_dir = tmp_path / "meta"
+    base_dir.mkdir()
+    outside = tmp_path / "evil"
+    outside.mkdir()
+    (outside / "rolling_3m.json").write_text(
+        json.dumps({"format_id": "gen9ou", "generation": 9, "rating_bucket": "x", "species_priors": {}}),
+        encoding="utf-8",
+    )
+
+    snapshot = load_snapshot_from_disk(
+        base_dir=base_dir,
+        format_id="gen9ou",
+        generation=9,
+        rating_bucket="../../evil",
+        month_window=3,
+    )
+    assert snapshot is None
+
+    with pytest.raises(ValidationError):
+        FormatContextRequest(ratingBucket="../../evil")
+    assert FormatContextRequest(ratingBucket="1695").ratingBucket == "1695"
+
+
+def test_evicted_binary_snapshots_close_their_reader(tmp_path) -> None:
+    json_path = snapshot_path_for_query(
+        base_dir=default_meta_base_dir(),
+        format_id="gen9ou",
+        rating_bucket="1695",
+        month_window=3,
+    )
+    payload = json.loads(json_path.read_text(encoding="utf-8"))
+    readers = {}
+    for name in ("first", "second"):
+        write_binary_snapshot(payload, tmp_path / f"{name}.bin")
+        readers[name] = BinarySnapshotReader(tmp_path / f"{name}.bin")
+
+    cache = MetaSnapshotCache(max_bytes=1)
+    first = cache.get("first", readers["first"].to_snapshot)
+    assert first.species_priors.get("Great Tusk") is not None
+    cache.get("second", readers["second"].to_snapshot)
+
+    assert "first" not in cache
+    assert readers["first"].closed and not readers["second"].closed
+
+    # A request still holding the evicted snapshot can read new species.
+    assert first.species_priors.get("Kingambit") is not None
+    readers["first"].close()
+
+    cache.close()
+    assert readers["second"].closed and len(cache) == 0
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from app.providers.meta_binary import BinarySnapshotReader, source_digest, write_binary_snapshot
+from app.providers.meta_loader import (
+    binary_snapshot_path,
+    default_meta_base_dir,
+    load_snapshot_from_disk,
+    snapshot_path_for_query,
+)
+from app.providers.meta_normalizer import snapshot_from_dict
+
+
+def _json_snapshot_path() -> Path:
+    return snapshot_path_for_query(
+        base_dir=default_meta_base_dir(),
+        format_id="gen9ou",
+        rating_bucket="1695",
+        month_window=3,
+    )
+
+
+def test_binary_snapshot_decodes_same_priors_as_json(tmp_path: Path) -> None:
+    payload = json.loads(_json_snapshot_path().read_text(encoding="utf-8"))
+    expected = snapshot_from_dict(payload)
+
+    path = tmp_path / "rolling_3m.bin"
+    write_binary_snapshot(payload, path)
+    reader = BinarySnapshotReader(path)
+    try:
+        snapshot = reader.to_snapshot()
+        assert snapshot.format_id == expected.format_id
+        assert snapshot.month_window == expected.month_window
+        assert list(snapshot.species_priors) == list(expected.species_priors)
+
+        # Only the requested species is decoded.
+        assert snapshot.species_priors.get("Great Tusk") == expected.species_priors["Great Tusk"]
+        assert set(reader._decoded) == {"Great Tusk"}
+        assert snapshot.species_priors.get("Pikachu") is None
+    finally:
+        reader.close()
+
+
+def test_loader_falls_back_to_json_without_binary(tmp_path: Path) -> None:
+    json_path = tmp_path / "gen9ou" / "1695" / "rolling_3m.json"
+    json_path.parent.mkdir(parents=True)
+    shutil.copy(_json_snapshot_path(), json_path)
+    assert not binary_snapshot_path(json_path).exists()
+
+    snapshot = load_snapshot_from_disk(
+        base_dir=tmp_path,
+        format_id="gen9ou",
+        generation=9,
+        rating_bucket="1695",
+        month_window=3,
+    )
+    assert snapshot is not None
+    assert isinstance(snapshot.species_priors, dict)
+    assert "Great Tusk" in snapshot.species_priors
+
+
+def test_loader_ignores_binary_that_no_longer_matches_its_json(tmp_path: Path) -> None:
+    json_path = tmp_path / "gen9ou" / "1695" / "rolling_3m.json"
+    json_path.parent.mkdir(parents=True)
+    shutil.copy(_json_snapshot_path(), json_path)
+    payload = json.loads(json_path.read_text(encoding="utf-8"))
+    write_binary_snapshot(payload, binary_snapshot_path(json_path), source_digest(json_path.read_bytes()))
+
+    def load():
+        return load_snapshot_from_disk(
+            base_dir=tmp_path,
+            format_id="gen9ou",
+            generation=9,
+            rating_bucket="1695",
+            month_window=3,
+        )
+
+    assert not isinstance(load().species_priors, dict)
+
+    payload["notes"] = ["Hand-edited after the binary was built."]
+    json_path.write_text(json.dumps(payload), encoding="utf-8")
+    snapshot = load()
+    assert isinstance(snapshot.species_priors, dict)
+    assert snapshot.notes == ["Hand-edited after the binary was built."]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from app.providers.move_provider import get_moves_index
+from app.providers.pokemon_provider import get_pokemon_index
+from app.providers.provider_utils import NameSearchIndex, build_name_index, search_keys
+
+
+def _queries(index: dict[str, str]) -> list[str]:
+    queries = {"a", "e", "ra", "ing", "Great", "tusk", "u-t", "  Iron  ", "zz", "x"}
+    for norm in index:
+        queries.add(norm[:1])
+        queries.add(norm[:3])
+        queries.add(norm[1:4])
+        queries.add(norm[-2:])
+    return sorted(queries)
+
+
+def test_search_index_matches_linear_scan_on_canonical_data() -> None:
+    for index in (get_pokemon_index(), get_moves_index()):
+        search_index = NameSearchIndex(index)
+        for query in _queries(index):
+            for limit in (1, 5, 10, 50):
+                assert search_index.search(query, limit=limit) == search_keys(index, query, limit=limit)
+
+
+def test_search_index_orders_starts_before_contains() -> None:
+    index = build_name_index(["Rotom-Wash", "Ogerpon", "Iron Moth", "Moltres", "Slowking-Galar"])
+    search_index = NameSearchIndex(index)
+
+    assert search_index.search("mo") == ["Moltres", "Iron Moth"]
+    assert search_index.search("o", limit=2) == ["Ogerpon", "Iron Moth"]
+    assert search_index.search("   ") == []
+    assert search_index.search("qq") == []
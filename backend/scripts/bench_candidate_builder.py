@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from app.inference.candidate_builder import CandidateBuilder, CandidateBuildInput
+from app.inference.models import CandidateBuilderConfig
+from app.inference.set_inference import DEFAULT_META_QUERY
+from app.providers.meta_provider import MetaProvider
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time CandidateBuilder.build against exhaustive enumeration over every snapshot species."
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Passes over all species; best pass is reported.")
+    parser.add_argument("--revealed", type=int, default=1, help="Top prior moves treated as revealed.")
+    parser.add_argument("--max-candidates", type=int, default=CandidateBuilderConfig().max_candidates)
+    return parser.parse_args()
+
+
+def _time_pass(build, inputs: list[CandidateBuildInput]) -> float:
+    start = time.perf_counter()
+    for build_input in inputs:
+        build(build_input)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    args = parse_args()
+    snapshot = MetaProvider().get_snapshot(DEFAULT_META_QUERY)
+    builder = CandidateBuilder(CandidateBuilderConfig(max_candidates=args.max_candidates))
+
+    inputs = [
+        CandidateBuildInput(
+            species=species,
+            prior=prior,
+            revealed_moves=[move.value for move in prior.moves[: args.revealed]],
+        )
+        for species, prior in snapshot.species_priors.items()
+    ]
+
+    mismatches = [
+        build_input.species
+        for build_input in inputs
+        if [(c.label, c.final_weight) for c in builder.build(build_input)]
+        != [(c.label, c.final_weight) for c in builder.build_exhaustive(build_input)]
+    ]
+
+    print(f"species: {len(inputs)}, revealed moves: {args.revealed}, max candidates: {args.max_candidates}")
+    for name, build in (("best-first", builder.build), ("exhaustive", builder.build_exhaustive)):
+        best = min(_time_pass(build, inputs) for _ in range(args.runs))
+        print(f"{name:>10}: {best * 1000:.1f} ms per pass ({best * 1000 / len(inputs):.2f} ms per species)")
+    print("identical results" if not mismatches else f"MISMATCHES: {', '.join(mismatches)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from app.providers.meta_binary import BinarySnapshotReader
+from app.providers.meta_loader import (
+    binary_snapshot_path,
+    default_meta_base_dir,
+    snapshot_path_for_query,
+)
+from app.providers.meta_normalizer import snapshot_from_dict
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare cold-load time and RSS of JSON vs binary meta snapshots."
+    )
+    parser.add_argument("--format-id", default="gen9ou")
+    parser.add_argument("--rating-bucket", default="1695")
+    parser.add_argument("--month-window", type=int, default=3)
+    parser.add_argument("--species", default="Great Tusk", help="Species to look up after loading.")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreter runs per format.")
+    parser.add_argument("--child", choices=["json", "binary"], help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def _max_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _run_child(args: argparse.Namespace, json_path: Path) -> None:
+    rss_before = _max_rss_kb()
+    start = time.perf_counter()
+
+    if args.child == "json":
+        snapshot = snapshot_from_dict(json.loads(json_path.read_text(encoding="utf-8")))
+        prior = snapshot.species_priors.get(args.species)
+    else:
+        snapshot = BinarySnapshotReader(binary_snapshot_path(json_path)).to_snapshot()
+        prior = snapshot.species_priors.get(args.species)
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(json.dumps({
+        "ms": elapsed_ms,
+        "rss_kb": _max_rss_kb() - rss_before,
+        "found": prior is not None,
+    }))
+
+
+def main() -> None:
+    args = parse_args()
+    json_path = snapshot_path_for_query(
+        base_dir=default_meta_base_dir(),
+        format_id=args.format_id,
+        rating_bucket=args.rating_bucket,
+        month_window=args.month_window,
+    )
+
+    if args.child:
+        _run_child(args, json_path)
+        return
+
+    if not binary_snapshot_path(json_path).exists():
+        raise SystemExit(f"No binary snapshot next to {json_path}; run scripts.build_meta_snapshot first.")
+
+    print(f"snapshot: {json_path}")
+    for fmt in ("json", "binary"):
+        results = []
+        for _ in range(args.runs):
+            output = subprocess.run(
+                [
+                    sys.executable, "-m", "scripts.bench_meta_snapshot",
+                    "--format-id", args.format_id,
+                    "--rating-bucket", args.rating_bucket,
+                    "--month-window", str(args.month_window),
+                    "--species", args.species,
+                    "--child", fmt,
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+        best_ms = min(result["ms"] for result in results)
+        rss_kb = max(result["rss_kb"] for result in results)
+        print(f"{fmt:>6}: cold load + lookup {best_ms:.2f} ms (best of {args.runs}), +{rss_kb} KB max RSS")
+
+
+if __name__ == "__main__":
+    main()
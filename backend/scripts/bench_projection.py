@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from app.domain.actions import move_spec_for
+from app.domain.battle_state import (
+    BattleState,
+    FieldState,
+    FormatContext,
+    PokemonState,
+    SideConditions,
+    SideState,
+)
+from app.engine.projection_engine import project_action_against_response
+from app.inference.models import CandidateSet, OpponentResponse, OpponentWorld
+from app.providers.move_provider import build_move_action_from_name
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Microbenchmark move-spec construction and single-response projection."
+    )
+    parser.add_argument("--number", type=int, default=20000, help="Iterations per timing run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs; the best run is reported.")
+    return parser.parse_args()
+
+
+def _state() -> BattleState:
+    my_active = PokemonState(
+        species="Dragonite",
+        types=["Dragon", "Flying"],
+        atk=134,
+        def_=95,
+        spa=100,
+        spd=100,
+        spe=80,
+        level=100,
+    )
+    opponent_active = PokemonState(
+        species="Great Tusk",
+        types=["Ground", "Fighting"],
+        atk=131,
+        def_=131,
+        spa=53,
+        spd=53,
+        spe=87,
+        level=100,
+    )
+    return BattleState(
+        my_side=SideState(active=my_active, bench=[], side_conditions=SideConditions()),
+        opponent_side=SideState(active=opponent_active, bench=[], side_conditions=SideConditions()),
+        moves=[],
+        field=FieldState(),
+        format_context=FormatContext(generation=9, format_name="gen9ou"),
+    )
+
+
+def _world() -> OpponentWorld:
+    candidate = CandidateSet(
+        species="Great Tusk",
+        label="bench-world",
+        moves=["Headlong Rush", "Ice Spinner"],
+        item="Leftovers",
+        ability="Protosynthesis",
+        final_weight=1.0,
+    )
+    return OpponentWorld(
+        species="Great Tusk",
+        candidate=candidate,
+        weight=1.0,
+        known_moves=["Headlong Rush"],
+        assumed_moves=["Ice Spinner"],
+        assumed_item="Leftovers",
+        assumed_ability="Protosynthesis",
+    )
+
+
+def _dynamic_namespace(move_action, level):
+    return type(
+        "EvalMove",
+        (),
+        {
+            "name": move_action.move_name,
+            "type": move_action.move_type,
+            "category": move_action.move_category,
+            "power": move_action.base_power,
+            "priority": move_action.priority,
+            "crit": False,
+            "level": level,
+        },
+    )()
+
+
+def _best_per_call_us(fn, *, number: int, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+def main() -> None:
+    args = parse_args()
+
+    move_action = build_move_action_from_name("Earthquake")
+    assert move_action is not None
+
+    state = _state()
+    world = _world()
+    response = OpponentResponse(
+        kind="move",
+        label="move::Headlong Rush",
+        weight=1.0,
+        move_name="Headlong Rush",
+        move_type="Ground",
+        move_category="physical",
+        base_power=120,
+    )
+
+    dynamic_us = _best_per_call_us(
+        lambda: _dynamic_namespace(move_action, 100),
+        number=args.number,
+        repeat=args.repeat,
+    )
+    interned_us = _best_per_call_us(
+        lambda: move_spec_for(move_action, 100),
+        number=args.number,
+        repeat=args.repeat,
+    )
+    projection_us = _best_per_call_us(
+        lambda: project_action_against_response(state, move_action, response, world),
+        number=max(1, args.number // 10),
+        repeat=args.repeat,
+    )
+
+    # A move-vs-move projection builds three move objects: one for turn order and
+    # one per damage application.
+    saved_per_projection_us = (dynamic_us - interned_us) * 3
+
+    print(f"type() namespace per move:   {dynamic_us:8.3f} us")
+    print(f"interned MoveSpec per move:  {interned_us:8.3f} us")
+    print(f"projection (current):        {projection_us:8.3f} us")
+    print(f"saved per projection:        {saved_per_projection_us:8.3f} us")
+
+
+if __name__ == "__main__":
+    main()
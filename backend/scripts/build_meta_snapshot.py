@@ -2,9 +2,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
 from typing import Any
 
+if __package__ in (None, ""):
+    # Support the documented `python scripts/build_meta_snapshot.py` from backend/.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.providers.meta_binary import source_digest, write_binary_snapshot
+
 
 def _ensure_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -148,6 +155,11 @@ def parse_args() -> argparse.Namespace:
         required=False,
         help="Optional explicit output path. If omitted, uses backend/app/data/meta/<format>/<rating>/rolling_3m.json",
     )
+    parser.add_argument(
+        "--no-binary",
+        action="store_true",
+        help="Skip writing the binary .bin snapshot next to the JSON output.",
+    )
     return parser.parse_args()
 
 
@@ -171,10 +183,20 @@ def main() -> None:
         )
 
     _ensure_dir(output_path)
-    output_path.write_text(json.dumps(snapshot, indent=2), encoding="utf-8")
+    json_bytes = json.dumps(snapshot, indent=2).encode("utf-8")
+    output_path.write_bytes(json_bytes)
 
     print(f"Wrote normalized snapshot to: {output_path}")
 
+    binary_path = output_path.with_suffix(".bin")
+    if not args.no_binary:
+        write_binary_snapshot(snapshot, binary_path, source_sha256=source_digest(json_bytes))
+        print(f"Wrote binary snapshot to: {binary_path}")
+    elif binary_path.exists():
+        # A binary from an earlier build no longer matches this JSON.
+        binary_path.unlink()
+        print(f"Removed stale binary snapshot: {binary_path}")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file